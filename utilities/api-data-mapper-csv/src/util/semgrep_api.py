@@ -6,7 +6,8 @@ import sys
 import csv
 from pathlib import Path
 
-BASE_URL = 'https://semgrep.dev/api/v1'
+SEMGREP_HOST = os.getenv("SEMGREP_BASE_URL", "https://semgrep.dev").rstrip("/")
+BASE_URL = f'{SEMGREP_HOST}/api/v1'
 BASE_PATH = Path(__file__).resolve().parent.parent.parent
 
 try:  
@@ -138,7 +139,7 @@ def get_findings_per_project(deployment, project):
 def get_policy():
     print("Fetching policy...")
     response = requests.post(
-        "https://semgrep.dev/api/cli/scans", 
+        f"{SEMGREP_HOST}/api/cli/scans", 
         headers=default_headers, 
         json=load_query_data(
             f"{BASE_PATH}/src/const/policy_request_payload.json"
@@ -12,13 +12,17 @@ Optional:
   --title "Custom Title"
   --project-name "My Project"
   --fail-on-empty          (exit 2 if no findings were found)
+  --stream                 (large inputs: list at most 200 findings per OWASP section)
+  --max-findings-per-section N
 """
 
 import argparse
+import io
 import json
 import sys
 from collections import defaultdict, Counter
 from datetime import datetime
+from functools import lru_cache
 import html
 from pathlib import Path
 
@@ -40,6 +44,8 @@ def get_rule_url(item):
         return src
     return None
 
+OWASP_TAG_CACHE_SIZE = 4096
+
 def extract_owasp_tags(item):
     """
     Return list of tuples (code, year, name) from metadata.owasp
@@ -52,9 +58,24 @@ def extract_owasp_tags(item):
     owasp_meta = get_meta(item, "owasp", [])
     if not owasp_meta:
         return []
+    return list(parse_owasp_tags(_tag_key(owasp_meta)))
+
+def first_owasp_2021(item):
+    """Prefer a mapping to OWASP 2021 if present; otherwise return the first mapping, else None."""
+    owasp_meta = get_meta(item, "owasp", [])
+    if not owasp_meta:
+        return None
+    return first_owasp_2021_tag(_tag_key(owasp_meta))
+
+def _tag_key(owasp_meta):
+    # Findings of the same rule carry the same tags, so the raw tags key the caches below
+    return tuple(str(t) for t in owasp_meta)
+
+@lru_cache(maxsize=OWASP_TAG_CACHE_SIZE)
+def parse_owasp_tags(raw_tags):
+    """Parsed (code, year, name) tuples for a tuple of raw metadata.owasp strings (memoized)."""
     tags = []
-    for t in owasp_meta:
-        t = str(t)
+    for t in raw_tags:
         if " - " in t:
             code_part, name = t.split(" - ", 1)
             code_part = code_part.strip()
@@ -71,16 +92,22 @@ def extract_owasp_tags(item):
                 tags.append((code.strip(), year.strip(), ""))
             else:
                 tags.append((t.strip(), "", ""))
-    return tags
+    return tuple(tags)
 
-def first_owasp_2021(item):
-    """Prefer a mapping to OWASP 2021 if present; otherwise return the first mapping, else None."""
-    tags = extract_owasp_tags(item)
+@lru_cache(maxsize=OWASP_TAG_CACHE_SIZE)
+def first_owasp_2021_tag(raw_tags):
+    tags = parse_owasp_tags(raw_tags)
     for code, year, name in tags:
         if str(year).startswith("2021"):
             return (code, year, name)
     return tags[0] if tags else None
 
+def tag_cache_hit_rate():
+    """Share of OWASP tag lookups answered from the cache, or None before any lookup."""
+    info = first_owasp_2021_tag.cache_info()
+    lookups = info.hits + info.misses
+    return info.hits / lookups if lookups else None
+
 def severity_color(sev):
     return {
         "CRITICAL": "#dc2626",
@@ -102,6 +129,119 @@ def sort_key_for_section(k):
             pass
     return (1, 99, k)
 
+# ----------------------------- Streaming input -----------------------------
+
+READ_CHUNK_CHARS = 1 << 20
+PROJECT_NAME_KEYS = ("project_name", "repository", "repo", "scan_name")
+DEFAULT_STREAM_SAMPLE = 200
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+class _JsonReader:
+    """Text buffer over a file object, read a chunk at a time as values are decoded."""
+
+    def __init__(self, fp, chunk_chars=READ_CHUNK_CHARS):
+        self.fp = fp
+        self.chunk_chars = chunk_chars
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        if self.eof:
+            return False
+        chunk = self.fp.read(self.chunk_chars)
+        if not chunk:
+            self.eof = True
+            return False
+        # Drop the consumed text so only the value being decoded is buffered
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Skip whitespace and return the next character ('' at end of input)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def take(self, expected):
+        found = self.peek()
+        if found not in expected:
+            raise ValueError(f"Malformed JSON: expected {' or '.join(map(repr, expected))}, found {found!r}")
+        self.pos += 1
+        return found
+
+    def value(self):
+        """Decode the next complete JSON value, reading more input as needed."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self.buf) and not self.eof:
+                self.fill()
+                continue
+            self.pos = end
+            return value
+
+# Yielded by iter_semgrep_results when the findings so far must be discarded
+RESTART = object()
+
+def _iter_array(reader):
+    reader.take("[")
+    if reader.peek() == "]":
+        reader.take("]")
+        return
+    while True:
+        yield reader.value()
+        if reader.take(",]") == "]":
+            return
+
+def iter_semgrep_results(fp, members):
+    """
+    Yield the findings of a Semgrep JSON report one at a time, without loading
+    the document, choosing the array load_semgrep_results would: the top-level
+    "results" array, else the "findings" array. A "findings" array is streamed as
+    it is reached; if a "results" array follows it, RESTART is yielded and the
+    results are streamed instead, so callers discard what they have counted. The
+    top-level members used for the project name are stored in `members`;
+    everything else is decoded and dropped.
+    """
+    reader = _JsonReader(fp)
+    reader.take("{")
+    if reader.peek() == "}":
+        return
+    source = None
+    while True:
+        key = reader.value()
+        reader.take(":")
+        if key in ("results", "findings") and reader.peek() == "[":
+            if source == "results" or (key == "findings" and source == "findings"):
+                # Not the array that is reported; skipped one finding at a time
+                for _ in _iter_array(reader):
+                    pass
+            else:
+                if source == "findings":
+                    yield RESTART
+                source = key
+                yield from _iter_array(reader)
+        else:
+            value = reader.value()
+            if key in PROJECT_NAME_KEYS:
+                members[key] = value
+        if reader.take(",}") == "}":
+            return
+
 # ----------------------------- Core -----------------------------
 
 def load_semgrep_results(json_data):
@@ -125,24 +265,62 @@ def load_semgrep_results(json_data):
     )
     return results, project_name
 
-def build_html(results, project_name, title=None):
-    by_owasp = defaultdict(list)
-    severity_counts = Counter()
-    total_findings = 0
+def finding_row(item):
+    """The fields of a finding shown in the report (so the rest of it can be dropped)."""
+    return {
+        "sev": (item.get("extra", {}).get("severity") or item.get("severity") or "INFO").upper(),
+        "rule": item.get("check_id", ""),
+        "rule_url": get_rule_url(item),
+        "path": item.get("path", ""),
+        "start_line": item.get("start", {}).get("line", "?"),
+        "start_col": item.get("start", {}).get("col", "?"),
+        "message": item.get("extra", {}).get("message", ""),
+        "owasp": get_meta(item, "owasp", []) or [],
+        "cwe": get_meta(item, "cwe", []) or [],
+    }
+
+class OwaspSections:
+    """
+    Findings grouped by OWASP section, built one finding at a time. Every finding
+    is counted; with `sample_size` only the first that many per section are kept
+    for the detail tables.
+    """
 
-    for r in results:
-        sev = r.get("extra", {}).get("severity") or r.get("severity") or "INFO"
-        severity_counts[sev.upper()] += 1
-        total_findings += 1
-        owasp_tag = first_owasp_2021(r)
+    def __init__(self, sample_size=None):
+        self.sample_size = sample_size
+        self.severity_counts = Counter()
+        self.total_findings = 0
+        self.counts = Counter()
+        self.rows = defaultdict(list)
+
+    def add(self, item):
+        sev = item.get("extra", {}).get("severity") or item.get("severity") or "INFO"
+        self.severity_counts[sev.upper()] += 1
+        self.total_findings += 1
+        owasp_tag = first_owasp_2021(item)
         if owasp_tag:
             code, year, name = owasp_tag
             key = f"{code} {name} ({year})" if name else f"{code} ({year})"
         else:
             key = "Unmapped to OWASP Top 10"
-        by_owasp[key].append(r)
+        self.counts[key] += 1
+        rows = self.rows[key]
+        if self.sample_size is None or len(rows) < self.sample_size:
+            rows.append(finding_row(item))
+
+def build_html(results, project_name, title=None):
+    out = io.StringIO()
+    sections = OwaspSections()
+    for r in results:
+        sections.add(r)
+    write_html(out, sections, project_name, title=title)
+    return out.getvalue()
 
-    sorted_sections = sorted(by_owasp.keys(), key=sort_key_for_section)
+def write_html(out, sections, project_name, title=None):
+    """Write the report for `sections` (an OwaspSections) to the text file `out`, a section at a time."""
+    severity_counts = sections.severity_counts
+    total_findings = sections.total_findings
+    sorted_sections = sorted(sections.counts.keys(), key=sort_key_for_section)
 
     now = datetime.now().strftime("%Y-%m-%d %H:%M")
     page_title = title or "OWASP Top 10 Security Report (from Semgrep)"
@@ -241,7 +419,7 @@ def build_html(results, project_name, title=None):
 
     # list per OWASP section with counts
     for sec in sorted(sorted_sections, key=lambda s: sort_key_for_section(s)):
-        summary_card_top += f'<li style="display:flex;justify-content:space-between;border-bottom:1px dashed var(--border);padding:6px 0;"><span>{escape(sec)}</span><span class="count-pill">{len(by_owasp[sec])}</span></li>'
+        summary_card_top += f'<li style="display:flex;justify-content:space-between;border-bottom:1px dashed var(--border);padding:6px 0;"><span>{escape(sec)}</span><span class="count-pill">{sections.counts[sec]}</span></li>'
 
     summary_card_top += """
           </ul>
@@ -250,14 +428,16 @@ def build_html(results, project_name, title=None):
     </div>
     """
 
+    out.write(head_html)
+    out.write(summary_card_top)
+
     # ----- Detailed sections -----
-    sections_html = ""
     for section in sorted_sections:
         section_html = f"""
     <div class="card" style="margin-top:16px;">
       <div class="owasp-header">
         <h2 style="margin:0;">{escape(section)}</h2>
-        <span class="count-pill">{len(by_owasp[section])} finding(s)</span>
+        <span class="count-pill">{sections.counts[section]} finding(s)</span>
       </div>
       <table class="table">
         <thead>
@@ -271,17 +451,17 @@ def build_html(results, project_name, title=None):
         </thead>
         <tbody>
         """
-        for item in by_owasp[section]:
-            sev = (item.get("extra", {}).get("severity") or item.get("severity") or "INFO").upper()
+        for row in sections.rows[section]:
+            sev = row["sev"]
             color = severity_color(sev)
-            rule = escape(item.get("check_id", ""))
-            rule_url = get_rule_url(item)
-            path = escape(item.get("path", ""))
-            start_line = escape(item.get("start", {}).get("line", "?"))
-            start_col = escape(item.get("start", {}).get("col", "?"))
-            message = escape(item.get("extra", {}).get("message", ""))
-            owasp_list = get_meta(item, "owasp", []) or []
-            cwe_list = get_meta(item, "cwe", []) or []
+            rule = escape(row["rule"])
+            rule_url = row["rule_url"]
+            path = escape(row["path"])
+            start_line = escape(row["start_line"])
+            start_col = escape(row["start_col"])
+            message = escape(row["message"])
+            owasp_list = row["owasp"]
+            cwe_list = row["cwe"]
             owasp_html = ", ".join(escape(x) for x in owasp_list) if owasp_list else '<span class="subtle">—</span>'
             cwe_html = ", ".join(escape(x) for x in cwe_list)
 
@@ -306,12 +486,21 @@ def build_html(results, project_name, title=None):
             </td>
           </tr>
             """
-        section_html += """
+        shown = len(sections.rows[section])
+        if shown < sections.counts[section]:
+            section_html += f"""
+        </tbody>
+      </table>
+      <p class="subtle">Showing the first {shown} of {sections.counts[section]} findings in this category.</p>
+    </div>
+        """
+        else:
+            section_html += """
         </tbody>
       </table>
     </div>
         """
-        sections_html += section_html
+        out.write(section_html)
 
     # ----- Chart script -----
     severity_labels = list(severity_counts.keys())
@@ -348,7 +537,8 @@ new Chart(ctx, {{
 </body>
 </html>
 """
-    return head_html + summary_card_top + sections_html + script_js + footer_html
+    out.write(script_js)
+    out.write(footer_html)
 
 def main():
     ap = argparse.ArgumentParser(description="Generate an OWASP Top 10 HTML report from a Semgrep JSON file.")
@@ -357,35 +547,55 @@ def main():
     ap.add_argument("--title", type=str, default=None, help="Custom HTML title")
     ap.add_argument("--project-name", type=str, default=None, help="Override project name shown in the header")
     ap.add_argument("--fail-on-empty", action="store_true", help="Exit with code 2 if there are no findings")
+    ap.add_argument("--stream", action="store_true",
+                    help="Large-input mode: count every finding but keep only the first "
+                         "--max-findings-per-section of each OWASP section for the detail tables")
+    ap.add_argument("--max-findings-per-section", type=int, default=None, metavar="N",
+                    help=f"Findings listed per OWASP section (default: all; {DEFAULT_STREAM_SAMPLE} with --stream)")
     args = ap.parse_args()
+    if args.max_findings_per_section is not None and args.max_findings_per_section < 0:
+        ap.error("--max-findings-per-section must be 0 or greater")
+
+    sample_size = args.max_findings_per_section
+    if sample_size is None and args.stream:
+        sample_size = DEFAULT_STREAM_SAMPLE
 
-    # Load JSON
+    # The input is parsed incrementally, so only the findings kept for the tables are held in memory
+    sections = OwaspSections(sample_size=sample_size)
+    members = {}
     try:
         with args.input.open("r", encoding="utf-8") as f:
-            json_data = json.load(f)
+            for item in iter_semgrep_results(f, members):
+                if item is RESTART:
+                    sections = OwaspSections(sample_size=sample_size)
+                    continue
+                sections.add(item)
     except Exception as e:
         print(f"Error reading input JSON: {e}", file=sys.stderr)
         sys.exit(1)
 
-    results, inferred_project = load_semgrep_results(json_data)
+    _, inferred_project = load_semgrep_results(members)
     if args.project_name:
         project_name = args.project_name
     else:
         project_name = inferred_project
 
-    if (not results) and args.fail_on_empty:
+    if (not sections.total_findings) and args.fail_on_empty:
         print("No findings present in the report. Exiting due to --fail-on-empty.", file=sys.stderr)
         sys.exit(2)
 
-    html_content = build_html(results, project_name, title=args.title)
     try:
-        args.output.write_text(html_content, encoding="utf-8")
+        with args.output.open("w", encoding="utf-8") as out:
+            write_html(out, sections, project_name, title=args.title)
     except Exception as e:
         print(f"Error writing output HTML: {e}", file=sys.stderr)
         sys.exit(1)
 
     print(f"✅ Report written to: {args.output}")
-    print(f"   Findings: {len(results)} • Project: {project_name}")
+    print(f"   Findings: {sections.total_findings} • Project: {project_name}")
+    hit_rate = tag_cache_hit_rate()
+    if hit_rate is not None:
+        print(f"   OWASP tag cache hit rate: {hit_rate:.1%}")
 
 if __name__ == "__main__":
     main()
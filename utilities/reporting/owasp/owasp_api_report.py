@@ -9,7 +9,8 @@ By default findings are grouped by repository. Use --team to group by Semgrep
 Team instead, or pass one or more team names to filter to specific teams.
 
 Authentication:
-  Set SEMGREP_APP_TOKEN environment variable.
+  Set SEMGREP_APP_TOKEN environment variable. SEMGREP_BASE_URL overrides the API
+  host (default https://semgrep.dev), e.g. to use the offline API stand-in.
 
 Usage:
   python owasp_api_report.py [--output owasp_api_report.html]
@@ -19,15 +20,35 @@ Usage:
 
 import argparse
 import html
+import json
 import os
+import sqlite3
 import sys
+import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import requests
-
-BASE_URL = "https://semgrep.dev/api/v1"
-PERMISSIONS_BASE = "https://semgrep.dev/api/permissions/v2"
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+SEMGREP_HOST = os.environ.get("SEMGREP_BASE_URL", "https://semgrep.dev").rstrip("/")
+BASE_URL = f"{SEMGREP_HOST}/api/v1"
+PERMISSIONS_BASE = f"{SEMGREP_HOST}/api/permissions/v2"
+
+DEFAULT_TEAM_WORKERS = 8
+DEFAULT_TEAM_CACHE_TTL = 6 * 60 * 60  # seconds
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "semgrep-owasp-report",
+)
+DEFAULT_HISTORY_PATH = os.path.join(
+    os.environ.get("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share"),
+    "semgrep-owasp-report", "history.sqlite",
+)
+TREND_POINTS = 12
+WEEK_SECONDS = 7 * 24 * 60 * 60
 
 OWASP_ORDER = [
     "A01", "A02", "A03", "A04", "A05",
@@ -55,8 +76,21 @@ def esc(s):
 # API helpers
 # ---------------------------------------------------------------------------
 
-def make_session(token):
+def make_session(token, pool_size=DEFAULT_TEAM_WORKERS):
     s = requests.Session()
+    # Room for one connection per concurrent team lookup; rate-limited and transient
+    # errors are retried with backoff, honouring Retry-After.
+    retry = Retry(
+        total=5,
+        backoff_factor=1,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=None,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
     s.headers.update({
         "Authorization": f"Bearer {token}",
         "Content-Type": "application/json",
@@ -79,45 +113,73 @@ def get_deployment_info(session):
     return slug, deployment_id
 
 
-def fetch_findings(session, org_slug):
-    """Fetch all open, high-confidence findings across all projects (paginated)."""
-    all_findings = []
-    page = 0
-    print("Fetching findings...", file=sys.stderr)
-    while True:
+FINDINGS_PAGE_SIZE = 3000
+
+
+class FindingCrawl:
+    """
+    Iterable over pages of open, high-confidence findings across all projects. The
+    next page is requested in the background while the caller processes the current
+    one. A page that fails after retries ends the crawl; `complete` is True only when
+    the last page was reached.
+    """
+
+    def __init__(self, session, org_slug):
+        self.session = session
+        self.org_slug = org_slug
+        self.complete = False
+
+    def _get_page(self, page):
         url = (
-            f"{BASE_URL}/deployments/{org_slug}/findings"
-            f"?page_size=3000&status=open&confidence=high&page={page}"
+            f"{BASE_URL}/deployments/{self.org_slug}/findings"
+            f"?page_size={FINDINGS_PAGE_SIZE}&status=open&confidence=high&page={page}"
         )
-        resp = session.get(url)
-        if resp.status_code != 200:
-            print(
-                f"  Error on page {page}: HTTP {resp.status_code} — {resp.text[:200]}",
-                file=sys.stderr,
-            )
-            break
-        data = resp.json()
-        page_findings = data.get("findings", [])
-        all_findings.extend(page_findings)
-        print(f"  Page {page}: {len(page_findings)} findings", file=sys.stderr)
-        if len(page_findings) < 3000:
-            break
-        page += 1
-    return all_findings
+        return self.session.get(url)
+
+    def __iter__(self):
+        self.complete = False
+        print("Fetching findings...", file=sys.stderr)
+        with ThreadPoolExecutor(max_workers=1) as prefetch:
+            page = 0
+            pending = prefetch.submit(self._get_page, page)
+            while pending is not None:
+                resp = pending.result()
+                if resp.status_code != 200:
+                    print(
+                        f"  Error on page {page}: HTTP {resp.status_code} — {resp.text[:200]}",
+                        file=sys.stderr,
+                    )
+                    return
+                page_findings = resp.json().get("findings", [])
+                print(f"  Page {page}: {len(page_findings)} findings", file=sys.stderr)
+                pending = None
+                if len(page_findings) == FINDINGS_PAGE_SIZE:
+                    page += 1
+                    pending = prefetch.submit(self._get_page, page)
+                yield page_findings
+        self.complete = True
+
+
+def fetch_findings(session, org_slug):
+    """Fetch all open, high-confidence findings across all projects (paginated)."""
+    return [f for page in FindingCrawl(session, org_slug) for f in page]
 
 
 def fetch_project_id_map(session, org_slug):
-    """Return {repo_id_str: repo_name} from the v1 projects endpoint."""
+    """Return {repo_id_str: repo_name} from the v1 projects endpoint, or None on error."""
     resp = session.get(f"{BASE_URL}/deployments/{org_slug}/projects")
     if resp.status_code != 200:
         print(f"  Warning: could not fetch projects: {resp.status_code}", file=sys.stderr)
-        return {}
+        return None
     projects = resp.json().get("projects", [])
     return {str(p["id"]): p["name"] for p in projects if p.get("id") and p.get("name")}
 
 
 def fetch_teams(session, deployment_id):
-    """Return all teams for the deployment (cursor-paginated)."""
+    """
+    Return all teams for the deployment (cursor-paginated), or None when a page
+    fails so a partial list is not mistaken for the full one.
+    """
     url = f"{PERMISSIONS_BASE}/deployments/{deployment_id}/teams/list"
     teams = []
     cursor = ""
@@ -130,7 +192,7 @@ def fetch_teams(session, deployment_id):
                 f"  Warning: failed to fetch teams: {resp.status_code} — {resp.text[:200]}",
                 file=sys.stderr,
             )
-            break
+            return None
         data = resp.json()
         page_teams = data.get("teams", [])
         teams.extend(page_teams)
@@ -142,7 +204,7 @@ def fetch_teams(session, deployment_id):
 
 
 def fetch_team_repo_ids(session, deployment_id, team_id):
-    """Return list of repository IDs (as strings) belonging to a team."""
+    """Return list of repository IDs (as strings) belonging to a team, or None on error."""
     url = f"{PERMISSIONS_BASE}/deployments/{deployment_id}/teams/{team_id}/repos"
     resp = session.get(url)
     if resp.status_code != 200:
@@ -150,18 +212,77 @@ def fetch_team_repo_ids(session, deployment_id, team_id):
             f"  Warning: failed to fetch repos for team {team_id}: {resp.status_code}",
             file=sys.stderr,
         )
-        return []
+        return None
     return [str(rid) for rid in resp.json().get("repositoryIds", [])]
 
 
-def build_repo_to_team_map(session, deployment_id, org_slug, team_filter=None):
+class TeamIndexCache:
     """
-    Return {repo_name: team_name} by combining the v2 teams API with the
-    v1 projects endpoint (which maps numeric IDs to repo names).
+    On-disk cache of a deployment's teams, project names and per-team repository IDs,
+    reused for `ttl` seconds. Per-team entries are added as teams are looked up, so a
+    filtered run fills in only the teams it needed.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, ttl=DEFAULT_TEAM_CACHE_TTL):
+        self.directory = directory
+        self.ttl = ttl
+
+    def _path(self, deployment_id):
+        return os.path.join(self.directory, f"teams-{deployment_id}.json")
+
+    def load(self, deployment_id):
+        """Return the cached index, or None when it is missing, unreadable or expired."""
+        try:
+            with open(self._path(deployment_id), encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return None
+        if time.time() - data.get("fetched_at", 0) > self.ttl:
+            return None
+        return data
+
+    def save(self, deployment_id, data):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp = self._path(deployment_id) + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump(data, fh)
+            os.replace(tmp, self._path(deployment_id))
+        except OSError as e:
+            print(f"  Warning: could not write team cache: {e}", file=sys.stderr)
+
+
+def build_repo_team_index(session, deployment_id, org_slug, team_filter=None,
+                          workers=DEFAULT_TEAM_WORKERS, cache=None):
+    """
+    Return {repo_name: [team_name, ...]} by combining the v2 teams API with the
+    v1 projects endpoint (which maps numeric IDs to repo names). Teams keep the
+    order the teams API lists them in.
 
     team_filter: optional set of team names/slugs to include; None = all teams.
+    workers:     number of concurrent per-team repo lookups.
+    cache:       optional TeamIndexCache; fresh entries are reused and new
+                 lookups are added to it.
     """
-    teams = fetch_teams(session, deployment_id)
+    cached = cache.load(deployment_id) if cache else None
+    if cached:
+        teams = cached["teams"]
+        repo_id_to_name = cached["projects"]
+        team_repos = cached["team_repos"]
+        print(f"  Using cached teams ({len(teams)} teams)", file=sys.stderr)
+    else:
+        teams = fetch_teams(session, deployment_id)
+        repo_id_to_name = fetch_project_id_map(session, org_slug)
+        # Only a complete team list and project map are worth keeping for the TTL;
+        # otherwise one failed request would shape every run until the cache expires
+        if teams is None or repo_id_to_name is None:
+            cache = None
+        teams = teams or []
+        repo_id_to_name = repo_id_to_name or {}
+        team_repos = {}
+        cached = {"fetched_at": time.time(), "teams": teams, "projects": repo_id_to_name,
+                  "team_repos": team_repos}
+
     if team_filter:
         teams = [
             t for t in teams
@@ -172,24 +293,47 @@ def build_repo_to_team_map(session, deployment_id, org_slug, team_filter=None):
             file=sys.stderr,
         )
 
-    repo_id_to_name = fetch_project_id_map(session, org_slug)
-
-    repo_to_team = {}
+    missing = [t["id"] for t in teams if str(t["id"]) not in team_repos]
+    if missing:
+        print(f"  Fetching repos for {len(missing)} team(s) with {workers} workers...", file=sys.stderr)
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            for team_id, repo_ids in zip(
+                missing,
+                pool.map(lambda tid: fetch_team_repo_ids(session, deployment_id, tid), missing),
+            ):
+                # Failed lookups are left out so they are retried next run
+                if repo_ids is not None:
+                    team_repos[str(team_id)] = repo_ids
+        if cache and teams:
+            cache.save(deployment_id, cached)
+
+    index = defaultdict(list)
     for team in teams:
         team_name = team.get("name") or f"team-{team.get('id', '?')}"
-        team_id = team["id"]
-        repo_ids = fetch_team_repo_ids(session, deployment_id, team_id)
-        mapped = sum(1 for rid in repo_ids if rid in repo_id_to_name)
+        repo_ids = team_repos.get(str(team["id"]), [])
+        mapped = 0
         for rid in repo_ids:
             repo_name = repo_id_to_name.get(rid)
             if repo_name:
-                repo_to_team[repo_name] = team_name
+                index[repo_name].append(team_name)
+                mapped += 1
         print(
             f"  Team '{team_name}': {len(repo_ids)} repo IDs, {mapped} mapped to names",
             file=sys.stderr,
         )
 
-    return repo_to_team
+    return dict(index)
+
+
+def build_repo_to_team_map(session, deployment_id, org_slug, team_filter=None,
+                           workers=DEFAULT_TEAM_WORKERS, cache=None):
+    """
+    Return {repo_name: team_name}. A repo in several teams is grouped under the
+    last one the teams API lists, as before the index was introduced.
+    """
+    index = build_repo_team_index(session, deployment_id, org_slug, team_filter=team_filter,
+                                  workers=workers, cache=cache)
+    return {repo: team_names[-1] for repo, team_names in index.items()}
 
 
 # ---------------------------------------------------------------------------
@@ -227,49 +371,208 @@ def owasp_sort_key(name):
     return (1, 99, name)
 
 
+class OwaspAggregator:
+    """
+    Folds findings into per-repository OWASP counts as they arrive, so pages can be
+    discarded once added. Grouping by team happens in result(), which lets the
+    team mapping be resolved while findings are still being fetched.
+    """
+
+    def __init__(self):
+        # {(repo_name, owasp_name): count}, in first-seen order so the report's
+        # ordering of ties matches a single pass over all findings
+        self.counts = defaultdict(int)
+        self.fetched = 0
+        self.sast_count = 0
+
+    def add(self, findings):
+        for f in findings:
+            self.fetched += 1
+            if not is_sast(f):
+                continue
+
+            repo_name = (
+                (f.get("repository") or {}).get("name")
+                or f.get("project_name")
+                or "Unknown"
+            )
+            if repo_name.startswith("local_scan/"):
+                continue
+
+            self.sast_count += 1
+            names = extract_owasp_names(f) or ["Unmapped to OWASP Top 10"]
+            for name in dict.fromkeys(names):
+                self.counts[repo_name, name] += 1
+
+    def result(self, repo_to_team=None):
+        """
+        When repo_to_team is provided, group by team name instead of repo name.
+        Repos with no team assignment are grouped under 'Unassigned'.
+
+        Returns:
+            owasp_data  – {owasp_name: {group: count}}
+            group_data  – {group: {owasp_name: count}}
+            sast_count  – int
+        """
+        owasp_data = defaultdict(lambda: defaultdict(int))
+        group_data = defaultdict(lambda: defaultdict(int))
+
+        for (repo_name, name), count in self.counts.items():
+            group = repo_to_team.get(repo_name, "Unassigned") if repo_to_team is not None else repo_name
+            owasp_data[name][group] += count
+            group_data[group][name] += count
+
+        return owasp_data, group_data, self.sast_count
+
+
 def aggregate(findings, repo_to_team=None):
     """
-    Aggregate findings by OWASP category.
+    Aggregate findings by OWASP category; see OwaspAggregator.result() for the
+    grouping and return values.
+    """
+    aggregator = OwaspAggregator()
+    aggregator.add(findings)
+    return aggregator.result(repo_to_team)
 
-    When repo_to_team is provided, group by team name instead of repo name.
-    Repos with no team assignment are grouped under 'Unassigned'.
 
-    Returns:
-        owasp_data  – {owasp_name: {group: count}}
-        group_data  – {group: {owasp_name: count}}
-        sast_count  – int
+# ---------------------------------------------------------------------------
+# Trend snapshots
+# ---------------------------------------------------------------------------
+
+class SnapshotStore:
+    """
+    SQLite file holding one snapshot of the {owasp × group} count matrix per run.
+    Snapshots form a series per organization and grouping ("project", or the
+    team selection), so reports grouped differently are not compared.
     """
-    owasp_data = defaultdict(lambda: defaultdict(int))
-    group_data = defaultdict(lambda: defaultdict(int))
-    sast_count = 0
-
-    for f in findings:
-        if not is_sast(f):
-            continue
-
-        repo_name = (
-            (f.get("repository") or {}).get("name")
-            or f.get("project_name")
-            or "Unknown"
-        )
-        if repo_name.startswith("local_scan/"):
-            continue
 
-        sast_count += 1
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS snapshots (
+            id INTEGER PRIMARY KEY,
+            org TEXT NOT NULL,
+            grouping TEXT NOT NULL,
+            taken_at REAL NOT NULL,
+            sast_count INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS snapshots_series ON snapshots (org, grouping, taken_at);
+        CREATE TABLE IF NOT EXISTS counts (
+            snapshot_id INTEGER NOT NULL REFERENCES snapshots (id),
+            owasp TEXT NOT NULL,
+            grp TEXT NOT NULL,
+            count INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS counts_snapshot ON counts (snapshot_id);
+    """
 
-        group = repo_to_team.get(repo_name, "Unassigned") if repo_to_team is not None else repo_name
+    def __init__(self, path=DEFAULT_HISTORY_PATH):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(self.SCHEMA)
 
-        names = extract_owasp_names(f) or ["Unmapped to OWASP Top 10"]
+    def close(self):
+        self.conn.close()
 
-        seen = set()
-        for name in names:
-            if name in seen:
-                continue
-            seen.add(name)
-            owasp_data[name][group] += 1
-            group_data[group][name] += 1
+    def append(self, org, grouping, owasp_data, sast_count, taken_at=None):
+        """Store the non-zero cells of owasp_data ({owasp_name: {group: count}})."""
+        with self.conn:
+            cur = self.conn.execute(
+                "INSERT INTO snapshots (org, grouping, taken_at, sast_count) VALUES (?, ?, ?, ?)",
+                (org, grouping, time.time() if taken_at is None else taken_at, sast_count),
+            )
+            self.conn.executemany(
+                "INSERT INTO counts (snapshot_id, owasp, grp, count) VALUES (?, ?, ?, ?)",
+                [
+                    (cur.lastrowid, name, group, count)
+                    for name, groups in owasp_data.items()
+                    for group, count in groups.items() if count
+                ],
+            )
 
-    return owasp_data, group_data, sast_count
+    def prune(self, org, grouping, keep=TREND_POINTS, now=None):
+        """
+        Delete the snapshots of a series that neither recent() nor a later
+        latest_before() a week back can return: everything older than both the
+        `keep` newest snapshots and the newest one taken a week or more ago.
+        """
+        now = time.time() if now is None else now
+        row = self.conn.execute(
+            "SELECT taken_at FROM snapshots WHERE org = ? AND grouping = ? "
+            "ORDER BY taken_at DESC LIMIT 1 OFFSET ?",
+            (org, grouping, keep - 1),
+        ).fetchone()
+        baseline = self.conn.execute(
+            "SELECT MAX(taken_at) FROM snapshots WHERE org = ? AND grouping = ? AND taken_at <= ?",
+            (org, grouping, now - WEEK_SECONDS),
+        ).fetchone()[0]
+        if row is None or baseline is None:
+            return
+        oldest_kept = min(row[0], baseline)
+        with self.conn:
+            stale = "SELECT id FROM snapshots WHERE org = ? AND grouping = ? AND taken_at < ?"
+            self.conn.execute(f"DELETE FROM counts WHERE snapshot_id IN ({stale})", (org, grouping, oldest_kept))
+            self.conn.execute(f"DELETE FROM snapshots WHERE id IN ({stale})", (org, grouping, oldest_kept))
+
+    def _load(self, rows):
+        snapshots = []
+        for snapshot_id, taken_at in rows:
+            owasp_data = defaultdict(dict)
+            for name, group, count in self.conn.execute(
+                "SELECT owasp, grp, count FROM counts WHERE snapshot_id = ?", (snapshot_id,)
+            ):
+                owasp_data[name][group] = count
+            snapshots.append((taken_at, dict(owasp_data)))
+        return snapshots
+
+    def recent(self, org, grouping, limit=TREND_POINTS):
+        """The last `limit` snapshots as [(taken_at, owasp_data)], oldest first."""
+        rows = self.conn.execute(
+            "SELECT id, taken_at FROM snapshots WHERE org = ? AND grouping = ? "
+            "ORDER BY taken_at DESC LIMIT ?",
+            (org, grouping, limit),
+        ).fetchall()
+        return self._load(reversed(rows))
+
+    def latest_before(self, org, grouping, cutoff):
+        """The newest snapshot taken at or before `cutoff`, as (taken_at, owasp_data), or None."""
+        rows = self.conn.execute(
+            "SELECT id, taken_at FROM snapshots WHERE org = ? AND grouping = ? AND taken_at <= ? "
+            "ORDER BY taken_at DESC LIMIT 1",
+            (org, grouping, cutoff),
+        ).fetchall()
+        loaded = self._load(rows)
+        return loaded[0] if loaded else None
+
+
+def owasp_totals(owasp_data):
+    return {name: sum(groups.values()) for name, groups in owasp_data.items()}
+
+
+def group_totals(owasp_data):
+    totals = defaultdict(int)
+    for groups in owasp_data.values():
+        for group, count in groups.items():
+            totals[group] += count
+    return totals
+
+
+def build_trends(history, baseline, owasp_data):
+    """
+    Return the trend data build_html renders, from previous snapshots and this run:
+        series      – {owasp_name: [count per snapshot, this run last]}
+        total       – [total per snapshot, this run last]
+        owasp_prev  – {owasp_name: count} a week ago, or None without a baseline
+        group_prev  – {group: count} a week ago, or None
+        since       – timestamp of the week-ago baseline, or None
+    """
+    points = [owasp_totals(snapshot) for _, snapshot in history] + [owasp_totals(owasp_data)]
+    names = set(points[-1])
+    return {
+        "series": {name: [p.get(name, 0) for p in points] for name in names},
+        "total": [sum(p.values()) for p in points],
+        "owasp_prev": owasp_totals(baseline[1]) if baseline else None,
+        "group_prev": group_totals(baseline[1]) if baseline else None,
+        "since": baseline[0] if baseline else None,
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -349,6 +652,11 @@ def _css():
                           overflow: hidden; text-overflow: ellipsis; white-space: nowrap; }
   .matrix td.total { font-weight: 700; color: #38bdf8; }
   .cell-0 { color: var(--muted); }
+  .delta { font-size: 12px; font-weight: 700; margin-left: 6px; white-space: nowrap; }
+  .delta-up { color: #f87171; }
+  .delta-down { color: #4ade80; }
+  .delta-flat { color: var(--muted); }
+  .spark { vertical-align: middle; }
   .footer { text-align: center; margin: 32px 0 0; color: var(--muted); font-size: 12px; }
   a { color: #7dd3fc; text-decoration: none; }
   a:hover { text-decoration: underline; }
@@ -356,20 +664,64 @@ def _css():
 """
 
 
-def _summary_card(sorted_owasp, total_by_owasp, org_slug, total_sast, now, team_context):
+def _delta(current, previous):
+    """Change since the week-ago snapshot; more findings is shown as a regression."""
+    if previous is None:
+        return ""
+    diff = current - previous
+    if diff > 0:
+        return f'<span class="delta delta-up" title="was {previous}">▲ +{diff}</span>'
+    if diff < 0:
+        return f'<span class="delta delta-down" title="was {previous}">▼ {diff}</span>'
+    return '<span class="delta delta-flat">±0</span>'
+
+
+def _sparkline(values, width=90, height=22, color="#38bdf8"):
+    if len(values) < 2:
+        return ""
+    top = max(values) or 1
+    step = width / (len(values) - 1)
+    points = " ".join(
+        f"{i * step:.1f},{height - 2 - (v / top) * (height - 4):.1f}" for i, v in enumerate(values)
+    )
+    return (
+        f'<svg class="spark" width="{width}" height="{height}" viewBox="0 0 {width} {height}">'
+        f'<polyline points="{points}" fill="none" stroke="{color}" stroke-width="1.5"/></svg>'
+    )
+
+
+def _summary_card(sorted_owasp, total_by_owasp, org_slug, total_sast, now, team_context, trends=None):
     total = sum(total_by_owasp.values())
+    owasp_prev = trends["owasp_prev"] if trends else None
     rows = ""
     for name in sorted_owasp[:10]:
+        trend_cells = ""
+        if trends:
+            prev = owasp_prev.get(name, 0) if owasp_prev is not None else None
+            trend_cells = (
+                f'<td style="text-align:right">{_sparkline(trends["series"][name])}</td>'
+                f'<td style="text-align:right">{_delta(total_by_owasp[name], prev) or "—"}</td>'
+            )
         rows += (
             f'<tr><td>{esc(name)}</td>'
+            f'{trend_cells}'
             f'<td style="text-align:right"><span class="pill">{total_by_owasp[name]}</span></td></tr>'
         )
+    trend_headers = ""
+    total_trend = ""
+    if trends:
+        trend_headers = '<th style="text-align:right">Trend</th><th style="text-align:right">Week over week</th>'
+        prev_total = sum(owasp_prev.values()) if owasp_prev is not None else None
+        total_trend = f'{_sparkline(trends["total"])}{_delta(total, prev_total)}'
 
     context_parts = [f"Organization: <strong>{esc(org_slug)}</strong>"]
     if team_context:
         context_parts.append(f"Teams: <strong>{esc(team_context)}</strong>")
     context_parts.append("Filter: open · high-confidence · SAST")
     context_parts.append(f"Generated: {esc(now)}")
+    if trends and trends["since"] is not None:
+        since = datetime.fromtimestamp(trends["since"]).strftime("%Y-%m-%d %H:%M")
+        context_parts.append(f"Compared with: {esc(since)}")
 
     return f"""
 <div class="card">
@@ -378,12 +730,15 @@ def _summary_card(sorted_owasp, total_by_owasp, org_slug, total_sast, now, team_
       <h1>OWASP Top 10 Findings Report</h1>
       <div class="subtle">{" &nbsp;•&nbsp; ".join(context_parts)}</div>
     </div>
-    <span class="badge">{total} findings across {len(total_by_owasp)} OWASP categories</span>
+    <div style="text-align:right">
+      <span class="badge">{total} findings across {len(total_by_owasp)} OWASP categories</span>
+      <div style="margin-top:8px">{total_trend}</div>
+    </div>
   </div>
   <div style="margin-top:20px;">
     <h2>OWASP Coverage Summary</h2>
     <table>
-      <thead><tr><th>OWASP Category</th><th style="text-align:right">Findings</th></tr></thead>
+      <thead><tr><th>OWASP Category</th>{trend_headers}<th style="text-align:right">Findings</th></tr></thead>
       <tbody>{rows}</tbody>
     </table>
   </div>
@@ -391,7 +746,7 @@ def _summary_card(sorted_owasp, total_by_owasp, org_slug, total_sast, now, team_
 """
 
 
-def _matrix_table(all_groups, all_owasp_sorted, group_data, total_by_owasp, row_label):
+def _matrix_table(all_groups, all_owasp_sorted, group_data, total_by_owasp, row_label, trends=None):
     if not all_groups or not all_owasp_sorted:
         return ""
 
@@ -400,9 +755,12 @@ def _matrix_table(all_groups, all_owasp_sorted, group_data, total_by_owasp, row_
         code = name.split(" ")[0] if " " in name else name[:6]
         header_cells += f'<th class="rotate"><span title="{esc(name)}">{esc(code)}</span></th>'
 
+    group_prev = trends["group_prev"] if trends else None
+    owasp_prev = trends["owasp_prev"] if trends else None
     rows = ""
     for group in sorted(all_groups):
         group_total = sum(group_data[group].values())
+        prev = group_prev.get(group, 0) if group_prev is not None else None
         cells = ""
         for name in all_owasp_sorted:
             count = group_data[group].get(name, 0)
@@ -411,7 +769,7 @@ def _matrix_table(all_groups, all_owasp_sorted, group_data, total_by_owasp, row_
         rows += (
             f'<tr><td class="row-label" title="{esc(group)}">{esc(group)}</td>'
             f'{cells}'
-            f'<td class="total">{group_total}</td></tr>'
+            f'<td class="total">{group_total}{_delta(group_total, prev)}</td></tr>'
         )
 
     total_cells = ""
@@ -422,7 +780,8 @@ def _matrix_table(all_groups, all_owasp_sorted, group_data, total_by_owasp, row_
         f'<tr style="border-top:2px solid #38bdf8">'
         f'<td class="row-label" style="font-weight:700;color:#38bdf8">TOTAL</td>'
         f'{total_cells}'
-        f'<td class="total">{grand_total}</td></tr>'
+        f'<td class="total">{grand_total}'
+        f'{_delta(grand_total, sum(owasp_prev.values())) if owasp_prev is not None else ""}</td></tr>'
     )
 
     return f"""
@@ -482,7 +841,11 @@ def _ranked_sections(sorted_owasp, owasp_data, total_by_owasp, row_label):
 
 
 def build_html(owasp_data, group_data, total_by_owasp, total_sast, org_slug,
-               row_label="Project", team_context=""):
+               row_label="Project", team_context="", trends=None):
+    """
+    trends: optional build_trends() result; adds sparklines and week-over-week
+    changes to the summary and the findings matrix.
+    """
     now = datetime.now().strftime("%Y-%m-%d %H:%M")
 
     sorted_owasp = sorted(
@@ -504,8 +867,8 @@ def build_html(owasp_data, group_data, total_by_owasp, total_sast, org_slug,
 </head>
 <body>
 <div class="container">
-{_summary_card(sorted_owasp, total_by_owasp, org_slug, total_sast, now, team_context)}
-{_matrix_table(all_groups, all_owasp_sorted, group_data, total_by_owasp, row_label)}
+{_summary_card(sorted_owasp, total_by_owasp, org_slug, total_sast, now, team_context, trends)}
+{_matrix_table(all_groups, all_owasp_sorted, group_data, total_by_owasp, row_label, trends)}
 {_ranked_sections(sorted_owasp, owasp_data, total_by_owasp, row_label)}
 <div class="footer">
   Semgrep API · open · high-confidence · SAST findings ·
@@ -540,6 +903,33 @@ def main():
             "team names/slugs to filter to specific teams."
         ),
     )
+    ap.add_argument(
+        "--team-workers",
+        type=int,
+        default=DEFAULT_TEAM_WORKERS,
+        help=f"Concurrent team repo lookups (default: {DEFAULT_TEAM_WORKERS})",
+    )
+    ap.add_argument(
+        "--cache-dir",
+        default=DEFAULT_CACHE_DIR,
+        help=f"Directory for the cached team index (default: {DEFAULT_CACHE_DIR})",
+    )
+    ap.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=DEFAULT_TEAM_CACHE_TTL,
+        help=f"Seconds to reuse the cached team index; 0 disables it (default: {DEFAULT_TEAM_CACHE_TTL})",
+    )
+    ap.add_argument(
+        "--history",
+        default=DEFAULT_HISTORY_PATH,
+        help=f"SQLite file of per-run snapshots used for trends (default: {DEFAULT_HISTORY_PATH})",
+    )
+    ap.add_argument(
+        "--no-history",
+        action="store_true",
+        help="Neither read nor record trend snapshots",
+    )
     args = ap.parse_args()
 
     token = os.environ.get("SEMGREP_APP_TOKEN")
@@ -547,7 +937,7 @@ def main():
         print("Error: SEMGREP_APP_TOKEN environment variable is not set.", file=sys.stderr)
         sys.exit(1)
 
-    session = make_session(token)
+    session = make_session(token, pool_size=max(1, args.team_workers) + 1)
 
     try:
         org_slug, deployment_id = get_deployment_info(session)
@@ -555,19 +945,33 @@ def main():
         print(f"Error fetching organization: {e}", file=sys.stderr)
         sys.exit(1)
 
-    raw_findings = fetch_findings(session, org_slug)
-    print(f"Total findings fetched: {len(raw_findings)}", file=sys.stderr)
+    # The team mapping is built in the background while the findings are crawled
+    team_pool = ThreadPoolExecutor(max_workers=1)
+    team_future = None
+    if args.team is not None:
+        cache = TeamIndexCache(args.cache_dir, args.cache_ttl) if args.cache_ttl > 0 else None
+        team_future = team_pool.submit(
+            build_repo_to_team_map, session, deployment_id, org_slug,
+            team_filter=set(args.team) if args.team else None,
+            workers=args.team_workers, cache=cache,
+        )
+
+    # Each page is folded into the counts and dropped, so memory does not grow with the org
+    aggregator = OwaspAggregator()
+    crawl = FindingCrawl(session, org_slug)
+    for page in crawl:
+        aggregator.add(page)
+    print(f"Total findings fetched: {aggregator.fetched}", file=sys.stderr)
+    if not crawl.complete:
+        print("Warning: findings crawl stopped early; the report is partial.", file=sys.stderr)
 
     repo_to_team = None
     row_label = "Project"
     team_context = ""
 
-    if args.team is not None:
-        team_filter = set(args.team) if args.team else None
+    if team_future is not None:
         try:
-            repo_to_team = build_repo_to_team_map(
-                session, deployment_id, org_slug, team_filter=team_filter,
-            )
+            repo_to_team = team_future.result()
         except Exception as e:
             print(
                 f"Warning: could not fetch teams ({e}). Falling back to project grouping.",
@@ -578,8 +982,9 @@ def main():
         if repo_to_team is not None:
             row_label = "Team"
             team_context = ", ".join(sorted(args.team)) if args.team else "all teams"
+    team_pool.shutdown()
 
-    owasp_data, group_data, sast_count = aggregate(raw_findings, repo_to_team=repo_to_team)
+    owasp_data, group_data, sast_count = aggregator.result(repo_to_team=repo_to_team)
     print(f"SAST findings after filter: {sast_count}", file=sys.stderr)
     print(f"OWASP categories found: {len(owasp_data)}", file=sys.stderr)
     print(f"{row_label}s with findings: {len(group_data)}", file=sys.stderr)
@@ -592,10 +997,25 @@ def main():
         for name, groups in owasp_data.items()
     }
 
+    store = None
+    trends = None
+    grouping = f"team:{team_context}" if repo_to_team is not None else "project"
+    if not args.no_history:
+        try:
+            store = SnapshotStore(args.history)
+            history = store.recent(org_slug, grouping, TREND_POINTS - 1)
+            baseline = store.latest_before(org_slug, grouping, time.time() - WEEK_SECONDS)
+            trends = build_trends(history, baseline, owasp_data) if history else None
+            print(f"Trend snapshots: {len(history)} previous run(s)", file=sys.stderr)
+        except (sqlite3.Error, OSError) as e:
+            print(f"Warning: could not read history ({e}); no trends shown.", file=sys.stderr)
+            store = None
+
     page = build_html(
         owasp_data, group_data, total_by_owasp, sast_count, org_slug,
         row_label=row_label,
         team_context=team_context,
+        trends=trends,
     )
 
     try:
@@ -605,6 +1025,18 @@ def main():
         print(f"Error writing output: {e}", file=sys.stderr)
         sys.exit(1)
 
+    if store is not None:
+        # Partial counts would show up as a drop in every later trend
+        if crawl.complete:
+            try:
+                store.append(org_slug, grouping, owasp_data, sast_count)
+                store.prune(org_slug, grouping)
+            except sqlite3.Error as e:
+                print(f"Warning: could not record snapshot ({e}).", file=sys.stderr)
+        else:
+            print("Snapshot not recorded for the partial crawl.", file=sys.stderr)
+        store.close()
+
     print(f"\nReport written to: {args.output}", file=sys.stderr)
     print(f"  {sast_count} findings · {len(owasp_data)} categories · {len(group_data)} {row_label.lower()}s")
 
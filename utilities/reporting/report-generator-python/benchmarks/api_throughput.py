@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Measure SemgrepApiClient fetch throughput against the offline Semgrep API stand-in.
+
+Usage: python benchmarks/api_throughput.py [--repos 50] [--findings-per-repo 400] [--latency-ms 50]
+                                           [--concurrency 4] [--rate-limit-prob 0] [--runs 3]
+
+A synthetic org is generated and served in-process by utilities/semgrep-api-standin, so no
+network access or API token is needed. `fetch_all_projects` (findings crawl, project details
+and scan coverage) is timed with one request at a time, as the client used to fetch, and with
+`--concurrency` concurrent page and lookup requests. Findings per second and the number of
+API requests are reported; `--rate-limit-prob` makes the stand-in answer that share of
+requests with HTTP 429 to include retries in the measurement.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STANDIN = os.path.join(ROOT, '..', '..', 'semgrep-api-standin')
+sys.path.insert(0, ROOT)
+sys.path.insert(0, STANDIN)
+
+from services.semgrep_api_client import SemgrepApiClient  # noqa: E402
+from standin_server import start_server  # noqa: E402
+from synthetic_org import build_org  # noqa: E402
+
+
+def standin_call(base_url: str, path: str, method: str = 'GET') -> dict:
+    with urllib.request.urlopen(urllib.request.Request(f'{base_url}{path}', method=method)) as resp:
+        return json.load(resp)
+
+
+def fetch_once(org_name: str, base_url: str, concurrency: int) -> tuple:
+    """(seconds, projects, findings, requests) for one cold fetch_all_projects."""
+    SemgrepApiClient.release_organization(org_name)
+    standin_call(base_url, '/_standin/reset', 'POST')
+    client = SemgrepApiClient(org_name, 'benchmark-token', page_concurrency=concurrency,
+                              lookup_concurrency=concurrency, max_retries=10)
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        projects = client.fetch_all_projects()
+    elapsed = time.perf_counter() - started
+    stats = standin_call(base_url, '/_standin/stats')
+    return elapsed, len(projects), sum(len(p.findings) for p in projects), stats['requests'], stats['rate_limited']
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repos', type=int, default=50)
+    parser.add_argument('--findings-per-repo', type=int, default=400)
+    parser.add_argument('--rule-skew', type=float, default=1.0)
+    parser.add_argument('--latency-ms', type=float, default=50)
+    parser.add_argument('--jitter-ms', type=float, default=10)
+    parser.add_argument('--rate-limit-prob', type=float, default=0)
+    parser.add_argument('--concurrency', type=int, default=SemgrepApiClient.DEFAULT_PAGE_CONCURRENCY)
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    org = build_org(repos=args.repos, findings_per_repo=args.findings_per_repo, rule_skew=args.rule_skew)
+    # Retry-After 0 keeps injected 429s from dominating the timings with sleeps
+    server, base_url = start_server(org, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                                    rate_limit_prob=args.rate_limit_prob, retry_after=0)
+    SemgrepApiClient.BASE_URL = f'{base_url}/api/v1'
+    org_name = org['deployment']['name']
+    print(f'Stand-in at {base_url}: {args.repos} repositories, {len(org["findings"])} findings, '
+          f'{args.latency_ms:.0f} ms latency; median of {args.runs} runs\n')
+
+    try:
+        results = {}
+        for label, concurrency in (('sequential', 1), (f'concurrent x{args.concurrency}', args.concurrency)):
+            runs = [fetch_once(org_name, base_url, concurrency) for _ in range(args.runs)]
+            elapsed = statistics.median(r[0] for r in runs)
+            _, projects, findings, requests_made, limited = runs[-1]
+            results[label] = elapsed
+            print(f'{label:<16} {elapsed:>7.2f} s  {findings / elapsed:>10,.0f} findings/s  '
+                  f'{requests_made:>5} requests ({limited} rate limited)  {projects} projects')
+        sequential, concurrent = results.values()
+        print(f'\nSpeedup: {sequential / concurrent:.1f}x')
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
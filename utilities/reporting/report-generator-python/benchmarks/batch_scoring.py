@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Compare per-project scoring with ScoringEngine.score_batch over columnar findings.
+
+Usage: python benchmarks/batch_scoring.py [--projects N] [--findings-per-project N]
+
+Times the per-project calculate_security_score / calculate_semgrep_level /
+get_owasp_top10_distribution calls, building the FindingColumns view, and score_batch
+(which uses NumPy when it is installed), and checks that both give the same results.
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import SemgrepFinding, SemgrepProject, ScanMetadata, BusinessCriticality  # noqa: E402
+from services.scoring_engine import ScoringEngine, FindingColumns, numpy_module  # noqa: E402
+
+SEVERITIES = ['Critical', 'High', 'High', 'Medium', 'Medium', 'Medium', 'Low', 'Low']
+CATEGORIES = ['security', 'injection', 'crypto', 'config', 'auth', 'logging', 'ssrf', 'design']
+
+
+def synthetic_projects(count: int, per_project: int):
+    found_at = datetime(2026, 1, 1)
+    scan = ScanMetadata(True, True, True, 100, 60000, '1.45.0')
+    projects = []
+    for p in range(count):
+        findings = []
+        for i in range(per_project):
+            n = p * 31 + i
+            findings.append(SemgrepFinding(
+                id=str(n), rule_id=f'rule-{n % 300}', rule_name=f'rule-{n % 300}',
+                path='src/app.py', start_line=i + 1, severity=SEVERITIES[n % len(SEVERITIES)],
+                message='m', description='d', category=CATEGORIES[n % len(CATEGORIES)],
+                found_at=found_at, status='Open' if n % 5 else 'Fixed',
+                project_name=f'repo-{p}', project_id=str(p),
+                exploitability_score=3, remediation_effort=3,
+            ))
+        projects.append(SemgrepProject(
+            name=f'repo-{p}', repository=f'repo-{p}', business_criticality=BusinessCriticality.HIGH,
+            last_scanned=found_at, findings=findings, scan_data=scan,
+        ))
+    return projects
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Batch scoring benchmark')
+    parser.add_argument('--projects', type=int, default=2000)
+    parser.add_argument('--findings-per-project', type=int, default=100)
+    args = parser.parse_args()
+
+    projects = synthetic_projects(args.projects, args.findings_per_project)
+    engine = ScoringEngine()
+    print(f'{args.projects} projects, {args.projects * args.findings_per_project} findings, '
+          f'NumPy {"available" if numpy_module() is not None else "not installed"}')
+
+    started = time.perf_counter()
+    scores = [engine.calculate_security_score(p.findings) for p in projects]
+    levels = [engine.calculate_semgrep_level(p) for p in projects]
+    owasp = [engine.get_owasp_top10_distribution(p.findings) for p in projects]
+    per_project = time.perf_counter() - started
+
+    started = time.perf_counter()
+    columns = FindingColumns.from_projects(projects, engine)
+    build = time.perf_counter() - started
+
+    started = time.perf_counter()
+    batch = engine.score_batch(columns)
+    scoring = time.perf_counter() - started
+
+    assert batch.scores == scores and batch.levels == levels and batch.owasp_distributions == owasp
+    print(f'  per-project scoring      {per_project * 1000:9.1f} ms')
+    print(f'  build columns            {build * 1000:9.1f} ms')
+    print(f'  score_batch              {scoring * 1000:9.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
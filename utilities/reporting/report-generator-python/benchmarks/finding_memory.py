@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Measure the memory used by SemgrepFinding objects for a synthetic organization.
+
+Usage: python benchmarks/finding_memory.py [--findings N] [--rules N] [--projects N]
+
+Builds the same synthetic findings twice, once as a plain dataclass with one copy of
+every string per finding (the previous model) and once as SemgrepFinding, and reports
+the traced allocation size of each.
+"""
+
+import argparse
+import os
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import SemgrepFinding, RuleText  # noqa: E402
+
+
+@dataclass
+class DataclassFinding:
+    id: str
+    rule_id: str
+    rule_name: str
+    path: str
+    start_line: int
+    severity: str
+    message: str
+    description: str
+    category: str
+    found_at: datetime
+    status: str
+    project_name: str
+    project_id: str
+    exploitability_score: int
+    remediation_effort: int
+    owasp_category: Optional[str] = None
+    cwe_id: Optional[str] = None
+    cve_id: Optional[str] = None
+    assistant_recommendation: Optional[str] = None
+    triage_state: Optional[str] = None
+
+
+def synthetic_fields(index: int, rules: int, projects: int) -> dict:
+    # Strings are rebuilt for every finding, as they would be after JSON decoding.
+    rule = index % rules
+    project = index % projects
+    rule_id = f'python.lang.security.audit.rule-{rule}'
+    return dict(
+        id=str(100000 + index),
+        rule_id=rule_id,
+        rule_name=f'python.lang.security.audit.rule-{rule}',
+        path=f'src/module_{index % 500}/file_{index % 37}.py',
+        start_line=index % 400 + 1,
+        severity=['Critical', 'High', 'Medium', 'Low'][rule % 4],
+        message=f'Rule {rule} detected a potentially unsafe pattern in this code path. ' * 2,
+        description=f'Rule {rule} flags code that may allow an attacker to compromise the application. ' * 3,
+        category=''.join(['secur', 'ity']),
+        found_at=datetime(2026, 1, 1) + timedelta(minutes=index),
+        status=''.join(['Op', 'en']),
+        project_name=f'example-org/project-{project}',
+        project_id=str(project),
+        exploitability_score=index % 5 + 1,
+        remediation_effort=rule % 5 + 1,
+        owasp_category=f'A0{rule % 9 + 1}:2021',
+        cwe_id=f'CWE-{rule % 50 + 20}',
+        assistant_recommendation=f'Apply the documented fix for rule {rule} and validate all inputs. ' * 2,
+        triage_state=''.join(['needs_', 'review']),
+    )
+
+
+def measure(model, count: int, rules: int, projects: int) -> int:
+    RuleText.clear()
+    tracemalloc.start()
+    findings = [model(**synthetic_fields(i, rules, projects)) for i in range(count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del findings
+    return current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='SemgrepFinding memory benchmark')
+    parser.add_argument('--findings', type=int, default=100000)
+    parser.add_argument('--rules', type=int, default=400)
+    parser.add_argument('--projects', type=int, default=200)
+    args = parser.parse_args()
+
+    print(f'{args.findings} findings, {args.rules} rules, {args.projects} projects')
+    baseline = measure(DataclassFinding, args.findings, args.rules, args.projects)
+    compact = measure(SemgrepFinding, args.findings, args.rules, args.projects)
+    for label, size in (('dataclass', baseline), ('SemgrepFinding', compact)):
+        print(f'  {label:<15} {size / 1024 / 1024:8.1f} MiB  '
+              f'{size / args.findings:6.0f} bytes/finding')
+    print(f'  reduction       {100 * (1 - compact / baseline):8.1f}%')
+
+
+if __name__ == '__main__':
+    main()
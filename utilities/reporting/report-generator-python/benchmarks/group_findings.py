@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Time BasicPdfGenerator._group_findings_by_rule on synthetic findings.
+
+Usage: python benchmarks/group_findings.py [--sizes 10000 100000 1000000] [--rules N]
+                                           [--compare-up-to N]
+
+Findings are spread over `--rules` rules with roughly one duplicate location in four, the
+shape produced by noisy rules that fire on many files. Up to `--compare-up-to` findings the
+previous list-scanning implementation is timed as well and its output checked against the
+current one.
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import SemgrepFinding  # noqa: E402
+from pdf import BasicPdfGenerator  # noqa: E402
+
+
+def synthetic_findings(count: int, rules: int) -> List[SemgrepFinding]:
+    found_at = datetime(2026, 1, 1)
+    findings = []
+    for i in range(count):
+        rule = i % rules
+        location = (i // rules) * 3 // 4  # repeats about one location in four per rule
+        findings.append(SemgrepFinding(
+            id=str(i), rule_id=f'rule-{rule}', rule_name=f'rule-{rule}',
+            path=f'src/module_{location % 1000}/file_{location}.py', start_line=location % 300 + 1,
+            severity='High', message='Unsafe pattern', description='Unsafe pattern detected',
+            category='security', found_at=found_at, status='Open',
+            project_name='example-org/repo', project_id='1',
+            exploitability_score=3, remediation_effort=3,
+        ))
+    return findings
+
+
+def group_by_scanning(findings: List[SemgrepFinding]) -> List[dict]:
+    # The previous implementation, kept for comparison
+    groups: Dict[str, dict] = {}
+    for finding in findings:
+        key = finding.rule_id
+        if key not in groups:
+            groups[key] = {'rule_id': finding.rule_id, 'instances': []}
+        loc_key = f'{finding.path}:{finding.start_line}'
+        if not any(f'{i["path"]}:{i["start_line"]}' == loc_key for i in groups[key]['instances']):
+            groups[key]['instances'].append({'id': finding.id, 'path': finding.path,
+                                             'start_line': finding.start_line})
+    return list(groups.values())
+
+
+def timed(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Rule grouping benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--rules', type=int, default=20)
+    parser.add_argument('--compare-up-to', type=int, default=10000)
+    args = parser.parse_args()
+
+    generator = BasicPdfGenerator()
+    print(f'{"Findings":>10} {"Groups":>7} {"Instances":>10} {"Set (s)":>9} {"Scan (s)":>9}')
+    for size in args.sizes:
+        findings = synthetic_findings(size, args.rules)
+        groups, seconds = timed(generator._group_findings_by_rule, findings)
+        instances = sum(len(g['instances']) for g in groups)
+        scan = '-'
+        if size <= args.compare_up_to:
+            previous, scan_seconds = timed(group_by_scanning, findings)
+            assert [[i['id'] for i in g['instances']] for g in previous] == \
+                   [[i['id'] for i in g['instances']] for g in groups], 'outputs differ'
+            scan = f'{scan_seconds:.3f}'
+        print(f'{size:>10} {len(groups):>7} {instances:>10} {seconds:>9.3f} {scan:>9}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Time how long the report generator takes to start, to catch startup regressions.
+
+Usage: python benchmarks/import_time.py [--runs 10] [--top 10] [--max-ms 150]
+
+Each scenario runs in a fresh interpreter; the time of an empty interpreter start is
+subtracted. Two scenarios are compared:
+
+  startup   `import main`, what every run (including --validate-only and --help) pays
+  eager     `import main` plus everything the previous top-level imports loaded: the API
+            client (requests), NumPy and the PDF generator (ReportLab)
+
+The modules with the largest cumulative import time under `startup` are listed from
+`python -X importtime`. With `--max-ms` the script exits with status 1 when the startup
+median exceeds the budget, so it can run in CI.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ('requests', 'numpy', 'reportlab')
+
+SCENARIOS = {
+    'startup': 'import main',
+    'eager': ('import main, services.semgrep_api_client, pdf.basic_pdf_generator\n'
+              'try:\n    import numpy\nexcept ImportError:\n    pass'),
+}
+
+
+def run_python(code: str) -> float:
+    started = time.perf_counter()
+    subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True)
+    return time.perf_counter() - started
+
+
+def median_ms(code: str, runs: int) -> float:
+    return statistics.median(run_python(code) for _ in range(runs)) * 1000
+
+
+def loaded_heavy_modules(code: str) -> list:
+    probe = f'{code}\nimport sys\nprint(",".join(m for m in {HEAVY_MODULES!r} if m in sys.modules))'
+    out = subprocess.run([sys.executable, '-c', probe], cwd=ROOT, check=True,
+                         capture_output=True, text=True).stdout
+    return [m for m in out.strip().split(',') if m]
+
+
+def slowest_imports(code: str, top: int) -> list:
+    """(cumulative microseconds, module) for the `top` slowest imports, from -X importtime."""
+    err = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=ROOT, check=True,
+                         capture_output=True, text=True).stderr
+    rows = []
+    for line in err.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if name.strip() == 'site':
+            # Imports finish before their parent is listed, so everything so far was interpreter startup
+            rows = []
+            continue
+        rows.append((int(cumulative), name.rstrip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--max-ms', type=float, default=None,
+                        help='Fail when the startup median exceeds this many milliseconds')
+    args = parser.parse_args()
+
+    baseline = median_ms('pass', args.runs)
+    print(f'Interpreter start: {baseline:.1f} ms (subtracted below), median of {args.runs} runs\n')
+
+    results = {}
+    for name, code in SCENARIOS.items():
+        results[name] = median_ms(code, args.runs) - baseline
+        heavy = ', '.join(loaded_heavy_modules(code)) or 'none'
+        print(f'{name:<8} {results[name]:>8.1f} ms   heavy modules loaded: {heavy}')
+
+    print('\nSlowest imports under startup (cumulative):')
+    for cumulative, name in slowest_imports(SCENARIOS['startup'], args.top):
+        print(f'  {cumulative / 1000:>8.1f} ms  {name}')
+
+    if args.max_ms is not None and results['startup'] > args.max_ms:
+        print(f'\nStartup {results["startup"]:.1f} ms exceeds the {args.max_ms:.0f} ms budget')
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
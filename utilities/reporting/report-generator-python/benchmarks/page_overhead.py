@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Time the fixed per-page and per-report costs of BasicPdfGenerator.
+
+Usage: python benchmarks/page_overhead.py [--reports 20] [--pages 200] [--rows 10000]
+
+Three costs are compared between the previous implementation and the current one:
+
+  header    drawing the page header with the Semgrep logo on every page of `--reports`
+            documents of `--pages` pages each (the previous header resolved the asset path
+            and passed it to drawImage on every page)
+  styles    building the paragraph style sheet, once per BasicPdfGenerator
+  rows      the paragraph styles behind `--rows` OWASP detail table rows (the previous
+            code built four ParagraphStyle objects per row)
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reportlab.lib.colors import HexColor  # noqa: E402
+from reportlab.lib.styles import ParagraphStyle  # noqa: E402
+from reportlab.pdfgen.canvas import Canvas  # noqa: E402
+
+from pdf import basic_pdf_generator as gen  # noqa: E402
+
+
+def previous_draw_header(canvas, title: str = 'Application Security Report'):
+    canvas.saveState()
+    canvas.setFillColor(gen.GREEN)
+    canvas.rect(0, gen.PAGE_HEIGHT - gen.HEADER_HEIGHT, gen.PAGE_WIDTH, gen.HEADER_HEIGHT, stroke=0, fill=1)
+    canvas.setFont('Helvetica-Bold', 18)
+    canvas.setFillColor(HexColor('#FFFFFF'))
+    canvas.drawString(gen.MARGIN, gen.PAGE_HEIGHT - gen.HEADER_HEIGHT + 20, title)
+    logo_path = gen._get_asset_path.__wrapped__('semgrep-logo.png')
+    if logo_path:
+        try:
+            canvas.drawImage(logo_path, gen.PAGE_WIDTH - 110, gen.PAGE_HEIGHT - gen.HEADER_HEIGHT + 10,
+                             width=90, height=35, preserveAspectRatio=True, mask='auto')
+        except Exception:
+            canvas.setFont('Helvetica-Bold', 14)
+            canvas.drawRightString(gen.PAGE_WIDTH - gen.MARGIN, gen.PAGE_HEIGHT - gen.HEADER_HEIGHT + 20, 'Semgrep')
+    canvas.restoreState()
+
+
+def current_draw_header(canvas):
+    gen._draw_header(canvas, None)
+
+
+def time_headers(draw, reports: int, pages: int) -> float:
+    started = time.perf_counter()
+    for _ in range(reports):
+        canvas = Canvas(io.BytesIO())
+        for _ in range(pages):
+            draw(canvas)
+            canvas.showPage()
+        canvas.save()
+    return time.perf_counter() - started
+
+
+def previous_row_styles():
+    return (
+        ParagraphStyle('rc', fontSize=8, textColor=gen.BLUE, leading=11),
+        ParagraphStyle('mc', fontSize=8, leading=11, textColor=gen.DARK_GRAY),
+        ParagraphStyle('cwec', fontSize=8, textColor=gen.BLUE),
+        ParagraphStyle('cwed', fontSize=8, textColor=gen.GRAY),
+    )
+
+
+def current_row_styles():
+    st = gen._styles()
+    return st['OwaspRuleCell'], st['OwaspMessageCell'], st['OwaspCweCell'], st['OwaspCweEmpty']
+
+
+def time_calls(fn, count: int) -> float:
+    started = time.perf_counter()
+    for _ in range(count):
+        fn()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--reports', type=int, default=20)
+    parser.add_argument('--pages', type=int, default=200)
+    parser.add_argument('--rows', type=int, default=10000)
+    args = parser.parse_args()
+
+    # Warm the process-wide caches so the current numbers show steady-state cost
+    gen._styles()
+    gen._logo_image()
+
+    total_pages = args.reports * args.pages
+    print(f'{"":<8} {"previous":>12} {"current":>12}')
+
+    previous = time_headers(previous_draw_header, args.reports, args.pages)
+    current = time_headers(current_draw_header, args.reports, args.pages)
+    print(f'{"header":<8} {previous / total_pages * 1e6:>9.1f} us {current / total_pages * 1e6:>9.1f} us'
+          f'   per page ({args.reports} reports x {args.pages} pages, incl. page output)')
+
+    runs = max(1, args.reports)
+    previous = time_calls(gen._styles.__wrapped__, runs)
+    current = time_calls(gen._styles, runs)
+    print(f'{"styles":<8} {previous / runs * 1e3:>9.2f} ms {current / runs * 1e3:>9.2f} ms   per report')
+
+    previous = time_calls(previous_row_styles, args.rows)
+    current = time_calls(current_row_styles, args.rows)
+    print(f'{"rows":<8} {previous * 1e3:>9.1f} ms {current * 1e3:>9.1f} ms   for {args.rows} table rows')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,16 @@
 #!/usr/bin/env python3
 """Semgrep Security Reporter - Python port of the Node.js report generator."""
 
+import argparse
+import contextlib
+import io
 import os
+import re
 import sys
+import time
+from concurrent.futures import as_completed
 from datetime import datetime
-from typing import List
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 # Load .env file if present
 try:
@@ -13,30 +19,145 @@ try:
 except ImportError:
     pass
 
-from models import SemgrepProject
-from services import ConfigurationManager, SemgrepApiClient, ScoringEngine
-from pdf import BasicPdfGenerator
+# Only what's needed to read and validate configs is imported up front. The API client
+# (requests), aggregation and the renderers (ReportLab for PDF) are imported by the stage
+# that uses them, so --validate-only and --help start quickly.
+from models import ReportConfiguration, SemgrepProject
+from services import ConfigurationManager, instrumentation
+from renderers import ReportRenderer, available_formats, get_renderer
 
+if TYPE_CHECKING:
+    from services import SemgrepApiClient
 
-def main() -> None:
-    print('Starting Semgrep Security Reporter')
 
-    config_path = sys.argv[1] if len(sys.argv) > 1 else 'config/sample-config.json'
-    print(f'Loading configuration from: {config_path}')
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Generate a Semgrep security report.')
+    parser.add_argument('config_path', nargs='?', default='config/sample-config.json',
+                        help='Path to the report configuration file (default: config/sample-config.json)')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Ignore cached Semgrep API responses and the findings snapshot, and fetch fresh data')
+    parser.add_argument('--batch', metavar='PATH',
+                        help='Generate a report for every config in a directory (*.json) or manifest file '
+                             '(one config path per line); configs for the same organization share one fetch')
+    parser.add_argument('--validate-only', action='store_true',
+                        help='Only load and validate the config (or every --batch config), without fetching '
+                             'or rendering')
+    parser.add_argument('--output-mode', choices=['single', 'per-project'], default='single',
+                        help='Write one combined report (default) or one report per project')
+    parser.add_argument('--formats', metavar='FORMATS',
+                        help=f'Comma-separated output formats, overriding reportConfiguration.outputFormats '
+                             f'({", ".join(available_formats())})')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes for --output-mode per-project and --batch (default: CPU count)')
+    parser.add_argument('--render-workers', type=int, default=1,
+                        help='Lay out sections of the single PDF on this many processes and merge them '
+                             '(requires pypdf; default: 1)')
+    parser.add_argument('--metrics-json', metavar='PATH',
+                        help='Write per-stage timings, request counts, bytes downloaded and peak RSS as JSON')
+    parser.add_argument('--profile', nargs='?', const='cprofile', choices=['cprofile', 'pyinstrument'],
+                        help='Profile the run and write the profile to output/ (default profiler: cprofile)')
+    return parser.parse_args()
 
-    config_manager = ConfigurationManager(config_path)
-    config = config_manager.get_configuration()
 
-    token_status = 'Provided' if config_manager.get_api_token() else 'Using dummy data'
-    print(f'Processing report for: {config.customer.name}')
-    print(f'Organization: {config_manager.get_organization_name()}')
-    print(f'API Token: {token_status}')
+# Set in each worker process by _init_report_worker
+_worker_projects: List[SemgrepProject] = []
+_worker_config: Optional[ReportConfiguration] = None
+_worker_formats: List[str] = []
 
-    api_client = SemgrepApiClient(
-        organization_name=config_manager.get_organization_name(),
-        api_token=config_manager.get_api_token(),
-    )
 
+def _init_report_worker(projects: List[SemgrepProject], config: ReportConfiguration, formats: List[str]) -> None:
+    # Runs once per worker. With fork the fetched data is inherited rather than pickled,
+    # so workers only receive a project index per task.
+    global _worker_projects, _worker_config, _worker_formats
+    _worker_projects = projects
+    _worker_config = config
+    _worker_formats = formats
+
+
+def _generate_project_report(index: int, output_base: str) -> Tuple[int, str, float, Optional[str]]:
+    from services import ReportAggregates
+
+    started = time.perf_counter()
+    project = _worker_projects[index]
+    outputs = []
+    try:
+        # Keep per-report progress output from interleaving across workers
+        with contextlib.redirect_stdout(io.StringIO()):
+            aggregates = ReportAggregates([project])
+            for format_name in _worker_formats:
+                renderer = get_renderer(format_name)
+                outputs.append(renderer.generate_report([project], _worker_config,
+                                                        output_base + renderer.extension, aggregates))
+        error = None
+    except Exception as e:
+        error = str(e)
+    return index, ', '.join(outputs), time.perf_counter() - started, error
+
+
+def resolve_formats(config: ReportConfiguration, override: Optional[str] = None) -> List[str]:
+    """The config's outputFormats, or the comma-separated `override` from --formats."""
+    formats = override.split(',') if override else config.report_configuration.output_formats
+    return [f.strip().upper() for f in formats if f.strip()]
+
+
+def _slug(name: str, default: str) -> str:
+    return re.sub(r'[^a-z0-9_.-]+', '-', name.lower()).strip('-.') or default
+
+
+def _project_file_name(project: SemgrepProject, used: set) -> str:
+    slug = _slug(project.name, 'project')
+    if slug in used and project.project_id:
+        slug = f'{slug}-{project.project_id}'
+    base, n = slug, 2
+    while slug in used:
+        slug = f'{base}-{n}'
+        n += 1
+    used.add(slug)
+    return f'semgrep-report-{slug}'
+
+
+def generate_per_project_reports(projects: List[SemgrepProject], config: ReportConfiguration,
+                                 output_dir: str, workers: Optional[int] = None,
+                                 formats: Optional[List[str]] = None) -> None:
+    """
+    Generates one report per project, in each of `formats` (default: PDF), on a process pool
+    and prints an index of the outputs.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    formats = formats or ['PDF']
+    os.makedirs(output_dir, exist_ok=True)
+    used: set = set()
+    output_paths = [os.path.join(output_dir, _project_file_name(p, used)) for p in projects]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(projects) or 1))
+    print(f'Generating {len(projects)} project reports with {workers} worker(s)...')
+
+    started = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_report_worker,
+                             initargs=(projects, config, formats)) as pool:
+        futures = [pool.submit(_generate_project_report, i, path) for i, path in enumerate(output_paths)]
+        for done, future in enumerate(as_completed(futures), 1):
+            index, path, seconds, error = future.result()
+            results.append((index, path, seconds, error))
+            status = f'failed: {error}' if error else f'{seconds:.1f}s'
+            print(f'  [{done}/{len(projects)}] {projects[index].name} ({status})')
+    elapsed = time.perf_counter() - started
+
+    print('\nReport index:')
+    name_width = max((len(p.name) for p in projects), default=7)
+    print(f'  {"Project":<{name_width}}  {"Findings":>8}  {"Seconds":>7}  Output')
+    for index, path, seconds, error in sorted(results):
+        project = projects[index]
+        output = f'FAILED: {error}' if error else path
+        print(f'  {project.name:<{name_width}}  {len(project.findings):>8}  {seconds:>7.1f}  {output}')
+    failed = sum(1 for r in results if r[3])
+    total_seconds = sum(r[2] for r in results)
+    print(f'\n{len(results) - failed} of {len(results)} reports generated in {elapsed:.1f}s '
+          f'({total_seconds:.1f}s of report time across workers)')
+
+
+def fetch_projects(api_client: 'SemgrepApiClient', config_manager: ConfigurationManager) -> List[SemgrepProject]:
     projects: List[SemgrepProject] = []
     project_configs = config_manager.get_projects()
 
@@ -81,6 +202,9 @@ def main() -> None:
 
     else:
         print(f'Fetching data for {len(project_configs)} project(s):')
+        project_ids = [p.semgrep_project_id for p in project_configs]
+        api_client.fetch_project_details_many(project_ids)
+        api_client.prefetch_scan_coverage(project_ids)
         for project_config in project_configs:
             print(f'  - Processing project: {project_config.semgrep_project_id}')
             project = api_client.fetch_project_findings(project_config.semgrep_project_id)
@@ -88,38 +212,361 @@ def main() -> None:
             open_count = sum(1 for f in project.findings if f.status == 'Open')
             print(f'    Found {len(project.findings)} findings ({open_count} open)')
 
-    total_findings = sum(len(p.findings) for p in projects)
-    open_findings = sum(
-        sum(1 for f in p.findings if f.status == 'Open') for p in projects
+    return projects
+
+
+def create_api_client(config_manager: ConfigurationManager, refresh: bool = False) -> 'SemgrepApiClient':
+    """A SemgrepApiClient for the config's organization, with its apiSettings applied."""
+    from services import SemgrepApiClient, DiskCache, FindingsSnapshot
+
+    api_settings = config_manager.get_api_settings()
+    disk_cache = None
+    if api_settings.cache.enabled:
+        disk_cache = DiskCache(
+            directory=api_settings.cache.directory,
+            ttl_seconds=api_settings.cache.ttl_minutes * 60,
+            max_bytes=api_settings.cache.max_size_mb * 1024 * 1024,
+            refresh=refresh,
+        )
+        print(f'API cache: {disk_cache.directory}{" (refreshing)" if refresh else ""}')
+
+    findings_snapshot = None
+    if api_settings.incremental_sync.enabled:
+        findings_snapshot = FindingsSnapshot(
+            directory=api_settings.incremental_sync.directory,
+            organization_name=config_manager.get_organization_name(),
+            full_sync_interval_seconds=api_settings.incremental_sync.full_sync_interval_days * 86400,
+            refresh=refresh,
+        )
+        print(f'Incremental sync snapshot: {findings_snapshot.findings_path}')
+
+    return SemgrepApiClient(
+        organization_name=config_manager.get_organization_name(),
+        api_token=config_manager.get_api_token(),
+        page_concurrency=api_settings.page_concurrency,
+        lookup_concurrency=api_settings.lookup_concurrency,
+        scan_coverage_mode=api_settings.scan_coverage_mode,
+        request_timeout=api_settings.request_timeout_seconds,
+        max_retries=api_settings.max_retries,
+        disk_cache=disk_cache,
+        findings_snapshot=findings_snapshot,
     )
+
+
+def run(args: argparse.Namespace) -> None:
+    print('Starting Semgrep Security Reporter')
+
+    config_path = args.config_path
+    print(f'Loading configuration from: {config_path}')
+
+    config_manager = ConfigurationManager(config_path)
+    config = config_manager.get_configuration()
+
+    # Resolve the output formats before fetching, so a typo fails fast
+    formats = resolve_formats(config, args.formats)
+    renderers: List[ReportRenderer] = [get_renderer(f) for f in formats]
+
+    token_status = 'Provided' if config_manager.get_api_token() else 'Using dummy data'
+    print(f'Processing report for: {config.customer.name}')
+    print(f'Organization: {config_manager.get_organization_name()}')
+    print(f'API Token: {token_status}')
+
+    api_client = create_api_client(config_manager, args.refresh)
+
+    with instrumentation.stage('fetch'):
+        projects = fetch_projects(api_client, config_manager)
+
+    from services import ReportAggregates, ScoringEngine
+
+    scoring_engine = ScoringEngine()
+    with instrumentation.stage('score'):
+        aggregates = ReportAggregates(projects, scoring_engine)
+
+    total_findings = sum(len(p.findings) for p in projects)
+    open_findings = aggregates.totals.open_count
     print(f'\nOverall Statistics:')
     print(f'  - Total Findings: {total_findings}')
     print(f'  - Open Findings: {open_findings}')
     print(f'  - Fixed/Ignored: {total_findings - open_findings}')
 
-    scoring_engine = ScoringEngine()
     print('\nSecurity Levels:')
-    for project in projects:
-        level = int(scoring_engine.calculate_semgrep_level(project))
-        score = scoring_engine.calculate_security_score(project.findings)
-        print(f'  - {project.name}: SL{level} (Score: {score})')
+    for aggregate in aggregates.projects:
+        print(f'  - {aggregate.project.name}: SL{int(aggregate.level)} (Score: {aggregate.score})')
 
-    print('\nGenerating PDF report...')
     timestamp = datetime.now().strftime('%Y-%m-%dT%H-%M-%S')
     safe_name = config.customer.name.lower().replace(' ', '-')
-    output_path = os.path.join('output', f'semgrep-report-{safe_name}-{timestamp}.pdf')
 
-    pdf_generator = BasicPdfGenerator()
-    generated_path = pdf_generator.generate_report(projects, config, output_path)
+    if args.output_mode == 'per-project':
+        print(f'\nGenerating per-project {"/".join(formats)} reports...')
+        output_dir = os.path.join('output', f'semgrep-reports-{safe_name}-{timestamp}')
+        with instrumentation.stage('render'):
+            generate_per_project_reports(projects, config, output_dir, args.workers, formats)
+        print('\nReport generation complete!')
+        print(f'Reports saved to: {output_dir}')
+    else:
+        generated_paths = []
+        with instrumentation.stage('render'):
+            for renderer in renderers:
+                output_path = os.path.join('output', f'semgrep-report-{safe_name}-{timestamp}{renderer.extension}')
+                # Section-parallel layout only applies to the PDF
+                options = {'render_workers': args.render_workers} if renderer.format_name == 'PDF' else {}
+                with instrumentation.stage(renderer.format_name.lower()):
+                    generated_paths.append(renderer.generate_report(projects, config, output_path, aggregates,
+                                                                    **options))
 
-    print('\nReport generation complete!')
-    print(f'Report saved to: {generated_path}')
+        print('\nReport generation complete!')
+        for generated_path in generated_paths:
+            print(f'Report saved to: {generated_path}')
     print('\nNext steps:')
-    print('  - Review the generated PDF report')
+    print('  - Review the generated report(s)')
     print('  - Share with stakeholders')
     print('  - Begin remediation of critical and high severity findings')
 
 
+# Set in each worker process by _init_batch_worker
+_batch_jobs: List[dict] = []
+
+
+def _init_batch_worker(jobs: List[dict]) -> None:
+    global _batch_jobs
+    _batch_jobs = jobs
+
+
+def _render_batch_report(index: int) -> Tuple[int, List[str], float, Optional[str]]:
+    from services import ReportAggregates
+
+    job = _batch_jobs[index]
+    started = time.perf_counter()
+    outputs = []
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            aggregates = ReportAggregates(job['projects'])
+            for format_name in job['formats']:
+                renderer = get_renderer(format_name)
+                outputs.append(renderer.generate_report(job['projects'], job['config'],
+                                                        job['output_base'] + renderer.extension, aggregates))
+        error = None
+    except Exception as e:
+        error = str(e)
+    return index, outputs, time.perf_counter() - started, error
+
+
+def read_batch_manifest(path: str) -> List[str]:
+    """
+    Config paths for --batch: every *.json file in a directory, or the paths listed one per
+    line in a manifest file (relative to the manifest; blank lines and # comments ignored).
+    """
+    if os.path.isdir(path):
+        return [os.path.join(path, name) for name in sorted(os.listdir(path)) if name.endswith('.json')]
+    base = os.path.dirname(os.path.abspath(path))
+    with open(path) as f:
+        lines = [line.split('#', 1)[0].strip() for line in f]
+    return [os.path.join(base, line) for line in lines if line]
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    """
+    Generates one combined report per config listed by `args.batch`. Configs are grouped by
+    organization (and API token) so each org's findings are fetched once, and each org's
+    reports are rendered on a pool of `args.workers` processes before the next org is
+    fetched. Returns the number of configs that failed.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from services import SemgrepApiClient
+
+    print('Starting Semgrep Security Reporter (batch mode)')
+    config_paths = read_batch_manifest(args.batch)
+    timestamp = datetime.now().strftime('%Y-%m-%dT%H-%M-%S')
+    output_dir = os.path.join('output', f'semgrep-batch-{timestamp}')
+    os.makedirs(output_dir, exist_ok=True)
+    print(f'Loading {len(config_paths)} configuration(s) from: {args.batch}')
+
+    started = time.perf_counter()
+    results: List[dict] = []
+    groups: Dict[Tuple[str, Optional[str]], List[dict]] = {}
+    used: set = set()
+    with instrumentation.stage('load'):
+        for path in config_paths:
+            result = {'path': path, 'name': os.path.basename(path), 'org': '', 'projects': 0, 'findings': 0,
+                      'fetch': 0.0, 'render': 0.0, 'outputs': [], 'error': None}
+            results.append(result)
+            try:
+                config_manager = ConfigurationManager(path)
+                formats = resolve_formats(config_manager.get_configuration(), args.formats)
+                for format_name in formats:
+                    get_renderer(format_name)
+            except Exception as e:
+                result['error'] = f'config: {e}'
+                continue
+            result.update(manager=config_manager, formats=formats, org=config_manager.get_organization_name())
+            base = _slug(os.path.splitext(os.path.basename(path))[0], 'report')
+            slug, n = base, 2
+            while slug in used:
+                slug = f'{base}-{n}'
+                n += 1
+            used.add(slug)
+            result['output_base'] = os.path.join(output_dir, f'semgrep-report-{slug}')
+            key = (config_manager.get_organization_name(), config_manager.get_api_token())
+            groups.setdefault(key, []).append(result)
+
+    done = 0
+    for result in results:
+        if result['error']:
+            done += 1
+            print(f'  [{done}/{len(results)}] {result["name"]}: FAILED ({result["error"]})')
+    for (org, _token), members in groups.items():
+        print(f'\nOrganization {org}: {len(members)} config(s)')
+        with instrumentation.stage(f'org.{org}'):
+            # apiSettings (cache, incremental sync, concurrency) come from the org's first config
+            try:
+                api_client = create_api_client(members[0]['manager'], args.refresh)
+            except Exception as e:
+                api_client = None
+                for result in members:
+                    result['error'] = f'client: {e}'
+            jobs: List[dict] = []
+            if api_client is not None:
+                with instrumentation.stage('fetch'):
+                    for result in members:
+                        fetch_started = time.perf_counter()
+                        try:
+                            projects = fetch_projects(api_client, result['manager'])
+                        except Exception as e:
+                            result['error'] = f'fetch: {e}'
+                            continue
+                        finally:
+                            result['fetch'] = time.perf_counter() - fetch_started
+                        result['projects'] = len(projects)
+                        result['findings'] = sum(len(p.findings) for p in projects)
+                        result['job'] = len(jobs)
+                        jobs.append({'config': result['manager'].get_configuration(), 'projects': projects,
+                                     'formats': result['formats'], 'output_base': result['output_base']})
+
+            with instrumentation.stage('render'):
+                workers = max(1, min(args.workers or os.cpu_count() or 1, len(jobs) or 1))
+                by_job = {r['job']: r for r in members if 'job' in r}
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                         initargs=(jobs,)) as pool:
+                    futures = {pool.submit(_render_batch_report, i): i for i in range(len(jobs))}
+                    for future in as_completed(futures):
+                        try:
+                            index, outputs, seconds, error = future.result()
+                        except Exception as e:
+                            # e.g. BrokenProcessPool when a worker dies; only its jobs fail
+                            index, outputs, seconds, error = futures[future], [], 0.0, str(e) or type(e).__name__
+                        result = by_job[index]
+                        result.update(outputs=outputs, render=seconds)
+                        if error:
+                            result['error'] = f'render: {error}'
+                        done += 1
+                        status = (f'FAILED ({result["error"]})' if result['error'] else
+                                  f'fetch {result["fetch"]:.1f}s, render {seconds:.1f}s')
+                        print(f'  [{done}/{len(results)}] {result["name"]} ({result["org"]}): {status}')
+            for result in members:
+                if 'job' not in result:
+                    done += 1
+                    print(f'  [{done}/{len(results)}] {result["name"]} ({result["org"]}): FAILED ({result["error"]})')
+        SemgrepApiClient.release_organization(org)
+    elapsed = time.perf_counter() - started
+
+    print('\nBatch index:')
+    name_width = max((len(r['name']) for r in results), default=6)
+    org_width = max((len(r['org']) for r in results), default=12)
+    print(f'  {"Config":<{name_width}}  {"Organization":<{org_width}}  {"Projects":>8}  {"Findings":>8}  '
+          f'{"Fetch s":>7}  {"Render s":>8}  Output')
+    for r in results:
+        output = f'FAILED: {r["error"]}' if r['error'] else ', '.join(r['outputs'])
+        print(f'  {r["name"]:<{name_width}}  {r["org"]:<{org_width}}  {r["projects"]:>8}  {r["findings"]:>8}  '
+              f'{r["fetch"]:>7.1f}  {r["render"]:>8.1f}  {output}')
+    failed = sum(1 for r in results if r['error'])
+    print(f'\n{len(results) - failed} of {len(results)} configs reported in {elapsed:.1f}s '
+          f'({len(groups)} organization fetch(es))')
+    print(f'Reports saved to: {output_dir}')
+    return failed
+
+
+def validate_configs(config_paths: List[str], formats_override: Optional[str] = None) -> int:
+    """
+    Loads and validates each config, including its output formats, and prints one line per
+    config. Nothing is fetched or rendered. Returns the number of invalid configs.
+    """
+    invalid = 0
+    for path in config_paths:
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                config_manager = ConfigurationManager(path)
+            unknown = [f for f in resolve_formats(config_manager.get_configuration(), formats_override)
+                       if f not in available_formats()]
+            if unknown:
+                raise ValueError(f'Unknown output format(s): {", ".join(unknown)}')
+        except Exception as e:
+            invalid += 1
+            print(f'  INVALID  {path}: {e}')
+            continue
+        print(f'  OK       {path} ({config_manager.get_customer_name()}, '
+              f'org {config_manager.get_organization_name()})')
+    print(f'\n{len(config_paths) - invalid} of {len(config_paths)} configuration(s) valid')
+    return invalid
+
+
+def _start_profiler(kind: str):
+    if kind == 'pyinstrument':
+        try:
+            from pyinstrument import Profiler
+            profiler = Profiler()
+            profiler.start()
+            return profiler
+        except ImportError:
+            print('Warning: pyinstrument is not installed, falling back to cProfile')
+    import cProfile
+    profiler = cProfile.Profile()
+    profiler.enable()
+    return profiler
+
+
+def _stop_profiler(profiler) -> None:
+    timestamp = datetime.now().strftime('%Y-%m-%dT%H-%M-%S')
+    os.makedirs('output', exist_ok=True)
+    if hasattr(profiler, 'output_html'):
+        profiler.stop()
+        path = os.path.join('output', f'profile-{timestamp}.html')
+        with open(path, 'w') as f:
+            f.write(profiler.output_html())
+    else:
+        import pstats
+        profiler.disable()
+        path = os.path.join('output', f'profile-{timestamp}.prof')
+        profiler.dump_stats(path)
+        print('\nTop functions by cumulative time:')
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(15)
+    print(f'Profile saved to: {path}')
+
+
+def main() -> None:
+    args = parse_args()
+    profiler = _start_profiler(args.profile) if args.profile else None
+    failed = 0
+    try:
+        if args.validate_only:
+            failed = validate_configs(read_batch_manifest(args.batch) if args.batch else [args.config_path],
+                                      args.formats)
+        elif args.batch:
+            failed = run_batch(args)
+        else:
+            run(args)
+    finally:
+        if profiler:
+            _stop_profiler(profiler)
+
+    if not args.validate_only:
+        instrumentation.print_summary()
+    if args.metrics_json:
+        instrumentation.write_json(args.metrics_json)
+        print(f'Metrics saved to: {args.metrics_json}')
+    if failed:
+        raise SystemExit(1)
+
+
 if __name__ == '__main__':
     try:
         main()
@@ -1,5 +1,5 @@
 from .semgrep_finding import (
-    SemgrepFinding, SemgrepProject, ScanMetadata,
+    SemgrepFinding, SemgrepProject, ScanMetadata, RuleText,
     BusinessCriticality, SemgrepLevel
 )
 from .report_configuration import (
@@ -7,15 +7,17 @@ from .report_configuration import (
     ApplicationSettings, ReportConfigSettings, IncludeSections,
     SeverityThresholds, BrandingSettings, SemgrepConfiguration,
     RequiredScans, IntegrationSettings, EmailReporting,
-    OrganizationSettings, RepositoryReferenceMapping
+    OrganizationSettings, RepositoryReferenceMapping, ApiSettings,
+    CacheSettings, IncrementalSyncSettings, RenderBudget
 )
 
 __all__ = [
-    'SemgrepFinding', 'SemgrepProject', 'ScanMetadata',
+    'SemgrepFinding', 'SemgrepProject', 'ScanMetadata', 'RuleText',
     'BusinessCriticality', 'SemgrepLevel',
     'ReportConfiguration', 'CustomerInfo', 'ProjectSettings',
     'ApplicationSettings', 'ReportConfigSettings', 'IncludeSections',
     'SeverityThresholds', 'BrandingSettings', 'SemgrepConfiguration',
     'RequiredScans', 'IntegrationSettings', 'EmailReporting',
-    'OrganizationSettings', 'RepositoryReferenceMapping',
+    'OrganizationSettings', 'RepositoryReferenceMapping', 'ApiSettings',
+    'CacheSettings', 'IncrementalSyncSettings', 'RenderBudget',
 ]
@@ -56,6 +56,15 @@ class RepositoryReferenceMapping:
     external_mapping_file: Optional[str] = None
 
 
+@dataclass
+class RenderBudget:
+    # None means no limit; overflow is summarized as counts with a dashboard link
+    max_rule_pages_per_project: Optional[int] = None
+    max_instances_per_rule: int = 3
+    max_owasp_pages_per_category: Optional[int] = None
+    sidecar_format: Optional[str] = None  # 'csv' or 'jsonl': every open finding, written next to the PDF
+
+
 @dataclass
 class ReportConfigSettings:
     include_sections: IncludeSections
@@ -66,6 +75,7 @@ class ReportConfigSettings:
     findings_detail_level: str = 'standard'
     include_dashboard_links: bool = True
     repository_reference_mapping: Optional[RepositoryReferenceMapping] = None
+    render_budget: RenderBudget = field(default_factory=RenderBudget)
 
 
 @dataclass
@@ -102,6 +112,32 @@ class OrganizationSettings:
     api_token: str = ''
 
 
+@dataclass
+class CacheSettings:
+    enabled: bool = False
+    directory: str = './.semgrep-report-cache'
+    ttl_minutes: int = 720
+    max_size_mb: int = 512
+
+
+@dataclass
+class IncrementalSyncSettings:
+    enabled: bool = False
+    directory: str = './.semgrep-report-cache/snapshots'
+    full_sync_interval_days: int = 7
+
+
+@dataclass
+class ApiSettings:
+    page_concurrency: int = 4
+    lookup_concurrency: int = 8
+    scan_coverage_mode: str = 'per-repo'  # 'per-repo' or 'sweep'
+    request_timeout_seconds: int = 300
+    max_retries: int = 5
+    cache: CacheSettings = field(default_factory=CacheSettings)
+    incremental_sync: IncrementalSyncSettings = field(default_factory=IncrementalSyncSettings)
+
+
 @dataclass
 class ReportConfiguration:
     customer: CustomerInfo
@@ -111,3 +147,4 @@ class ReportConfiguration:
     semgrep_configuration: SemgrepConfiguration
     integration_settings: IntegrationSettings
     organization_settings: Optional[OrganizationSettings] = None
+    api_settings: ApiSettings = field(default_factory=ApiSettings)
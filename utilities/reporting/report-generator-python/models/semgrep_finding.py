@@ -1,6 +1,7 @@
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, List, Optional, Tuple
 from enum import IntEnum
 
 
@@ -20,28 +21,129 @@ class SemgrepLevel(IntEnum):
     SL5 = 5  # 0 Critical, 0 High + score >=90 (Veracode VL compliant)
 
 
-@dataclass
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if type(value) is str else value
+
+
+class RuleText:
+    """
+    Shared table of per-rule text (message, description, recommendation).
+
+    These strings are identical for every finding of a rule, so each distinct triple is
+    stored once and findings keep a reference to it instead of their own copies.
+    """
+
+    _table: Dict[Tuple[str, str, Optional[str]], Tuple[str, str, Optional[str]]] = {}
+
+    @classmethod
+    def get(cls, message: str, description: str,
+            recommendation: Optional[str]) -> Tuple[str, str, Optional[str]]:
+        key = (message, description, recommendation)
+        return cls._table.setdefault(key, key)
+
+    @classmethod
+    def size(cls) -> int:
+        return len(cls._table)
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._table.clear()
+
+
 class SemgrepFinding:
-    id: str
-    rule_id: str
-    rule_name: str
-    path: str
-    start_line: int
-    severity: str  # 'Critical', 'High', 'Medium', 'Low'
-    message: str
-    description: str
-    category: str
-    found_at: datetime
-    status: str  # 'Open', 'Fixed', 'Ignored'
-    project_name: str
-    project_id: str
-    exploitability_score: int  # 1-5
-    remediation_effort: int    # 1-5
-    owasp_category: Optional[str] = None
-    cwe_id: Optional[str] = None
-    cve_id: Optional[str] = None
-    assistant_recommendation: Optional[str] = None
-    triage_state: Optional[str] = None
+    """
+    A single finding. Uses __slots__ rather than a dataclass to keep per-finding memory
+    low for large organizations: repeated short strings are interned and per-rule text
+    lives in the shared RuleText table.
+    """
+
+    __slots__ = (
+        'id', 'rule_id', 'rule_name', 'path', 'start_line', 'severity', '_text',
+        'category', 'found_at', 'status', 'project_name', 'project_id',
+        'exploitability_score', 'remediation_effort', 'owasp_category', 'cwe_id',
+        'cve_id', 'triage_state',
+    )
+
+    def __init__(self, id: str, rule_id: str, rule_name: str, path: str, start_line: int,
+                 severity: str,  # 'Critical', 'High', 'Medium', 'Low'
+                 message: str, description: str, category: str, found_at: datetime,
+                 status: str,  # 'Open', 'Fixed', 'Ignored'
+                 project_name: str, project_id: str,
+                 exploitability_score: int,  # 1-5
+                 remediation_effort: int,    # 1-5
+                 owasp_category: Optional[str] = None,
+                 cwe_id: Optional[str] = None,
+                 cve_id: Optional[str] = None,
+                 assistant_recommendation: Optional[str] = None,
+                 triage_state: Optional[str] = None):
+        self.id = id
+        self.rule_id = _intern(rule_id)
+        self.rule_name = _intern(rule_name)
+        self.path = _intern(path)
+        self.start_line = start_line
+        self.severity = _intern(severity)
+        self._text = RuleText.get(message, description, assistant_recommendation)
+        self.category = _intern(category)
+        self.found_at = found_at
+        self.status = _intern(status)
+        self.project_name = _intern(project_name)
+        self.project_id = _intern(project_id)
+        self.exploitability_score = exploitability_score
+        self.remediation_effort = remediation_effort
+        self.owasp_category = _intern(owasp_category)
+        self.cwe_id = _intern(cwe_id)
+        self.cve_id = _intern(cve_id)
+        self.triage_state = _intern(triage_state)
+
+    @property
+    def message(self) -> str:
+        return self._text[0]
+
+    @message.setter
+    def message(self, value: str) -> None:
+        self._text = RuleText.get(value, self._text[1], self._text[2])
+
+    @property
+    def description(self) -> str:
+        return self._text[1]
+
+    @description.setter
+    def description(self, value: str) -> None:
+        self._text = RuleText.get(self._text[0], value, self._text[2])
+
+    @property
+    def assistant_recommendation(self) -> Optional[str]:
+        return self._text[2]
+
+    @assistant_recommendation.setter
+    def assistant_recommendation(self, value: Optional[str]) -> None:
+        self._text = RuleText.get(self._text[0], self._text[1], value)
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._values() == other._values()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (f'SemgrepFinding(id={self.id!r}, rule_id={self.rule_id!r}, path={self.path!r}, '
+                f'start_line={self.start_line!r}, severity={self.severity!r}, '
+                f'status={self.status!r}, project_name={self.project_name!r})')
+
+    def __getstate__(self) -> tuple:
+        return self._values()
+
+    def __setstate__(self, state: tuple) -> None:
+        for name, value in zip(self.__slots__, state):
+            if name == '_text':
+                value = RuleText.get(*value)
+            elif type(value) is str:
+                value = sys.intern(value)
+            object.__setattr__(self, name, value)
 
 
 @dataclass
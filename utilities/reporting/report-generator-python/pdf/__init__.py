@@ -1,3 +1,12 @@
-from .basic_pdf_generator import BasicPdfGenerator
+import importlib
 
 __all__ = ['BasicPdfGenerator']
+
+
+def __getattr__(name: str):
+    # ReportLab is only imported once a PDF is actually generated (PEP 562)
+    if name != 'BasicPdfGenerator':
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = importlib.import_module('.basic_pdf_generator', __name__).BasicPdfGenerator
+    globals()[name] = value
+    return value
@@ -1,7 +1,13 @@
+import contextlib
+import functools
+import io
 import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
 import urllib.parse
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from xml.sax.saxutils import escape as xml_escape
 
 from reportlab.lib import colors
@@ -9,6 +15,7 @@ from reportlab.lib.colors import HexColor
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import mm
+from reportlab.lib.utils import ImageReader
 from reportlab.platypus import (
     BaseDocTemplate, Frame, PageTemplate, Paragraph, Spacer,
     Table, TableStyle, HRFlowable, PageBreak, KeepTogether, Image,
@@ -18,6 +25,18 @@ from reportlab.platypus.flowables import Flowable
 
 from models import SemgrepProject, SemgrepFinding, ReportConfiguration, SemgrepLevel
 from services.scoring_engine import ScoringEngine
+from services.instrumentation import instrumentation
+from services.report_aggregates import (
+    ReportAggregates, ProjectAggregate, SEVERITIES, SEVERITY_ORDER, OWASP_DISPLAY_NAMES,
+    group_findings_by_rule
+)
+from services.findings_export import sidecar_path, write_findings_sidecar
+from renderers.base import ReportRenderer
+
+try:
+    from pypdf import PdfWriter
+except ImportError:
+    PdfWriter = None
 
 # ─── Color constants ─────────────────────────────────────────────────────────
 GREEN = HexColor('#00A86B')
@@ -43,6 +62,14 @@ FOOTER_HEIGHT = 30
 MARGIN = 30
 CONTENT_WIDTH = PAGE_WIDTH - 2 * MARGIN
 
+# Sections rendered together as the first part when rendering in parallel; every later
+# section (OWASP Top 10, each project block, the roadmap) is rendered as a part of its own.
+FRONT_MATTER_SECTIONS = ('cover', 'executive_summary', 'methodology', 'projects_included', 'scan_summary')
+# OWASP categories with more detail pages than this are split across several parts
+PARALLEL_PART_PAGES = 50
+
+OWASP_FINDINGS_PER_PAGE = 12  # rows that comfortably fit on one A4 page
+
 SEVERITY_COLORS = {
     'Critical': RED,
     'High': ORANGE,
@@ -63,33 +90,6 @@ OWASP_URLS = {
     'server-side-request-forgery': 'https://owasp.org/Top10/A10_2021-Server-Side_Request_Forgery/',
 }
 
-OWASP_DISPLAY_NAMES = {
-    'broken-access-control': 'OWASP Top Ten 2021 Category A01 - Broken Access Control',
-    'cryptographic-failures': 'OWASP Top Ten 2021 Category A02 - Cryptographic Failures',
-    'injection': 'OWASP Top Ten 2021 Category A03 - Injection',
-    'insecure-design': 'OWASP Top Ten 2021 Category A04 - Insecure Design',
-    'security-misconfiguration': 'OWASP Top Ten 2021 Category A05 - Security Misconfiguration',
-    'vulnerable-components': 'OWASP Top Ten 2021 Category A06 - Vulnerable and Outdated Components',
-    'identification-authentication-failures': 'OWASP Top Ten 2021 Category A07 - Identification and Authentication Failures',
-    'software-data-integrity-failures': 'OWASP Top Ten 2021 Category A08 - Software and Data Integrity Failures',
-    'security-logging-monitoring-failures': 'OWASP Top Ten 2021 Category A09 - Security Logging and Monitoring Failures',
-    'server-side-request-forgery': 'OWASP Top Ten 2021 Category A10 - Server-Side Request Forgery',
-}
-
-# Canonical OWASP 2021 ordering used for sorting and display
-OWASP_CATEGORY_ORDER = [
-    'broken-access-control',
-    'cryptographic-failures',
-    'injection',
-    'insecure-design',
-    'security-misconfiguration',
-    'vulnerable-components',
-    'identification-authentication-failures',
-    'software-data-integrity-failures',
-    'security-logging-monitoring-failures',
-    'server-side-request-forgery',
-]
-
 # Short labels for the summary table (A01 … A10)
 OWASP_SHORT_LABELS = {
     'broken-access-control': 'A01',
@@ -141,6 +141,20 @@ class ColorRect(Flowable):
         return availWidth, self.height
 
 
+class SectionMarker(Flowable):
+    """Zero-size flowable recording when layout reaches a report section, for per-section timings."""
+    def __init__(self, name: str, marks: List[Tuple[str, float]]):
+        super().__init__()
+        self.name = name
+        self.marks = marks
+
+    def wrap(self, availWidth, availHeight):
+        return 0, 0
+
+    def draw(self):
+        self.marks.append((self.name, time.perf_counter()))
+
+
 class SeverityBar(Flowable):
     """Horizontal bar chart row for a single severity level."""
     def __init__(self, label: str, count: int, max_count: int,
@@ -197,6 +211,7 @@ class SeverityBar(Flowable):
 
 # ─── Header/footer drawing helpers ────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=None)
 def _get_asset_path(filename: str) -> Optional[str]:
     """Find an asset file, looking in the sibling report-generator/assets directory."""
     script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -211,6 +226,23 @@ def _get_asset_path(filename: str) -> Optional[str]:
     return None
 
 
+@functools.lru_cache(maxsize=None)
+def _logo_image() -> Optional[ImageReader]:
+    """The Semgrep logo, decoded once per process and shared by every page of every report."""
+    logo_path = _get_asset_path('semgrep-logo.png')
+    if not logo_path:
+        return None
+    try:
+        image = ImageReader(logo_path)
+        image.getRGBData()  # decode now so a bad file falls back to text here, not mid-page
+        return image
+    except Exception:
+        return None
+
+
+LOGO_FORM = 'semgrepLogo'
+
+
 def _draw_header(canvas, doc, title: str = 'Application Security Report'):
     canvas.saveState()
     # Green header bar
@@ -222,15 +254,19 @@ def _draw_header(canvas, doc, title: str = 'Application Security Report'):
     canvas.setFillColor(colors.white)
     canvas.drawString(MARGIN, PAGE_HEIGHT - HEADER_HEIGHT + 20, title)
 
-    # Semgrep logo
-    logo_path = _get_asset_path('semgrep-logo.png')
-    if logo_path:
-        try:
-            canvas.drawImage(logo_path, PAGE_WIDTH - 110, PAGE_HEIGHT - HEADER_HEIGHT + 10,
+    # Semgrep logo, drawn into a form XObject on a document's first page and reused on
+    # the rest, so the image is embedded once and not re-hashed for every page
+    logo = _logo_image()
+    if logo:
+        if not canvas.hasForm(LOGO_FORM):
+            canvas.beginForm(LOGO_FORM)
+            canvas.drawImage(logo, PAGE_WIDTH - 110, PAGE_HEIGHT - HEADER_HEIGHT + 10,
                              width=90, height=35, preserveAspectRatio=True, mask='auto')
-        except Exception:
-            canvas.setFont('Helvetica-Bold', 14)
-            canvas.drawRightString(PAGE_WIDTH - MARGIN, PAGE_HEIGHT - HEADER_HEIGHT + 20, 'Semgrep')
+            canvas.endForm()
+        canvas.doForm(LOGO_FORM)
+    else:
+        canvas.setFont('Helvetica-Bold', 14)
+        canvas.drawRightString(PAGE_WIDTH - MARGIN, PAGE_HEIGHT - HEADER_HEIGHT + 20, 'Semgrep')
 
     canvas.restoreState()
 
@@ -243,15 +279,50 @@ def _draw_footer(canvas, doc, footer_text: str):
     canvas.restoreState()
 
 
+def _make_page_template(page_title: str, footer_text: str) -> PageTemplate:
+    frame = Frame(
+        MARGIN, FOOTER_HEIGHT + 5,
+        PAGE_WIDTH - 2 * MARGIN,
+        PAGE_HEIGHT - HEADER_HEIGHT - FOOTER_HEIGHT - 10,
+        leftPadding=0, rightPadding=0, topPadding=10, bottomPadding=0,
+    )
+
+    def on_page(canvas, doc):
+        _draw_header(canvas, doc, page_title)
+        _draw_footer(canvas, doc, footer_text)
+
+    return PageTemplate(id=page_title[:20], frames=[frame], onPage=on_page)
+
+
+def _build_document(story: list, output_path: str, footer_text: str) -> int:
+    """Lays out `story` into `output_path` with the report's header and footer; returns the page count."""
+    doc = BaseDocTemplate(
+        output_path,
+        pagesize=A4,
+        leftMargin=MARGIN,
+        rightMargin=MARGIN,
+        topMargin=HEADER_HEIGHT + 5,
+        bottomMargin=FOOTER_HEIGHT + 10,
+    )
+    doc.addPageTemplates([_make_page_template('Application Security Report', footer_text)])
+    doc.build(story)
+    return doc.page
+
+
 # ─── Style helpers ────────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=None)
 def _styles():
+    """Paragraph styles, built once per process; treat the returned dict as read-only."""
     base = getSampleStyleSheet()
     styles = {}
 
     def s(name, parent='Normal', **kw):
         styles[name] = ParagraphStyle(name, parent=base[parent], **kw)
 
+    def p(name, **kw):
+        styles[name] = ParagraphStyle(name, **kw)
+
     s('SectionTitle', fontSize=20, textColor=GREEN, fontName='Helvetica-Bold', spaceAfter=10)
     s('SubTitle', fontSize=16, textColor=DARK_GRAY, fontName='Helvetica-Bold', spaceAfter=8)
     s('GreenSubTitle', fontSize=14, textColor=GREEN, fontName='Helvetica-Bold', spaceAfter=6)
@@ -279,6 +350,31 @@ def _styles():
     s('High', fontSize=9, fontName='Helvetica-Bold', textColor=ORANGE)
     s('Medium', fontSize=9, fontName='Helvetica-Bold', textColor=YELLOW)
     s('Low', fontSize=9, fontName='Helvetica-Bold', textColor=HexColor('#28A745'))
+
+    # Priority finding cards
+    p('FindingMeta', fontSize=8, textColor=GRAY, leading=12, spaceAfter=2)
+    p('FindingRule', fontSize=8, fontName='Helvetica-Bold', textColor=BLUE, leading=11, spaceAfter=2)
+    p('FindingPath', fontSize=7, fontName='Courier', textColor=GRAY, leading=10, spaceAfter=2)
+    p('FindingRecommendation', fontSize=7, fontName='Helvetica-Oblique', textColor=BLUE,
+      leading=10, spaceAfter=2)
+    p('FindingView', fontSize=6, textColor=BLUE, alignment=2)  # right
+
+    # Per-rule detail pages
+    p('DetailTitle', fontSize=18, fontName='Helvetica-Bold', textColor=GREEN, spaceAfter=10)
+    p('DetailRule', fontSize=11, fontName='Helvetica-Bold', textColor=BLUE)
+    p('DetailLocation', fontName='Courier', fontSize=10, textColor=GRAY, leading=13)
+    p('DetailMore', fontSize=10, fontName='Helvetica-Oblique', textColor=GRAY)
+    for severity, color in list(SEVERITY_COLORS.items()) + [('Unknown', GRAY)]:
+        p(f'SeverityBand.{severity}', fontName='Helvetica-Bold', fontSize=12, textColor=colors.white,
+          alignment=1, backColor=color, borderPadding=6)
+
+    # OWASP Top 10 detail pages
+    p('OwaspSection', fontSize=14, fontName='Helvetica-Bold', textColor=GREEN, spaceAfter=4)
+    p('OwaspRef', fontSize=9, textColor=GRAY, spaceAfter=6)
+    p('OwaspRuleCell', fontSize=8, textColor=BLUE, leading=11)
+    p('OwaspMessageCell', fontSize=8, leading=11, textColor=DARK_GRAY)
+    p('OwaspCweCell', fontSize=8, textColor=BLUE)
+    p('OwaspCweEmpty', fontSize=8, textColor=GRAY)
     return styles
 
 
@@ -302,7 +398,10 @@ def _make_table(data, col_widths, style_cmds=None):
 
 # ─── Main generator class ──────────────────────────────────────────────────────
 
-class BasicPdfGenerator:
+class BasicPdfGenerator(ReportRenderer):
+    format_name = 'PDF'
+    extension = '.pdf'
+
     def __init__(self):
         self._scoring = ScoringEngine()
         self._styles = _styles()
@@ -314,7 +413,14 @@ class BasicPdfGenerator:
         projects: List[SemgrepProject],
         config: ReportConfiguration,
         output_path: str,
+        aggregates: Optional[ReportAggregates] = None,
+        render_workers: int = 1,
     ) -> str:
+        """
+        Renders the report to `output_path`. With `render_workers` > 1 (and pypdf installed)
+        the report is split into page-aligned parts that are laid out on a process pool and
+        merged, rather than laid out in one pass.
+        """
         print('Generating professional PDF report...')
 
         now = datetime.now()
@@ -322,83 +428,128 @@ class BasicPdfGenerator:
         formatted_datetime = now.strftime('%m-%d-%Y %H:%M')
         footer_text = f'Generated by Semgrep Reporter  {formatted_datetime}  Confidential'
 
-        all_findings = [f for p in projects for f in p.findings]
-        open_findings = [f for f in all_findings if f.status == 'Open']
-
-        combined_project = _make_combined_project(projects)
-        overall_level = int(self._scoring.calculate_semgrep_level(combined_project))
-        overall_score = self._scoring.calculate_security_score(all_findings)
+        # One pass over every finding; the sections below read counts, scores and
+        # groupings from here instead of re-filtering the findings themselves.
+        if aggregates is None:
+            with instrumentation.stage('aggregate'):
+                aggregates = ReportAggregates(projects, self._scoring)
 
         # Ensure output dir exists
         os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
 
-        # Build page template factory so header/footer are drawn per-page
-        def make_template(page_title: str):
-            frame = Frame(
-                MARGIN, FOOTER_HEIGHT + 5,
-                PAGE_WIDTH - 2 * MARGIN,
-                PAGE_HEIGHT - HEADER_HEIGHT - FOOTER_HEIGHT - 10,
-                leftPadding=0, rightPadding=0, topPadding=10, bottomPadding=0,
-            )
-
-            def on_page(canvas, doc):
-                _draw_header(canvas, doc, page_title)
-                _draw_footer(canvas, doc, footer_text)
-
-            return PageTemplate(id=page_title[:20], frames=[frame], onPage=on_page)
-
-        # Build content story
+        # Full finding detail goes to a sidecar file, so the PDF can stay within its render budget
+        sidecar_format = config.report_configuration.render_budget.sidecar_format
+        if sidecar_format:
+            path = sidecar_path(output_path, sidecar_format)
+            with instrumentation.stage('sidecar'):
+                rows = write_findings_sidecar(
+                    aggregates, path, sidecar_format,
+                    lambda project: self._get_dashboard_url(project.project_id, config) if project.project_id else None,
+                )
+            print(f'Findings sidecar written: {path} ({rows} findings)')
+
+        if render_workers > 1 and PdfWriter is None:
+            print('Warning: pypdf is not installed, rendering the report in a single process')
+        elif render_workers > 1:
+            with instrumentation.stage('build'):
+                self._render_parallel(projects, aggregates, config, output_path, render_workers,
+                                      formatted_date, formatted_datetime, footer_text)
+            size_mb = os.path.getsize(output_path) / 1024 / 1024
+            print(f'PDF report generated: {output_path} ({size_mb:.2f} MB)')
+            return output_path
+
+        # Build content story. Each section is timed while its flowables are built, and a
+        # SectionMarker at its start lets the layout pass in doc.build be timed per section.
         story = []
-
-        # Cover page
-        story.extend(self._cover_page(projects, config, formatted_date, formatted_datetime,
-                                       overall_level, overall_score))
-        story.append(PageBreak())
-
-        # Executive Summary
-        story.extend(self._executive_summary_page(projects, config, open_findings,
-                                                    overall_level))
-        story.append(PageBreak())
-
-        # Methodology (optional)
-        if config.report_configuration.include_sections.appendix_methodology:
-            story.extend(self._methodology_page())
-            story.append(PageBreak())
-
-        # Projects Included (paginated)
-        story.extend(self._projects_included_pages(projects, config))
-
-        # Scan Summary
-        story.extend(self._scan_summary_page(projects, config))
-        story.append(PageBreak())
-
-        # OWASP Top 10 summary (all open findings grouped by category)
-        story.extend(self._owasp_top10_pages(projects))
-
-        # Individual project pages
-        story.extend(self._individual_project_pages(projects, config))
-
-        # Security Roadmap
-        story.extend(self._security_roadmap_pages(projects, config, open_findings))
-
-        # Create the document
-        doc = BaseDocTemplate(
-            output_path,
-            pagesize=A4,
-            leftMargin=MARGIN,
-            rightMargin=MARGIN,
-            topMargin=HEADER_HEIGHT + 5,
-            bottomMargin=FOOTER_HEIGHT + 10,
-        )
-
-        default_template = make_template('Application Security Report')
-        doc.addPageTemplates([default_template])
-        doc.build(story)
+        marks: List[Tuple[str, float]] = []
+
+        for name, build, args, page_break in self._sections(projects, aggregates, config,
+                                                            formatted_date, formatted_datetime):
+            with instrumentation.stage(f'story.{name}'):
+                story.append(SectionMarker(name, marks))
+                story.extend(build(*args))
+                if page_break:
+                    story.append(PageBreak())
+
+        with instrumentation.stage('build'):
+            _build_document(story, output_path, footer_text)
+            built_at = time.perf_counter()
+            for i, (name, started) in enumerate(marks):
+                ended = marks[i + 1][1] if i + 1 < len(marks) else built_at
+                instrumentation.record(f'layout.{name}', ended - started)
 
         size_mb = os.path.getsize(output_path) / 1024 / 1024
         print(f'PDF report generated: {output_path} ({size_mb:.2f} MB)')
         return output_path
 
+    def _sections(self, projects, aggregates: ReportAggregates, config, formatted_date, formatted_datetime,
+                  split: bool = False) -> List[Tuple[str, Callable, tuple, bool]]:
+        """
+        The report's sections in order, as (name, builder, builder args, page break after).
+        Every section ends on a page boundary, so they can also be laid out separately;
+        `split` gives each project block, and each OWASP category (in runs of at most
+        PARALLEL_PART_PAGES pages), a section of its own for that.
+        """
+        overall_level = int(aggregates.totals.level)
+        overall_score = aggregates.totals.score
+        sections = [
+            ('cover', self._cover_page, (projects, config, formatted_date, formatted_datetime,
+                                         overall_level, overall_score), True),
+            ('executive_summary', self._executive_summary_page, (config, aggregates, overall_level), True),
+        ]
+        if config.report_configuration.include_sections.appendix_methodology:
+            sections.append(('methodology', self._methodology_page, (), True))
+        sections += [
+            ('projects_included', self._projects_included_pages, (aggregates, config), False),
+            ('scan_summary', self._scan_summary_page, (aggregates, config), True),
+        ]
+        if split:
+            sections.append(('owasp_top10', self._owasp_summary_page, (aggregates,), False))
+            for key in self._owasp_category_keys(aggregates):
+                page_count = len(self._owasp_page_starts(aggregates, key, config))
+                for start in range(0, page_count, PARALLEL_PART_PAGES):
+                    pages = slice(start, start + PARALLEL_PART_PAGES)
+                    sections.append((f'owasp_top10.{key}.{start // PARALLEL_PART_PAGES}',
+                                     self._owasp_category_pages, (aggregates, key, config, pages), False))
+            for i, aggregate in enumerate(self._top_projects(aggregates)):
+                sections.append((f'project.{i}', self._project_pages, (aggregate, config), False))
+        else:
+            sections.append(('owasp_top10', self._owasp_top10_pages, (aggregates, config), False))
+            sections.append(('project_pages', self._individual_project_pages, (aggregates, config), False))
+        sections.append(('roadmap', self._security_roadmap_pages, (aggregates, config), False))
+        return sections
+
+    def _render_parallel(self, projects, aggregates: ReportAggregates, config, output_path: str, workers: int,
+                         formatted_date: str, formatted_datetime: str, footer_text: str) -> None:
+        names = [name for name, _, _, _ in self._sections(projects, aggregates, config, formatted_date,
+                                                          formatted_datetime, split=True)]
+        parts = [[name for name in names if name in FRONT_MATTER_SECTIONS]]
+        parts += [[name] for name in names if name not in FRONT_MATTER_SECTIONS]
+        workers = max(1, min(workers, len(parts)))
+        print(f'Rendering {len(parts)} report parts with {workers} worker(s)...')
+
+        with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(output_path))) as tmp_dir:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_section_worker,
+                                     initargs=(projects, config, formatted_date, formatted_datetime,
+                                               footer_text)) as pool:
+                futures = [pool.submit(_render_report_part, part, os.path.join(tmp_dir, f'part-{i:04d}.pdf'))
+                           for i, part in enumerate(parts)]
+                results = [future.result() for future in futures]
+
+            # The footer carries no page number and every link in the report is external, so
+            # appending the parts in order reproduces the single-pass document page for page.
+            with instrumentation.stage('merge'):
+                writer = PdfWriter()
+                page_count = 0
+                for part, (path, pages, seconds) in zip(parts, results):
+                    instrumentation.record(f'layout.{"+".join(part)}', seconds)
+                    if path:
+                        writer.append(path)
+                        page_count += pages
+                with open(output_path, 'wb') as f:
+                    writer.write(f)
+        print(f'Merged {page_count} pages from {len(parts)} parts')
+
     # ── Page builders ─────────────────────────────────────────────────────────
 
     def _cover_page(self, projects, config, formatted_date, formatted_datetime,
@@ -480,12 +631,12 @@ class BasicPdfGenerator:
 
         return story
 
-    def _executive_summary_page(self, projects, config, open_findings, overall_level) -> list:
+    def _executive_summary_page(self, config, aggregates: ReportAggregates, overall_level) -> list:
         st = self._styles
         story = []
 
-        critical = sum(1 for f in open_findings if f.severity == 'Critical')
-        high = sum(1 for f in open_findings if f.severity == 'High')
+        critical = aggregates.totals.count('Critical')
+        high = aggregates.totals.count('High')
 
         story.append(Paragraph('Executive Summary', st['SectionTitle']))
 
@@ -624,11 +775,11 @@ class BasicPdfGenerator:
 
         return story
 
-    def _projects_included_pages(self, projects, config) -> list:
+    def _projects_included_pages(self, aggregates: ReportAggregates, config) -> list:
         st = self._styles
         story = []
 
-        repos = self._get_actual_repositories(projects)
+        repos = self._get_actual_repositories(aggregates)
         items_per_page = 17
 
         for page_idx in range(0, max(1, len(repos)), items_per_page):
@@ -684,14 +835,14 @@ class BasicPdfGenerator:
 
         return story
 
-    def _scan_summary_page(self, projects, config) -> list:
+    def _scan_summary_page(self, aggregates: ReportAggregates, config) -> list:
         st = self._styles
         story = []
 
         story.append(Paragraph('Scan Summary', st['SectionTitle']))
 
-        open_total = sum(len([f for f in p.findings if f.status == 'Open']) for p in projects)
-        repos = self._get_actual_repositories(projects)
+        open_total = aggregates.totals.open_count
+        repos = self._get_actual_repositories(aggregates)
         total_files = sum(r['files_scanned'] for r in repos)
 
         summary_data = [
@@ -750,35 +901,38 @@ class BasicPdfGenerator:
 
         return story
 
-    def _individual_project_pages(self, projects, config) -> list:
+    def _individual_project_pages(self, aggregates: ReportAggregates, config) -> list:
         story = []
-        projects_with_findings = [p for p in projects if any(f.status == 'Open' for f in p.findings)]
-        top_projects = projects_with_findings[:12]
+        top_projects = self._top_projects(aggregates)
 
-        print(f'Generating {len(top_projects)} project pages from {len(projects)} total projects')
+        print(f'Generating {len(top_projects)} project pages from {len(aggregates.projects)} total projects')
 
-        for project in top_projects:
-            story.extend(self._render_project_summary_pages(project, config))
-            story.extend(self._render_project_detailed_findings(project, config))
+        for aggregate in top_projects:
+            story.extend(self._project_pages(aggregate, config))
 
         return story
 
-    def _render_project_summary_pages(self, project: SemgrepProject, config: ReportConfiguration) -> list:
+    def _top_projects(self, aggregates: ReportAggregates) -> List[ProjectAggregate]:
+        return aggregates.projects_with_open_findings[:12]
+
+    def _project_pages(self, aggregate: ProjectAggregate, config: ReportConfiguration) -> list:
+        return (self._render_project_summary_pages(aggregate, config) +
+                self._render_project_detailed_findings(aggregate, config))
+
+    def _render_project_summary_pages(self, aggregate: ProjectAggregate, config: ReportConfiguration) -> list:
         st = self._styles
         story = []
 
-        open_findings = [f for f in project.findings if f.status == 'Open']
-        critical = sum(1 for f in open_findings if f.severity == 'Critical')
-        high = sum(1 for f in open_findings if f.severity == 'High')
-        medium = sum(1 for f in open_findings if f.severity == 'Medium')
-        low = sum(1 for f in open_findings if f.severity == 'Low')
+        project = aggregate.project
+        open_findings = aggregate.open_findings
+        critical, high, medium, low = (aggregate.count(s) for s in SEVERITIES)
 
-        score = self._calc_project_score(open_findings)
-        level = self._calc_project_level({'critical': critical, 'high': high}, score)
+        score = aggregate.score
+        level = f'SL{int(aggregate.level)}'
 
         top_findings = (
-            [f for f in open_findings if f.severity == 'Critical'][:8] +
-            [f for f in open_findings if f.severity == 'High'][:8]
+            aggregate.open_with_severity('Critical')[:8] +
+            aggregate.open_with_severity('High')[:8]
         )[:12]
 
         items_first_page = 2
@@ -881,14 +1035,9 @@ class BasicPdfGenerator:
 
     def _render_brief_finding(self, finding: SemgrepFinding, project: SemgrepProject,
                                config: ReportConfiguration, st: dict) -> list:
-        sev_color = SEVERITY_COLORS.get(finding.severity, GRAY)
         items = []
 
-        # Severity row
-        sev_style = ParagraphStyle('sev', fontSize=9, fontName='Helvetica-Bold', textColor=sev_color)
-        severity_para = Paragraph(finding.severity.upper(), sev_style)
-
-        # OWASP + CWE links
+        # Severity row: OWASP + CWE links
         meta_parts = []
         if finding.owasp_category:
             owasp_url = OWASP_URLS.get(finding.owasp_category, 'https://owasp.org/Top10/')
@@ -898,17 +1047,14 @@ class BasicPdfGenerator:
             meta_parts.append(f'<link href=\"https://cwe.mitre.org/data/definitions/{cwe_num}.html\"><u>{self._safe_text(finding.cwe_id)}</u></link>')
         meta_text = ' | '.join(meta_parts) if meta_parts else ''
 
-        items.append(Paragraph(f'<b>{finding.severity.upper()}</b>  {meta_text}',
-                                ParagraphStyle('sev_row', fontSize=8, textColor=GRAY,
-                                               leading=12, spaceAfter=2)))
+        items.append(Paragraph(f'<b>{finding.severity.upper()}</b>  {meta_text}', st['FindingMeta']))
 
         # Rule name (linked)
         rule_display = (finding.rule_name[:62] + '...') if len(finding.rule_name) > 65 else finding.rule_name
         encoded_rule_id = urllib.parse.quote(finding.rule_id, safe='')
         items.append(Paragraph(
             f'<link href=\"https://semgrep.dev/r/{encoded_rule_id}\"><u>{self._safe_text(rule_display)}</u></link>',
-            ParagraphStyle('rule', fontSize=8, fontName='Helvetica-Bold', textColor=BLUE,
-                           leading=11, spaceAfter=2)
+            st['FindingRule']
         ))
 
         # Path
@@ -917,7 +1063,7 @@ class BasicPdfGenerator:
             path_display = '...' + path_display[-72:]
         items.append(Paragraph(
             self._safe_text(f'{path_display}:{finding.start_line}'),
-            ParagraphStyle('path', fontSize=7, fontName='Courier', textColor=GRAY, leading=10, spaceAfter=2)
+            st['FindingPath']
         ))
 
         # Recommendation
@@ -927,8 +1073,7 @@ class BasicPdfGenerator:
                 rec = rec[:82] + '...'
             items.append(Paragraph(
                 self._safe_text(rec),
-                ParagraphStyle('rec', fontSize=7, fontName='Helvetica-Oblique', textColor=BLUE,
-                               leading=10, spaceAfter=2)
+                st['FindingRecommendation']
             ))
 
         # Dashboard link
@@ -937,45 +1082,42 @@ class BasicPdfGenerator:
             if finding_url:
                 items.append(Paragraph(
                     f'<link href="{finding_url}"><u>View in Semgrep Dashboard -></u></link>',
-                    ParagraphStyle('view', fontSize=6, textColor=BLUE, alignment=2)  # right
+                    st['FindingView']
                 ))
 
         return items
 
-    def _render_project_detailed_findings(self, project: SemgrepProject,
+    def _render_project_detailed_findings(self, aggregate: ProjectAggregate,
                                            config: ReportConfiguration) -> list:
         st = self._styles
         story = []
 
-        open_findings = [f for f in project.findings if f.status == 'Open']
-        severity_order = {'Critical': 4, 'High': 3, 'Medium': 2, 'Low': 1}
+        project = aggregate.project
         min_severity = config.report_configuration.detail_filter_min_severity or 'Medium'
-        min_level = severity_order.get(min_severity, 2)
+        filtered = aggregate.filtered_findings(min_severity)
+        print(f'  Project {project.name}: {aggregate.open_count} total -> {len(filtered)} filtered (min {min_severity})')
 
-        filtered = [f for f in open_findings if severity_order.get(f.severity, 1) >= min_level]
-        print(f'  Project {project.name}: {len(open_findings)} total -> {len(filtered)} filtered (min {min_severity})')
+        grouped = aggregate.rule_groups(min_severity)
 
-        grouped = self._group_findings_by_rule(filtered)
-        grouped.sort(key=lambda g: (severity_order.get(g['severity'], 0), len(g['instances'])), reverse=True)
+        grouped = sorted(grouped, key=lambda g: (SEVERITY_ORDER.get(g['severity'], 0), len(g['instances'])),
+                         reverse=True)
 
         if not grouped:
             return story
 
+        budget = config.report_configuration.render_budget
+        overflow = []
+        if budget.max_rule_pages_per_project and len(grouped) > budget.max_rule_pages_per_project:
+            grouped, overflow = grouped[:budget.max_rule_pages_per_project], grouped[budget.max_rule_pages_per_project:]
+        max_instances = budget.max_instances_per_rule
+
         for page_num, group in enumerate(grouped, start=1):
-            sev_color = SEVERITY_COLORS.get(group['severity'], GRAY)
-            story.append(Paragraph(
-                f'{project.name} - Detailed Findings ({page_num})',
-                ParagraphStyle('dt', fontSize=18, fontName='Helvetica-Bold', textColor=GREEN, spaceAfter=10)
-            ))
+            story.append(Paragraph(f'{project.name} - Detailed Findings ({page_num})', st['DetailTitle']))
 
             # Severity header band
             inst_count = len(group.get('instances', []))
             inst_text = f'{inst_count} INSTANCE{"S" if inst_count != 1 else ""}'
-            header_style = ParagraphStyle(
-                'dhdr',
-                fontName='Helvetica-Bold', fontSize=12, textColor=colors.white,
-                alignment=1, backColor=sev_color, borderPadding=6
-            )
+            header_style = st.get(f'SeverityBand.{group["severity"]}', st['SeverityBand.Unknown'])
             story.append(Paragraph(
                 f'{group["severity"].upper()} SEVERITY - {inst_text}',
                 header_style
@@ -986,7 +1128,7 @@ class BasicPdfGenerator:
             story.append(Paragraph('Rule:', st['TinyBold']))
             story.append(Paragraph(
                 f'<link href="https://semgrep.dev/r/{urllib.parse.quote(group["rule_id"], safe="")}"><u>{self._safe_text(group["rule_name"])}</u></link>',
-                ParagraphStyle('rule', fontSize=11, fontName='Helvetica-Bold', textColor=BLUE)
+                st['DetailRule']
             ))
             story.append(Spacer(1, 6))
 
@@ -996,15 +1138,16 @@ class BasicPdfGenerator:
                 'Locations:' if len(instances) > 1 else 'Location:',
                 st['TinyBold']
             ))
-            for inst in instances[:3]:
+            for inst in instances[:max_instances]:
                 story.append(Paragraph(
                     self._safe_text(f'{inst["path"]}:{inst["start_line"]}'),
-                    ParagraphStyle('loc', fontName='Courier', fontSize=10, textColor=GRAY, leading=13)
+                    st['DetailLocation']
                 ))
-            if len(instances) > 3:
+            if len(instances) > max_instances:
+                hidden = len(instances) - max_instances
                 story.append(Paragraph(
-                    f'and {len(instances) - 3} additional finding{"s" if len(instances) - 3 != 1 else ""}...',
-                    ParagraphStyle('more', fontSize=10, fontName='Helvetica-Oblique', textColor=GRAY)
+                    f'and {hidden} additional finding{"s" if hidden != 1 else ""}...',
+                    st['DetailMore']
                 ))
             story.append(Spacer(1, 6))
 
@@ -1054,9 +1197,61 @@ class BasicPdfGenerator:
 
             story.append(PageBreak())
 
+        if overflow:
+            story.extend(self._rule_overflow_page(project, overflow, min_severity, config))
+
         return story
 
-    def _owasp_top10_pages(self, projects: List[SemgrepProject]) -> list:
+    def _rule_overflow_page(self, project: SemgrepProject, overflow: List[dict], min_severity: str,
+                            config: ReportConfiguration) -> list:
+        """Summarizes the rule groups left out by the render budget as counts per severity."""
+        st = self._styles
+        story = [Paragraph(f'{project.name} - Additional Findings', st['DetailTitle'])]
+
+        rules: Dict[str, int] = {}
+        instances: Dict[str, int] = {}
+        for group in overflow:
+            rules[group['severity']] = rules.get(group['severity'], 0) + 1
+            instances[group['severity']] = instances.get(group['severity'], 0) + len(group['instances'])
+        total_instances = sum(instances.values())
+
+        story.append(Paragraph(
+            f'{len(overflow)} more rule{"s" if len(overflow) != 1 else ""} with {total_instances} '
+            f'instance{"s" if total_instances != 1 else ""} at {min_severity} severity or above '
+            f'are not shown in this report.',
+            st['Body']
+        ))
+        story.append(Spacer(1, 8))
+
+        table_data = [['Severity', 'Rules', 'Instances']]
+        style_cmds = []
+        for severity in sorted(rules, key=lambda sev: SEVERITY_ORDER.get(sev, 0), reverse=True):
+            table_data.append([severity, str(rules[severity]), str(instances[severity])])
+            row = len(table_data) - 1
+            style_cmds.append(('TEXTCOLOR', (0, row), (0, row), SEVERITY_COLORS.get(severity, GRAY)))
+        story.append(_make_table(table_data, [CONTENT_WIDTH * 0.4, CONTENT_WIDTH * 0.3, CONTENT_WIDTH * 0.3],
+                                 style_cmds))
+        story.append(Spacer(1, 8))
+
+        url = self._get_dashboard_url(project.project_id, config) if project.project_id else None
+        story.extend(self._overflow_note('', url, config))
+        story.append(PageBreak())
+        return story
+
+    def _overflow_note(self, text: str, url: Optional[str], config: ReportConfiguration) -> list:
+        """Points readers at the sidecar file and dashboard for detail the render budget left out."""
+        st = self._styles
+        sidecar_format = config.report_configuration.render_budget.sidecar_format
+        if sidecar_format:
+            text = (f'{text} Every open finding is listed in the findings {sidecar_format.upper()} '
+                    f'file generated alongside this report.').strip()
+        story = [Paragraph(text, st['Italic'])] if text else []
+        if url:
+            story.append(Paragraph(f'<link href="{url}"><u>View all findings in Semgrep Dashboard -></u></link>',
+                                   st['SmallLink']))
+        return story
+
+    def _owasp_top10_pages(self, aggregates: ReportAggregates, config: ReportConfiguration) -> list:
         """
         OWASP Top 10 summary section.
 
@@ -1070,24 +1265,25 @@ class BasicPdfGenerator:
              findings, listing every finding with its rule, path, message,
              and CWE — matching the HTML report's per-section tables.
         """
+        story = self._owasp_summary_page(aggregates)
+        for key in self._owasp_category_keys(aggregates):
+            story.extend(self._owasp_category_pages(aggregates, key, config))
+        return story
+
+    def _owasp_category_keys(self, aggregates: ReportAggregates) -> List[str]:
+        return aggregates.totals.owasp_categories()
+
+    def _owasp_summary_page(self, aggregates: ReportAggregates) -> list:
         st = self._styles
         story = []
 
-        open_findings = [f for p in projects for f in p.findings if f.status == 'Open']
-        if not open_findings:
+        totals = aggregates.totals
+        if not totals.open_count:
             return story
 
-        # ── Group findings by OWASP category ─────────────────────────────────
-        # key → list of SemgrepFinding
-        by_category: Dict[str, List[SemgrepFinding]] = {}
-        for f in open_findings:
-            key = f.owasp_category or 'unmapped'
-            by_category.setdefault(key, []).append(f)
-
-        # Build display order: canonical A01-A10 (only if present) then unmapped
-        ordered_keys = [k for k in OWASP_CATEGORY_ORDER if k in by_category]
-        if 'unmapped' in by_category:
-            ordered_keys.append('unmapped')
+        # key → list of SemgrepFinding ('unmapped' for findings with no category)
+        by_category = totals.by_owasp
+        ordered_keys = self._owasp_category_keys(aggregates)
 
         # ── Page 1: Summary overview ──────────────────────────────────────────
         story.append(Paragraph('OWASP Top 10 Security Summary', st['SectionTitle']))
@@ -1100,7 +1296,7 @@ class BasicPdfGenerator:
 
         # Severity distribution row (mirrors HTML "Severity breakdown" card)
         sev_order = ['Critical', 'High', 'Medium', 'Low']
-        sev_counts = {s: sum(1 for f in open_findings if f.severity == s) for s in sev_order}
+        sev_counts = {s: totals.count(s) for s in sev_order}
         sev_row_items = []
         for sev in sev_order:
             if sev_counts[sev]:
@@ -1156,7 +1352,7 @@ class BasicPdfGenerator:
             name = OWASP_DISPLAY_NAMES.get(key, 'Unmapped to OWASP Top 10') if key != 'unmapped' else 'Unmapped to OWASP Top 10'
             # Strip the long "OWASP Top Ten 2021 Category AXX - " prefix for the table
             short_name = name.split(' - ', 1)[-1] if ' - ' in name else name
-            counts = {s: sum(1 for f in findings if f.severity == s) for s in sev_order}
+            counts = {s: totals.owasp_severity_counts[key].get(s, 0) for s in sev_order}
             table_rows.append([
                 code,
                 short_name,
@@ -1189,131 +1385,142 @@ class BasicPdfGenerator:
         )
         story.append(summary_table)
         story.append(PageBreak())
+        return story
+
+    def _owasp_page_starts(self, aggregates: ReportAggregates, key: str, config: ReportConfiguration) -> range:
+        """Offsets of the findings starting each detail page for `key`, within the render budget."""
+        starts = range(0, len(aggregates.totals.by_owasp[key]), OWASP_FINDINGS_PER_PAGE)
+        max_pages = config.report_configuration.render_budget.max_owasp_pages_per_category
+        return starts[:max_pages] if max_pages else starts
+
+    def _owasp_category_pages(self, aggregates: ReportAggregates, key: str, config: ReportConfiguration,
+                              pages: slice = slice(None)) -> list:
+        """Detail pages for one OWASP category; `pages` selects a subset of them."""
+        st = self._styles
+        story = []
 
         # ── Per-category detail pages ─────────────────────────────────────────
         # Mirror the HTML report's per-section tables:
         # Severity | Rule | Path:Line | Message | CWE
-        FINDINGS_PER_PAGE = 12  # rows that comfortably fit on one A4 page
+        FINDINGS_PER_PAGE = OWASP_FINDINGS_PER_PAGE
+        page_starts = self._owasp_page_starts(aggregates, key, config)
+        shown = min(len(page_starts) * FINDINGS_PER_PAGE, len(aggregates.totals.by_owasp[key]))
+
+        findings = aggregates.totals.by_owasp[key]
+        display_name = (
+            OWASP_DISPLAY_NAMES.get(key, 'Unmapped to OWASP Top 10')
+            if key != 'unmapped'
+            else 'Unmapped to OWASP Top 10'
+        )
+        owasp_url = OWASP_URLS.get(key) if key != 'unmapped' else None
 
-        for key in ordered_keys:
-            findings = by_category[key]
-            display_name = (
-                OWASP_DISPLAY_NAMES.get(key, 'Unmapped to OWASP Top 10')
-                if key != 'unmapped'
-                else 'Unmapped to OWASP Top 10'
-            )
-            owasp_url = OWASP_URLS.get(key) if key != 'unmapped' else None
+        # Sort within category: Critical first, then High, Medium, Low
+        sev_rank = {'Critical': 0, 'High': 1, 'Medium': 2, 'Low': 3}
+        sorted_findings = sorted(findings, key=lambda f: sev_rank.get(f.severity, 4))
 
-            # Sort within category: Critical first, then High, Medium, Low
-            sev_rank = {'Critical': 0, 'High': 1, 'Medium': 2, 'Low': 3}
-            sorted_findings = sorted(findings, key=lambda f: sev_rank.get(f.severity, 4))
+        # Paginate if many findings
+        for page_start in page_starts[pages]:
+            page_findings = sorted_findings[page_start:page_start + FINDINGS_PER_PAGE]
+            page_num = page_start // FINDINGS_PER_PAGE + 1
+            total_pages = len(page_starts)
 
-            # Paginate if many findings
-            for page_start in range(0, len(sorted_findings), FINDINGS_PER_PAGE):
-                page_findings = sorted_findings[page_start:page_start + FINDINGS_PER_PAGE]
-                page_num = page_start // FINDINGS_PER_PAGE + 1
-                total_pages = (len(sorted_findings) + FINDINGS_PER_PAGE - 1) // FINDINGS_PER_PAGE
+            # Section header
+            header_suffix = (f' (Page {page_num} of {total_pages})'
+                             if total_pages > 1 else '')
+            story.append(Paragraph(f'{display_name}{header_suffix}', st['OwaspSection']))
 
-                # Section header
-                header_suffix = (f' (Page {page_num} of {total_pages})'
-                                 if total_pages > 1 else '')
+            count_label = f'{len(findings)} finding{"s" if len(findings) != 1 else ""}'
+            if owasp_url:
                 story.append(Paragraph(
-                    f'{display_name}{header_suffix}',
-                    ParagraphStyle('owasp_sec', fontSize=14, fontName='Helvetica-Bold',
-                                   textColor=GREEN, spaceAfter=4)
+                    f'<link href="{owasp_url}"><u>OWASP Reference</u></link>  |  {count_label}',
+                    st['OwaspRef']
                 ))
+            else:
+                story.append(Paragraph(count_label, st['OwaspRef']))
+
+            # Findings table (mirrors HTML <table class="table">)
+            detail_header = ['Sev', 'Rule / Path', 'Message', 'CWE']
+            detail_rows = [detail_header]
+            detail_style = []
+
+            for row_idx, finding in enumerate(page_findings, start=1):
+                sev_col = SEVERITY_COLORS.get(finding.severity, GRAY)
+
+                # Truncate long rule IDs for readability
+                rule_display = finding.rule_id
+                if len(rule_display) > 55:
+                    rule_display = '...' + rule_display[-52:]
+                path_display = finding.path
+                if len(path_display) > 45:
+                    path_display = '...' + path_display[-42:]
+                encoded_rule_id = urllib.parse.quote(finding.rule_id, safe='')
+
+                rule_cell = Paragraph(
+                    f'<link href=\"https://semgrep.dev/r/{encoded_rule_id}\"><u>{self._safe_text(rule_display)}</u></link>'
+                    f'<br/><font size=\"7\" color=\"#666666\">{self._safe_text(path_display)}:{finding.start_line}</font>',
+                    st['OwaspRuleCell']
+                )
 
-                count_label = f'{len(findings)} finding{"s" if len(findings) != 1 else ""}'
-                if owasp_url:
-                    story.append(Paragraph(
-                        f'<link href="{owasp_url}"><u>OWASP Reference</u></link>  |  {count_label}',
-                        ParagraphStyle('owasp_ref', fontSize=9, textColor=GRAY, spaceAfter=6)
-                    ))
-                else:
-                    story.append(Paragraph(count_label,
-                                           ParagraphStyle('owasp_cnt', fontSize=9,
-                                                          textColor=GRAY, spaceAfter=6)))
-
-                # Findings table (mirrors HTML <table class="table">)
-                detail_header = ['Sev', 'Rule / Path', 'Message', 'CWE']
-                detail_rows = [detail_header]
-                detail_style = []
-
-                for row_idx, finding in enumerate(page_findings, start=1):
-                    sev_col = SEVERITY_COLORS.get(finding.severity, GRAY)
-
-                    # Truncate long rule IDs for readability
-                    rule_display = finding.rule_id
-                    if len(rule_display) > 55:
-                        rule_display = '...' + rule_display[-52:]
-                    path_display = finding.path
-                    if len(path_display) > 45:
-                        path_display = '...' + path_display[-42:]
-                    encoded_rule_id = urllib.parse.quote(finding.rule_id, safe='')
-
-                    rule_cell = Paragraph(
-                        f'<link href=\"https://semgrep.dev/r/{encoded_rule_id}\"><u>{self._safe_text(rule_display)}</u></link>'
-                        f'<br/><font size=\"7\" color=\"#666666\">{self._safe_text(path_display)}:{finding.start_line}</font>',
-                        ParagraphStyle('rc', fontSize=8, textColor=BLUE, leading=11)
+                msg = finding.message or finding.description or ''
+                if len(msg) > 120:
+                    msg = msg[:117] + '...'
+                msg_cell = Paragraph(self._safe_text(msg), st['OwaspMessageCell'])
+
+                cwe = finding.cwe_id or '—'
+                if finding.cwe_id:
+                    cwe_num = finding.cwe_id.replace('CWE-', '')
+                    cwe_cell = Paragraph(
+                        f'<link href=\"https://cwe.mitre.org/data/definitions/{cwe_num}.html\"><u>{self._safe_text(cwe)}</u></link>',
+                        st['OwaspCweCell']
                     )
-
-                    msg = finding.message or finding.description or ''
-                    if len(msg) > 120:
-                        msg = msg[:117] + '...'
-                    msg_cell = Paragraph(self._safe_text(msg), ParagraphStyle('mc', fontSize=8, leading=11,
-                                                              textColor=DARK_GRAY))
-
-                    cwe = finding.cwe_id or '—'
-                    if finding.cwe_id:
-                        cwe_num = finding.cwe_id.replace('CWE-', '')
-                        cwe_cell = Paragraph(
-                            f'<link href=\"https://cwe.mitre.org/data/definitions/{cwe_num}.html\"><u>{self._safe_text(cwe)}</u></link>',
-                            ParagraphStyle('cwec', fontSize=8, textColor=BLUE)
-                        )
-                    else:
-                        cwe_cell = Paragraph('—', ParagraphStyle('cwed', fontSize=8, textColor=GRAY))
-
-                    detail_rows.append([finding.severity, rule_cell, msg_cell, cwe_cell])
-                    detail_style.append(('TEXTCOLOR', (0, row_idx), (0, row_idx), sev_col))
-                    detail_style.append(('FONTNAME', (0, row_idx), (0, row_idx), 'Helvetica-Bold'))
-                    detail_style.append(('FONTSIZE', (0, row_idx), (0, row_idx), 8))
-
-                detail_table = Table(
-                    detail_rows,
-                    colWidths=[
-                        CONTENT_WIDTH * 0.09,   # Severity
-                        CONTENT_WIDTH * 0.33,   # Rule / Path
-                        CONTENT_WIDTH * 0.43,   # Message
-                        CONTENT_WIDTH * 0.15,   # CWE
-                    ],
-                    style=TableStyle([
-                        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                        ('FONTSIZE', (0, 0), (-1, 0), 9),
-                        ('BACKGROUND', (0, 0), (-1, 0), MID_GRAY),
-                        ('GRID', (0, 0), (-1, -1), 0.3, BORDER_GRAY),
-                        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, LIGHT_GRAY]),
-                        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                        ('TOPPADDING', (0, 0), (-1, -1), 4),
-                        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-                        ('LEFTPADDING', (0, 0), (-1, -1), 4),
-                        ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-                    ] + detail_style),
-                    repeatRows=1,
-                )
-                story.append(detail_table)
-                story.append(PageBreak())
+                else:
+                    cwe_cell = Paragraph('—', st['OwaspCweEmpty'])
+
+                detail_rows.append([finding.severity, rule_cell, msg_cell, cwe_cell])
+                detail_style.append(('TEXTCOLOR', (0, row_idx), (0, row_idx), sev_col))
+                detail_style.append(('FONTNAME', (0, row_idx), (0, row_idx), 'Helvetica-Bold'))
+                detail_style.append(('FONTSIZE', (0, row_idx), (0, row_idx), 8))
+
+            detail_table = Table(
+                detail_rows,
+                colWidths=[
+                    CONTENT_WIDTH * 0.09,   # Severity
+                    CONTENT_WIDTH * 0.33,   # Rule / Path
+                    CONTENT_WIDTH * 0.43,   # Message
+                    CONTENT_WIDTH * 0.15,   # CWE
+                ],
+                style=TableStyle([
+                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                    ('FONTSIZE', (0, 0), (-1, 0), 9),
+                    ('BACKGROUND', (0, 0), (-1, 0), MID_GRAY),
+                    ('GRID', (0, 0), (-1, -1), 0.3, BORDER_GRAY),
+                    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, LIGHT_GRAY]),
+                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+                    ('TOPPADDING', (0, 0), (-1, -1), 4),
+                    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+                    ('LEFTPADDING', (0, 0), (-1, -1), 4),
+                    ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+                ] + detail_style),
+                repeatRows=1,
+            )
+            story.append(detail_table)
+            if page_num == total_pages and shown < len(findings):
+                story.append(Spacer(1, 6))
+                story.extend(self._overflow_note(
+                    f'{len(findings) - shown} more {display_name} findings are not shown.', None, config))
+            story.append(PageBreak())
 
         return story
 
-    def _security_roadmap_pages(self, projects, config, open_findings) -> list:
+    def _security_roadmap_pages(self, aggregates: ReportAggregates, config) -> list:
         st = self._styles
         story = []
 
-        critical = sum(1 for f in open_findings if f.severity == 'Critical')
-        high = sum(1 for f in open_findings if f.severity == 'High')
-        medium = sum(1 for f in open_findings if f.severity == 'Medium')
+        critical = aggregates.totals.count('Critical')
+        high = aggregates.totals.count('High')
+        medium = aggregates.totals.count('Medium')
 
-        owasp_breakdown = self._get_owasp_breakdown(open_findings)
+        owasp_breakdown = aggregates.totals.owasp_breakdown()
         top_owasp = owasp_breakdown[:5]
 
         # ── Immediate Actions (0-30 days) ─────────────────────────────────────
@@ -1440,12 +1647,11 @@ class BasicPdfGenerator:
 
     # ── Helper methods ────────────────────────────────────────────────────────
 
-    def _get_actual_repositories(self, projects: List[SemgrepProject]) -> List[dict]:
+    def _get_actual_repositories(self, aggregates: ReportAggregates) -> List[dict]:
         repos = []
-        for project in projects:
-            open_count = sum(1 for f in project.findings if f.status == 'Open')
-            if open_count == 0:
-                continue
+        for aggregate in aggregates.projects_with_open_findings:
+            project = aggregate.project
+            open_count = aggregate.open_count
             estimated_files = max(50, open_count * 3)
             duration = '12m' if open_count > 1000 else ('6m' if open_count > 100 else '2m')
             repos.append({
@@ -1464,68 +1670,7 @@ class BasicPdfGenerator:
         return xml_escape(str(value), {'"': '&quot;', "'": '&#39;'})
 
     def _group_findings_by_rule(self, findings: List[SemgrepFinding]) -> List[dict]:
-        groups: Dict[str, dict] = {}
-        for finding in findings:
-            key = finding.rule_id
-            if key not in groups:
-                groups[key] = {
-                    'rule_id': finding.rule_id,
-                    'rule_name': finding.rule_name,
-                    'severity': finding.severity,
-                    'message': finding.message,
-                    'description': finding.description,
-                    'owasp_category': finding.owasp_category,
-                    'cwe_id': finding.cwe_id,
-                    'assistant_recommendation': finding.assistant_recommendation,
-                    'instances': [],
-                }
-            loc_key = f'{finding.path}:{finding.start_line}'
-            if not any(f'{i["path"]}:{i["start_line"]}' == loc_key for i in groups[key]['instances']):
-                groups[key]['instances'].append({
-                    'id': finding.id,
-                    'path': finding.path,
-                    'start_line': finding.start_line,
-                    'project_id': finding.project_id,
-                    'project_name': finding.project_name,
-                })
-        return list(groups.values())
-
-    def _get_owasp_breakdown(self, findings: List[SemgrepFinding]) -> List[dict]:
-        owasp_map: Dict[str, dict] = {}
-        for f in findings:
-            if f.status != 'Open' or not f.owasp_category:
-                continue
-            cat = f.owasp_category
-            if cat not in owasp_map:
-                owasp_map[cat] = {'category': cat, 'count': 0, 'critical': 0, 'high': 0}
-            owasp_map[cat]['count'] += 1
-            if f.severity == 'Critical':
-                owasp_map[cat]['critical'] += 1
-            if f.severity == 'High':
-                owasp_map[cat]['high'] += 1
-        result = list(owasp_map.values())
-        result.sort(key=lambda x: (x['critical'] + x['high']), reverse=True)
-        return result
-
-    def _calc_project_score(self, open_findings: List[SemgrepFinding]) -> int:
-        if not open_findings:
-            return 100
-        weights = {'Critical': 50, 'High': 20, 'Medium': 5, 'Low': 1}
-        total = sum(weights.get(f.severity, 1) for f in open_findings)
-        return max(0, round(100 - total * 100.0 / 1000))
-
-    def _calc_project_level(self, counts: dict, score: int) -> str:
-        c = counts.get('critical', 0)
-        h = counts.get('high', 0)
-        if c == 0 and h == 0 and score >= 90:
-            return 'SL5'
-        if c == 0 and h <= 3 and score >= 80:
-            return 'SL4'
-        if c == 0 and h <= 10 and score >= 70:
-            return 'SL3'
-        if c <= 5 and score >= 60:
-            return 'SL2'
-        return 'SL1'
+        return group_findings_by_rule(findings)
 
     def _level_color(self, level: str) -> HexColor:
         return {
@@ -1609,22 +1754,37 @@ class BasicPdfGenerator:
         return repo_mapping.static_mappings or {}
 
 
-def _make_combined_project(projects: List[SemgrepProject]):
-    from models import SemgrepProject, ScanMetadata, BusinessCriticality
-    from datetime import datetime
-    all_findings = [f for p in projects for f in p.findings]
-    return SemgrepProject(
-        name='Combined',
-        repository='Multiple',
-        business_criticality=projects[0].business_criticality if projects else BusinessCriticality.HIGH,
-        last_scanned=datetime.now(),
-        findings=all_findings,
-        scan_data=(projects[0].scan_data if projects else ScanMetadata(
-            sast_completed=True,
-            supply_chain_completed=True,
-            secrets_completed=False,
-            files_scanned=0,
-            scan_duration=0,
-            engine_version='1.45.0',
-        )),
-    )
+# ─── Parallel section rendering ───────────────────────────────────────────────
+
+# Set in each worker process by _init_section_worker
+_worker_sections: Dict[str, Tuple[Callable, tuple, bool]] = {}
+_worker_footer_text = ''
+
+
+def _init_section_worker(projects: List[SemgrepProject], config: ReportConfiguration,
+                         formatted_date: str, formatted_datetime: str, footer_text: str) -> None:
+    # Runs once per worker: aggregate the findings here so tasks only carry section names
+    global _worker_sections, _worker_footer_text
+    generator = BasicPdfGenerator()
+    aggregates = ReportAggregates(projects, generator._scoring)
+    sections = generator._sections(projects, aggregates, config, formatted_date, formatted_datetime,
+                                   split=True)
+    _worker_sections = {name: (build, args, page_break) for name, build, args, page_break in sections}
+    _worker_footer_text = footer_text
+
+
+def _render_report_part(names: List[str], output_path: str) -> Tuple[Optional[str], int, float]:
+    """Lays out the named sections into their own PDF; returns (path or None if empty, pages, seconds)."""
+    started = time.perf_counter()
+    story = []
+    # Keep progress output from interleaving across workers
+    with contextlib.redirect_stdout(io.StringIO()):
+        for name in names:
+            build, args, page_break = _worker_sections[name]
+            story.extend(build(*args))
+            if page_break:
+                story.append(PageBreak())
+        if not story:
+            return None, 0, time.perf_counter() - started
+        pages = _build_document(story, output_path, _worker_footer_text)
+    return output_path, pages, time.perf_counter() - started
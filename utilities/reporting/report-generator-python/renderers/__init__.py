@@ -0,0 +1,3 @@
+from .base import ReportRenderer, available_formats, get_renderer
+
+__all__ = ['ReportRenderer', 'available_formats', 'get_renderer']
@@ -0,0 +1,48 @@
+import importlib
+from typing import List, Optional
+
+from models import SemgrepProject, ReportConfiguration
+from services.report_aggregates import ReportAggregates
+
+
+class ReportRenderer:
+    """
+    An output format for the report. Renderers receive the fetched projects together with
+    the ReportAggregates computed for them, so every format reports the same counts,
+    scores and Semgrep Levels.
+    """
+
+    format_name = ''
+    extension = ''
+
+    def generate_report(
+        self,
+        projects: List[SemgrepProject],
+        config: ReportConfiguration,
+        output_path: str,
+        aggregates: Optional[ReportAggregates] = None,
+    ) -> str:
+        """Writes the report to `output_path` and returns the path written."""
+        raise NotImplementedError
+
+
+# reportConfiguration.outputFormats value -> (module, class). Renderers are imported on first
+# use, so runs that only write HTML or JSON never load ReportLab.
+RENDERERS = {
+    'PDF': ('pdf', 'BasicPdfGenerator'),
+    'HTML': ('renderers.html_renderer', 'HtmlReportRenderer'),
+    'JSON': ('renderers.json_renderer', 'JsonReportRenderer'),
+}
+
+
+def available_formats() -> List[str]:
+    return list(RENDERERS)
+
+
+def get_renderer(format_name: str) -> ReportRenderer:
+    try:
+        module_name, class_name = RENDERERS[format_name.upper()]
+    except KeyError:
+        raise ValueError(f'Unknown output format: {format_name} '
+                         f'(expected one of {", ".join(RENDERERS)})') from None
+    return getattr(importlib.import_module(module_name), class_name)()
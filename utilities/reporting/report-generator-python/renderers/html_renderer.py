@@ -0,0 +1,132 @@
+import os
+import urllib.parse
+from datetime import datetime
+from html import escape
+from typing import IO, List, Optional
+
+from models import SemgrepProject, ReportConfiguration
+from services.report_aggregates import (
+    ReportAggregates, ProjectAggregate, SEVERITIES, SEVERITY_ORDER, UNMAPPED, OWASP_DISPLAY_NAMES
+)
+from .base import ReportRenderer
+
+STYLE = '''
+body { font-family: Helvetica, Arial, sans-serif; color: #333; margin: 2em auto; max-width: 1100px; }
+h1, h2 { color: #00A86B; }
+table { border-collapse: collapse; width: 100%; margin-bottom: 1.5em; font-size: 14px; }
+th, td { border: 1px solid #DEE2E6; padding: 4px 8px; text-align: left; vertical-align: top; }
+th { background: #F8F9FA; }
+tr:nth-child(even) td { background: #F5F5F5; }
+.Critical { color: #DC3545; font-weight: bold; }
+.High { color: #FD7E14; font-weight: bold; }
+.Medium { color: #C69500; font-weight: bold; }
+.Low { color: #28A745; font-weight: bold; }
+.note { color: #666; font-style: italic; }
+'''
+
+
+def _row(f: IO[str], cells: List[str], header: bool = False) -> None:
+    tag = 'th' if header else 'td'
+    f.write('<tr>' + ''.join(f'<{tag}>{cell}</{tag}>' for cell in cells) + '</tr>\n')
+
+
+class HtmlReportRenderer(ReportRenderer):
+    """
+    A single self-contained HTML page with the report's summary numbers and tables: overall
+    and per-project scores and Semgrep Levels, the OWASP Top 10 breakdown and each project's
+    open findings grouped by rule. Written to the file as it is generated.
+    """
+
+    format_name = 'HTML'
+    extension = '.html'
+
+    def generate_report(
+        self,
+        projects: List[SemgrepProject],
+        config: ReportConfiguration,
+        output_path: str,
+        aggregates: Optional[ReportAggregates] = None,
+    ) -> str:
+        print('Generating HTML report...')
+        if aggregates is None:
+            aggregates = ReportAggregates(projects)
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+
+        with open(output_path, 'w', encoding='utf-8') as f:
+            title = f'Application Security Report - {config.customer.name}'
+            f.write('<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n')
+            f.write(f'<title>{escape(title)}</title>\n<style>{STYLE}</style>\n</head>\n<body>\n')
+            f.write(f'<h1>{escape(title)}</h1>\n')
+            f.write(f'<p class="note">Generated {datetime.now().strftime("%B %d, %Y %H:%M")}</p>\n')
+
+            self._summary(f, aggregates)
+            self._projects_table(f, aggregates)
+            self._owasp_table(f, aggregates)
+            for aggregate in aggregates.projects_with_open_findings:
+                self._project_rules(f, aggregate, config)
+
+            f.write('</body>\n</html>\n')
+
+        size_mb = os.path.getsize(output_path) / 1024 / 1024
+        print(f'HTML report generated: {output_path} ({size_mb:.2f} MB)')
+        return output_path
+
+    def _summary(self, f: IO[str], aggregates: ReportAggregates) -> None:
+        totals = aggregates.totals
+        f.write('<h2>Summary</h2>\n<table>\n')
+        _row(f, ['Semgrep Level', f'SL{int(totals.level)}'])
+        _row(f, ['Security Score', f'{totals.score}/100'])
+        _row(f, ['Projects', str(len(aggregates.projects))])
+        _row(f, ['Open Findings', str(totals.open_count)])
+        for severity in SEVERITIES:
+            _row(f, [f'<span class="{severity}">{severity}</span>', str(totals.count(severity))])
+        f.write('</table>\n')
+
+    def _projects_table(self, f: IO[str], aggregates: ReportAggregates) -> None:
+        f.write('<h2>Projects</h2>\n<table>\n')
+        _row(f, ['Project', 'Open', *SEVERITIES, 'Score', 'Level'], header=True)
+        for aggregate in aggregates.projects:
+            _row(f, [escape(aggregate.project.name), str(aggregate.open_count),
+                     *(str(aggregate.count(severity)) for severity in SEVERITIES),
+                     str(aggregate.score), f'SL{int(aggregate.level)}'])
+        f.write('</table>\n')
+
+    def _owasp_table(self, f: IO[str], aggregates: ReportAggregates) -> None:
+        totals = aggregates.totals
+        f.write('<h2>OWASP Top 10</h2>\n<table>\n')
+        _row(f, ['Category', 'Total', *SEVERITIES], header=True)
+        for category in totals.owasp_categories():
+            name = 'Unmapped to OWASP Top 10' if category == UNMAPPED else OWASP_DISPLAY_NAMES.get(category, category)
+            counts = totals.owasp_severity_counts[category]
+            _row(f, [escape(name), str(len(totals.by_owasp[category])),
+                     *(str(counts.get(severity, 0)) for severity in SEVERITIES)])
+        f.write('</table>\n')
+
+    def _project_rules(self, f: IO[str], aggregate: ProjectAggregate, config: ReportConfiguration) -> None:
+        min_severity = config.report_configuration.detail_filter_min_severity or 'Medium'
+        groups = sorted(aggregate.rule_groups(min_severity),
+                        key=lambda g: (SEVERITY_ORDER.get(g['severity'], 0), len(g['instances'])), reverse=True)
+        max_rules = config.report_configuration.render_budget.max_rule_pages_per_project
+        shown = groups[:max_rules] if max_rules else groups
+
+        f.write(f'<h2>{escape(aggregate.project.name)}</h2>\n')
+        f.write(f'<p>{aggregate.open_count} open findings, score {aggregate.score}/100, '
+                f'SL{int(aggregate.level)}. Rules with {escape(min_severity)} or higher severity findings:</p>\n')
+        f.write('<table>\n')
+        _row(f, ['Severity', 'Rule', 'Instances', 'OWASP', 'CWE', 'Example location'], header=True)
+        for group in shown:
+            rule_url = f'https://semgrep.dev/r/{urllib.parse.quote(group["rule_id"], safe="")}'
+            first = group['instances'][0]
+            _row(f, [
+                f'<span class="{escape(group["severity"])}">{escape(group["severity"])}</span>',
+                f'<a href="{escape(rule_url)}">{escape(group["rule_name"])}</a>',
+                str(len(group['instances'])),
+                escape(OWASP_DISPLAY_NAMES.get(group['owasp_category'], group['owasp_category'] or '')),
+                escape(group['cwe_id'] or ''),
+                escape(f'{first["path"]}:{first["start_line"]}'),
+            ])
+        f.write('</table>\n')
+        if len(shown) < len(groups):
+            hidden = groups[len(shown):]
+            f.write(f'<p class="note">{len(hidden)} more rules with '
+                    f'{sum(len(g["instances"]) for g in hidden)} instances are not shown.</p>\n')
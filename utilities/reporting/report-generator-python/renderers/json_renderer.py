@@ -0,0 +1,109 @@
+import json
+import os
+from datetime import datetime
+from typing import List, Optional
+
+from models import SemgrepFinding, SemgrepProject, ReportConfiguration
+from services.report_aggregates import ReportAggregates, FindingAggregate, ProjectAggregate, SEVERITIES
+from .base import ReportRenderer
+
+
+def aggregate_data(aggregate: FindingAggregate) -> dict:
+    return {
+        'open_findings': aggregate.open_count,
+        'severity_counts': {severity: aggregate.count(severity) for severity in SEVERITIES},
+        'score': aggregate.score,
+        'level': f'SL{int(aggregate.level)}',
+        'owasp': [
+            {'category': category, 'count': len(aggregate.by_owasp[category]),
+             **{severity.lower(): aggregate.owasp_severity_counts[category].get(severity, 0)
+                for severity in SEVERITIES}}
+            for category in aggregate.owasp_categories()
+        ],
+    }
+
+
+def project_data(aggregate: ProjectAggregate) -> dict:
+    project = aggregate.project
+    scan = project.scan_data
+    return {
+        'name': project.name,
+        'project_id': project.project_id,
+        'repository': project.repository,
+        'business_criticality': project.business_criticality.name,
+        'last_scanned': project.last_scanned.isoformat() if project.last_scanned else None,
+        'scan': {
+            'sast_completed': scan.sast_completed,
+            'supply_chain_completed': scan.supply_chain_completed,
+            'secrets_completed': scan.secrets_completed,
+            'files_scanned': scan.files_scanned,
+            'scan_duration_ms': scan.scan_duration,
+        },
+        'total_findings': len(project.findings),
+        **aggregate_data(aggregate),
+    }
+
+
+def finding_data(finding: SemgrepFinding) -> dict:
+    return {
+        'id': finding.id,
+        'rule_id': finding.rule_id,
+        'rule_name': finding.rule_name,
+        'severity': finding.severity,
+        'status': finding.status,
+        'path': finding.path,
+        'line': finding.start_line,
+        'owasp_category': finding.owasp_category,
+        'cwe_id': finding.cwe_id,
+        'message': finding.message,
+        'found_at': finding.found_at.isoformat() if finding.found_at else None,
+    }
+
+
+class JsonReportRenderer(ReportRenderer):
+    """
+    The report's data as JSON: report-wide and per-project counts, scores, Semgrep Levels
+    and OWASP Top 10 breakdowns, plus each project's open findings. The document is
+    written one finding at a time rather than built in memory first.
+    """
+
+    format_name = 'JSON'
+    extension = '.json'
+
+    def generate_report(
+        self,
+        projects: List[SemgrepProject],
+        config: ReportConfiguration,
+        output_path: str,
+        aggregates: Optional[ReportAggregates] = None,
+    ) -> str:
+        print('Generating JSON report data...')
+        if aggregates is None:
+            aggregates = ReportAggregates(projects)
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+
+        header = {
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'customer': config.customer.name,
+            'organization': config.organization_settings.organization_name if config.organization_settings else None,
+            'totals': aggregate_data(aggregates.totals),
+        }
+        with open(output_path, 'w', encoding='utf-8') as f:
+            # Everything up to the projects array, then each project with its findings streamed in
+            f.write(json.dumps(header)[:-1])
+            f.write(', "projects": [')
+            for i, aggregate in enumerate(aggregates.projects):
+                if i:
+                    f.write(', ')
+                f.write(json.dumps(project_data(aggregate))[:-1])
+                f.write(', "findings": [')
+                for j, finding in enumerate(aggregate.open_findings):
+                    if j:
+                        f.write(', ')
+                    f.write(json.dumps(finding_data(finding)))
+                f.write(']}')
+            f.write(']}\n')
+
+        size_mb = os.path.getsize(output_path) / 1024 / 1024
+        print(f'JSON report generated: {output_path} ({size_mb:.2f} MB)')
+        return output_path
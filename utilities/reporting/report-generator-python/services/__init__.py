@@ -1,5 +1,34 @@
-from .configuration_manager import ConfigurationManager
-from .semgrep_api_client import SemgrepApiClient
-from .scoring_engine import ScoringEngine
+import importlib
 
-__all__ = ['ConfigurationManager', 'SemgrepApiClient', 'ScoringEngine']
+# Imported eagerly: it is light, and binding the shared instance here keeps the submodule of
+# the same name from shadowing it
+from .instrumentation import Instrumentation, instrumentation
+
+# Exported name -> submodule. Submodules are imported on first access (PEP 562), so reading a
+# config doesn't pull in requests for the API client or NumPy for batch scoring.
+_EXPORTS = {
+    'ConfigurationManager': 'configuration_manager',
+    'SemgrepApiClient': 'semgrep_api_client',
+    'ScoringEngine': 'scoring_engine',
+    'OwaspNormalizer': 'owasp_normalizer',
+    'DiskCache': 'disk_cache',
+    'FindingsSnapshot': 'findings_snapshot',
+    'ReportAggregates': 'report_aggregates',
+    'ProjectAggregate': 'report_aggregates',
+    'FindingAggregate': 'report_aggregates',
+    'write_findings_sidecar': 'findings_export',
+}
+
+__all__ = ['Instrumentation', 'instrumentation', *_EXPORTS]
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(f'.{_EXPORTS[name]}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -7,7 +7,8 @@ from models import (
     ApplicationSettings, ReportConfigSettings, IncludeSections,
     SeverityThresholds, BrandingSettings, SemgrepConfiguration,
     RequiredScans, IntegrationSettings, EmailReporting,
-    OrganizationSettings, RepositoryReferenceMapping
+    OrganizationSettings, RepositoryReferenceMapping, ApiSettings,
+    CacheSettings, IncrementalSyncSettings, RenderBudget
 )
 
 
@@ -91,6 +92,14 @@ class ConfigurationManager:
                 external_mapping_file=repo_mapping_raw.get('externalMappingFile'),
             )
 
+        budget_raw = rc.get('renderBudget', {})
+        render_budget = RenderBudget(
+            max_rule_pages_per_project=budget_raw.get('maxRulePagesPerProject'),
+            max_instances_per_rule=budget_raw.get('maxInstancesPerRule', 3),
+            max_owasp_pages_per_category=budget_raw.get('maxOwaspPagesPerCategory'),
+            sidecar_format=budget_raw.get('sidecarFormat'),
+        )
+
         report_config = ReportConfigSettings(
             include_sections=include_sections,
             severity_thresholds=severity_thresholds,
@@ -100,6 +109,7 @@ class ConfigurationManager:
             findings_detail_level=rc.get('findingsDetailLevel', 'standard'),
             include_dashboard_links=rc.get('includeDashboardLinks', True),
             repository_reference_mapping=repo_mapping,
+            render_budget=render_budget,
         )
 
         sc = data.get('semgrepConfiguration', {})
@@ -132,6 +142,28 @@ class ConfigurationManager:
             api_token=org_raw.get('apiToken', ''),
         ) if org_raw else None
 
+        api_raw = data.get('apiSettings', {})
+        cache_raw = api_raw.get('cache', {})
+        sync_raw = api_raw.get('incrementalSync', {})
+        api_settings = ApiSettings(
+            page_concurrency=api_raw.get('pageConcurrency', 4),
+            lookup_concurrency=api_raw.get('lookupConcurrency', 8),
+            scan_coverage_mode=api_raw.get('scanCoverageMode', 'per-repo'),
+            request_timeout_seconds=api_raw.get('requestTimeoutSeconds', 300),
+            max_retries=api_raw.get('maxRetries', 5),
+            cache=CacheSettings(
+                enabled=cache_raw.get('enabled', False),
+                directory=cache_raw.get('directory', './.semgrep-report-cache'),
+                ttl_minutes=cache_raw.get('ttlMinutes', 720),
+                max_size_mb=cache_raw.get('maxSizeMb', 512),
+            ),
+            incremental_sync=IncrementalSyncSettings(
+                enabled=sync_raw.get('enabled', False),
+                directory=sync_raw.get('directory', './.semgrep-report-cache/snapshots'),
+                full_sync_interval_days=sync_raw.get('fullSyncIntervalDays', 7),
+            ),
+        )
+
         return ReportConfiguration(
             customer=customer,
             projects=projects,
@@ -140,6 +172,7 @@ class ConfigurationManager:
             semgrep_configuration=semgrep_config,
             integration_settings=integration_settings,
             organization_settings=org_settings,
+            api_settings=api_settings,
         )
 
     def _validate_configuration(self, config: ReportConfiguration) -> None:
@@ -150,6 +183,24 @@ class ConfigurationManager:
         active = [p for p in config.projects if p.include]
         if not active:
             raise ValueError('At least one project must be configured')
+        if config.api_settings.page_concurrency < 1 or config.api_settings.lookup_concurrency < 1:
+            raise ValueError('apiSettings.pageConcurrency and lookupConcurrency must be at least 1')
+        if config.api_settings.scan_coverage_mode not in ('per-repo', 'sweep'):
+            raise ValueError("apiSettings.scanCoverageMode must be 'per-repo' or 'sweep'")
+        if config.api_settings.request_timeout_seconds <= 0 or config.api_settings.max_retries < 0:
+            raise ValueError('apiSettings.requestTimeoutSeconds must be positive and maxRetries non-negative')
+        cache = config.api_settings.cache
+        if cache.enabled and (cache.ttl_minutes <= 0 or cache.max_size_mb <= 0):
+            raise ValueError('apiSettings.cache.ttlMinutes and maxSizeMb must be positive')
+        sync = config.api_settings.incremental_sync
+        if sync.enabled and sync.full_sync_interval_days <= 0:
+            raise ValueError('apiSettings.incrementalSync.fullSyncIntervalDays must be positive')
+        budget = config.report_configuration.render_budget
+        limits = (budget.max_rule_pages_per_project, budget.max_owasp_pages_per_category)
+        if budget.max_instances_per_rule < 1 or any(n is not None and n < 1 for n in limits):
+            raise ValueError('reportConfiguration.renderBudget limits must be at least 1')
+        if budget.sidecar_format not in (None, 'csv', 'jsonl'):
+            raise ValueError("reportConfiguration.renderBudget.sidecarFormat must be 'csv', 'jsonl' or null")
 
     def get_configuration(self) -> ReportConfiguration:
         return self._config
@@ -168,6 +219,9 @@ class ConfigurationManager:
         )
         return token or os.environ.get('SEMGREP_APP_TOKEN') or None
 
+    def get_api_settings(self) -> ApiSettings:
+        return self._config.api_settings
+
     def get_projects(self) -> List[ProjectSettings]:
         return [p for p in self._config.projects if p.include]
 
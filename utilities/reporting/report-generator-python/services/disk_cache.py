@@ -0,0 +1,99 @@
+import gzip
+import hashlib
+import json
+import os
+import time
+from typing import Any, List, Optional, Tuple
+
+
+class DiskCache:
+    """
+    Persistent cache for Semgrep API responses, keyed by org, endpoint and query.
+
+    Entries are gzipped JSON files. An entry's mtime records when it was written and is
+    used for TTL expiry; its atime is bumped explicitly on every hit and is used to pick
+    least-recently-used entries for eviction once the cache grows past `max_bytes`.
+    """
+
+    SUFFIX = '.json.gz'
+
+    def __init__(self, directory: str, ttl_seconds: float, max_bytes: int, refresh: bool = False):
+        self.directory = os.path.abspath(directory)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.refresh = refresh
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, org: str, endpoint: str, query: Optional[dict]) -> str:
+        raw_key = json.dumps([org, endpoint, query or {}], sort_keys=True)
+        digest = hashlib.sha256(raw_key.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, digest + self.SUFFIX)
+
+    def get(self, org: str, endpoint: str, query: Optional[dict] = None) -> Optional[Any]:
+        if self.refresh:
+            return None
+
+        path = self._path(org, endpoint, query)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+
+        now = time.time()
+        if now - stat.st_mtime > self.ttl_seconds:
+            self._remove(path)
+            return None
+
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                value = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f'Warning: Discarding unreadable cache entry {os.path.basename(path)}: {e}')
+            self._remove(path)
+            return None
+
+        os.utime(path, (now, stat.st_mtime))
+        return value
+
+    def set(self, org: str, endpoint: str, query: Optional[dict], value: Any) -> None:
+        path = self._path(org, endpoint, query)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        try:
+            with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+                json.dump(value, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f'Warning: Could not write cache entry for {endpoint}: {e}')
+            self._remove(tmp_path)
+            return
+        self._evict()
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(self.SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_atime, stat.st_size, path))
+        return entries
+
+    def _evict(self) -> None:
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    def _remove(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
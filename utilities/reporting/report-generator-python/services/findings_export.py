@@ -0,0 +1,46 @@
+import csv
+import json
+from typing import Callable, Optional
+
+from models import SemgrepProject
+from .report_aggregates import ReportAggregates
+
+SIDECAR_FIELDS = [
+    'project', 'project_id', 'finding_id', 'severity', 'rule_id', 'rule_name', 'path', 'line',
+    'owasp_category', 'cwe_id', 'message', 'dashboard_url',
+]
+
+
+def sidecar_path(report_path: str, fmt: str) -> str:
+    base = report_path[:-4] if report_path.lower().endswith('.pdf') else report_path
+    return f'{base}-findings.{fmt}'
+
+
+def write_findings_sidecar(aggregates: ReportAggregates, path: str, fmt: str,
+                           dashboard_url: Optional[Callable[[SemgrepProject], Optional[str]]] = None) -> int:
+    """
+    Writes every open finding in the report to `path` as CSV or JSON lines, one row at a
+    time, so the PDF can cap its detail pages without losing the full listing. Returns the
+    number of rows written.
+    """
+    count = 0
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        if fmt == 'csv':
+            writer = csv.writer(f)
+            writer.writerow(SIDECAR_FIELDS)
+        for aggregate in aggregates.projects:
+            project = aggregate.project
+            url = dashboard_url(project) if dashboard_url else None
+            for finding in aggregate.open_findings:
+                row = [
+                    project.name, project.project_id, finding.id, finding.severity, finding.rule_id,
+                    finding.rule_name, finding.path, finding.start_line, finding.owasp_category,
+                    finding.cwe_id, finding.message, url,
+                ]
+                if fmt == 'csv':
+                    writer.writerow(row)
+                else:
+                    f.write(json.dumps(dict(zip(SIDECAR_FIELDS, row))))
+                    f.write('\n')
+                count += 1
+    return count
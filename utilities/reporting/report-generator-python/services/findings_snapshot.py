@@ -0,0 +1,157 @@
+import gzip
+import json
+import os
+import re
+import threading
+import time
+from typing import Dict, Iterable, Iterator, List, Optional
+
+CLOSED_STATUSES = {'fixed', 'removed', 'ignored', 'closed'}
+
+
+def is_open_finding(finding: dict) -> bool:
+    return (finding.get('status') or 'open').lower() not in CLOSED_STATUSES
+
+
+class FindingsSnapshot:
+    """
+    Local copy of an organization's open findings, used for incremental syncs.
+
+    The findings are stored as gzipped JSON lines next to a small metadata file holding
+    the time of the last successful sync. A sync fetches only findings updated since that
+    time and merges them in: updated findings replace their previous version, and findings
+    that are no longer open are dropped.
+    """
+
+    def __init__(self, directory: str, organization_name: str,
+                 full_sync_interval_seconds: float, refresh: bool = False):
+        self.directory = os.path.abspath(directory)
+        self.full_sync_interval_seconds = full_sync_interval_seconds
+        self.refresh = refresh
+        os.makedirs(self.directory, exist_ok=True)
+
+        safe_name = re.sub(r'[^A-Za-z0-9_.-]', '_', organization_name)
+        self.findings_path = os.path.join(self.directory, f'{safe_name}-findings.jsonl.gz')
+        self.meta_path = os.path.join(self.directory, f'{safe_name}-findings.meta.json')
+
+    def _read_meta(self) -> dict:
+        try:
+            with open(self.meta_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def since(self) -> Optional[float]:
+        """Returns the timestamp to sync from, or None when a full sync is needed."""
+        if self.refresh or not os.path.exists(self.findings_path):
+            return None
+        meta = self._read_meta()
+        synced_at = meta.get('synced_at')
+        full_synced_at = meta.get('full_synced_at', 0)
+        if synced_at is None or time.time() - full_synced_at > self.full_sync_interval_seconds:
+            return None
+        return float(synced_at)
+
+    def iter_findings(self) -> Iterator[dict]:
+        if not os.path.exists(self.findings_path):
+            return
+        with gzip.open(self.findings_path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def replace(self, findings: Iterable[dict], synced_at: float) -> int:
+        """Overwrites the snapshot with the result of a full sync."""
+        replacement = self.begin_replace()
+        replacement.write(findings)
+        return replacement.commit(synced_at)
+
+    def begin_replace(self) -> 'SnapshotReplacement':
+        """Starts a full sync whose findings are written as they arrive rather than all at once."""
+        return SnapshotReplacement(self)
+
+    def merge(self, changed: List[dict], synced_at: float) -> int:
+        """Merges findings updated since the last sync into the snapshot."""
+        changed_ids = {str(f.get('id')) for f in changed}
+
+        def merged() -> Iterator[dict]:
+            for finding in self.iter_findings():
+                if str(finding.get('id')) not in changed_ids:
+                    yield finding
+            for finding in changed:
+                if is_open_finding(finding):
+                    yield finding
+
+        meta = self._read_meta()
+        count = self._write(merged())
+        meta.update({'synced_at': synced_at, 'count': count})
+        self._write_meta(meta)
+        return count
+
+    def _write(self, findings: Iterable[dict]) -> int:
+        tmp_path = f'{self.findings_path}.{os.getpid()}.tmp'
+        count = 0
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            for finding in findings:
+                f.write(json.dumps(finding))
+                f.write('\n')
+                count += 1
+        os.replace(tmp_path, self.findings_path)
+        return count
+
+    def _write_meta(self, meta: dict) -> None:
+        tmp_path = f'{self.meta_path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, self.meta_path)
+
+
+class SnapshotReplacement:
+    """
+    A new snapshot being written by a full sync. `write` and `write_page` may be called from
+    several threads; the existing snapshot is only replaced on `commit`, and `discard`
+    abandons the sync.
+    """
+
+    def __init__(self, snapshot: FindingsSnapshot):
+        self._snapshot = snapshot
+        self._tmp_path = f'{snapshot.findings_path}.{os.getpid()}.{id(self)}.tmp'
+        self._file = gzip.open(self._tmp_path, 'wt', encoding='utf-8')
+        self._lock = threading.Lock()
+        self._pending: Dict[int, List[str]] = {}
+        self._next_page = 0
+        self.count = 0
+
+    def write(self, findings: Iterable[dict]) -> None:
+        lines = [json.dumps(f) + '\n' for f in findings if is_open_finding(f)]
+        with self._lock:
+            self._file.writelines(lines)
+            self.count += len(lines)
+
+    def write_page(self, page: int, findings: Iterable[dict]) -> None:
+        """
+        Writes pages in page order whatever order they arrive in: a page is held until
+        every page before it has been written, so the snapshot lists findings in the
+        order the API returns them.
+        """
+        lines = [json.dumps(f) + '\n' for f in findings if is_open_finding(f)]
+        with self._lock:
+            self._pending[page] = lines
+            while self._next_page in self._pending:
+                lines = self._pending.pop(self._next_page)
+                self._file.writelines(lines)
+                self.count += len(lines)
+                self._next_page += 1
+
+    def commit(self, synced_at: float) -> int:
+        self._file.close()
+        os.replace(self._tmp_path, self._snapshot.findings_path)
+        self._snapshot._write_meta({'synced_at': synced_at, 'full_synced_at': synced_at, 'count': self.count})
+        return self.count
+
+    def discard(self) -> None:
+        self._file.close()
+        try:
+            os.remove(self._tmp_path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,167 @@
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+if TYPE_CHECKING:
+    import requests
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process so far, in MiB (None where unsupported)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+class _Stage:
+    __slots__ = ('name', 'depth', 'record', 'started', 'requests', 'responses')
+
+    def __init__(self, name: str, depth: int, record: dict):
+        self.name = name
+        self.depth = depth
+        self.record = record
+        self.started = time.perf_counter()
+        self.requests = 0
+        self.responses: list = []
+
+
+class Instrumentation:
+    """
+    Records wall time, HTTP request counts, bytes downloaded and peak RSS per pipeline stage.
+
+    Stages nest; requests made while a stage is open (from any thread) count towards it and
+    every enclosing stage. Bytes are read from each response's underlying urllib3 response
+    when the stage closes, so streamed bodies are counted once they have been consumed.
+    A stage opened again under the same parent (e.g. once per project) is folded into the
+    first one's record, which then sums their time, requests and bytes and counts `calls`.
+    Registered caches have their hit rates reported alongside the stages.
+    """
+
+    def __init__(self):
+        self.records: List[dict] = []
+        self._caches: Dict[str, Callable] = {}
+        self._open: List[_Stage] = []
+        # id(parent record) (None at the top level) -> {stage name: record}
+        self._children: Dict[Optional[int], Dict[str, dict]] = {}
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+
+    def attach(self, session: 'requests.Session') -> None:
+        """Counts the requests made through `session`."""
+        session.hooks.setdefault('response', []).append(self._on_response)
+
+    def register_cache(self, name: str, cache_info: Callable) -> None:
+        """Reports the cache behind `cache_info` (a functools.lru_cache's cache_info) in the summary."""
+        self._caches[name] = cache_info
+
+    def _on_response(self, response: 'requests.Response', *args, **kwargs) -> None:
+        with self._lock:
+            for stage in self._open:
+                stage.requests += 1
+                stage.responses.append(response.raw)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        with self._lock:
+            siblings = self._children.setdefault(id(self._open[-1].record) if self._open else None, {})
+            record = siblings.get(name)
+            # A sibling still open (another thread) keeps its own record
+            if record is None or 'seconds' not in record:
+                # Keep records in start order so nested stages follow their parent
+                record = {'name': name, 'depth': len(self._open)}
+                self.records.append(record)
+                siblings[name] = record
+            stage = _Stage(name, len(self._open), record)
+            self._open.append(stage)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._open.remove(stage)
+            measured = self._measure(stage)
+            with self._lock:
+                if 'seconds' in record:
+                    for key in ('seconds', 'requests', 'bytes'):
+                        measured[key] += record[key]
+                    measured['seconds'] = round(measured['seconds'], 4)
+                    measured['calls'] = record['calls'] + 1
+                else:
+                    measured['calls'] = 1
+                record.update(measured)
+
+    def record(self, name: str, seconds: float) -> None:
+        """Adds a stage timed elsewhere (e.g. during ReportLab's layout pass) under the open stage."""
+        with self._lock:
+            self.records.append({'name': name, 'depth': len(self._open), 'seconds': round(seconds, 4),
+                                 'requests': 0, 'bytes': 0, 'peak_rss_mb': self._rss(), 'calls': 1})
+
+    def _measure(self, stage: _Stage) -> dict:
+        downloaded = 0
+        for raw in stage.responses:
+            try:
+                downloaded += raw.tell()
+            except (AttributeError, OSError):
+                pass
+        return {
+            'seconds': round(time.perf_counter() - stage.started, 4),
+            'requests': stage.requests,
+            'bytes': downloaded,
+            'peak_rss_mb': self._rss(),
+        }
+
+    @staticmethod
+    def _rss() -> Optional[float]:
+        rss = peak_rss_mb()
+        return round(rss, 1) if rss is not None else None
+
+    def summary(self) -> dict:
+        return {
+            'total_seconds': round(time.perf_counter() - self._started, 4),
+            'peak_rss_mb': self._rss(),
+            'stages': [r for r in self.records if 'seconds' in r],
+            'caches': self._cache_stats(),
+        }
+
+    def _cache_stats(self) -> List[dict]:
+        stats = []
+        for name, cache_info in self._caches.items():
+            info = cache_info()
+            lookups = info.hits + info.misses
+            stats.append({'name': name, 'hits': info.hits, 'misses': info.misses, 'size': info.currsize,
+                          'max_size': info.maxsize, 'hit_rate': round(info.hits / lookups, 4) if lookups else None})
+        return stats
+
+    def write_json(self, path: str) -> None:
+        with open(path, 'w') as f:
+            json.dump(self.summary(), f, indent=2)
+
+    def print_summary(self) -> None:
+        summary = self.summary()
+        print('\nStage timings:')
+        print(f'  {"Stage":<32} {"Seconds":>8} {"Requests":>8} {"MiB down":>9} {"Peak RSS":>9}')
+        for r in summary['stages']:
+            name = '  ' * r['depth'] + r['name'] + (f' (x{r["calls"]})' if r['calls'] > 1 else '')
+            rss = f'{r["peak_rss_mb"]:.0f} MiB' if r['peak_rss_mb'] is not None else '-'
+            print(f'  {name:<32} {r["seconds"]:>8.2f} {r["requests"]:>8} '
+                  f'{r["bytes"] / 1024 / 1024:>9.2f} {rss:>9}')
+        print(f'  {"total":<32} {summary["total_seconds"]:>8.2f}')
+        caches = [c for c in summary['caches'] if c['hits'] or c['misses']]
+        if caches:
+            print(f'\n  {"Cache":<32} {"Hit rate":>8} {"Hits":>8} {"Misses":>9} {"Size":>9}')
+            for c in caches:
+                print(f'  {c["name"]:<32} {c["hit_rate"]:>8.1%} {c["hits"]:>8} {c["misses"]:>9} '
+                      f'{c["size"]:>4}/{c["max_size"]}')
+
+
+# Process-wide instance used by main.py, the API client and the PDF generator
+instrumentation = Instrumentation()
@@ -0,0 +1,106 @@
+import codecs
+import json
+from typing import Any, Iterable, Iterator, Union
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+
+
+class _Reader:
+    """Text buffer over an iterable of chunks, refilled on demand."""
+
+    def __init__(self, chunks: Iterable[Union[bytes, str]]):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        if self.eof:
+            return False
+        # Drop consumed text so the buffer only holds the value being decoded
+        if self.pos:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        for chunk in self._chunks:
+            text = self._utf8.decode(chunk) if isinstance(chunk, bytes) else chunk
+            if text:
+                self.buf += text
+                return True
+        self.buf += self._utf8.decode(b'', final=True)
+        self.eof = True
+        return False
+
+    def peek(self) -> str:
+        """Skips whitespace and returns the next character ('' at end of input)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f'Malformed JSON: expected {char!r}, found {found!r}')
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decodes the next complete JSON value, reading more input as needed."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self.buf) and not self.eof:
+                self.fill()
+                continue
+            self.pos = end
+            return value
+
+
+def iter_array_items(chunks: Iterable[Union[bytes, str]], key: str) -> Iterator[Any]:
+    """
+    Yields the elements of the array stored under `key` in a top-level JSON object.
+
+    `chunks` is decoded incrementally (e.g. from `Response.iter_content()`), so only the
+    element being yielded is held in memory rather than the whole document. Other members
+    of the object are decoded and discarded. Yields nothing if `key` is absent.
+    """
+    reader = _Reader(chunks)
+    reader.expect('{')
+    while True:
+        char = reader.peek()
+        if char == '}':
+            return
+        if char == ',':
+            reader.pos += 1
+            continue
+
+        name = reader.value()
+        reader.expect(':')
+        if name != key:
+            reader.value()
+            continue
+
+        if reader.peek() == 'n':
+            reader.value()  # null
+            return
+        reader.expect('[')
+        while True:
+            char = reader.peek()
+            if char == ']':
+                return
+            if char == ',':
+                reader.pos += 1
+                continue
+            if char == '':
+                raise ValueError('Malformed JSON: unterminated array')
+            yield reader.value()
@@ -0,0 +1,175 @@
+import re
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Sequence
+
+from .instrumentation import instrumentation
+
+OWASP_TOP10_CATEGORIES = [
+    'OWASP Top Ten 2021 Category A01 - Broken Access Control',
+    'OWASP Top Ten 2021 Category A02 - Cryptographic Failures',
+    'OWASP Top Ten 2021 Category A03 - Injection',
+    'OWASP Top Ten 2021 Category A04 - Insecure Design',
+    'OWASP Top Ten 2021 Category A05 - Security Misconfiguration',
+    'OWASP Top Ten 2021 Category A06 - Vulnerable and Outdated Components',
+    'OWASP Top Ten 2021 Category A07 - Identification and Authentication Failures',
+    'OWASP Top Ten 2021 Category A08 - Software and Data Integrity Failures',
+    'OWASP Top Ten 2021 Category A09 - Security Logging and Monitoring Failures',
+    'OWASP Top Ten 2021 Category A10 - Server-Side Request Forgery (SSRF)',
+]
+UNMAPPED_OWASP = len(OWASP_TOP10_CATEGORIES)
+
+# Keyword in an OWASP tag ("A03:2021 - Injection") -> category slug used on findings
+OWASP_TEXT_CATEGORIES = [
+    ('Broken Access Control', 'broken-access-control'),
+    ('Cryptographic Failures', 'cryptographic-failures'),
+    ('Injection', 'injection'),
+    ('Insecure Design', 'insecure-design'),
+    ('Security Misconfiguration', 'security-misconfiguration'),
+    ('Vulnerable and Outdated Components', 'vulnerable-components'),
+    ('Identification and Authentication Failures', 'identification-authentication-failures'),
+    ('Software and Data Integrity Failures', 'software-data-integrity-failures'),
+    ('Security Logging and Monitoring Failures', 'security-logging-monitoring-failures'),
+    ('Server-Side Request Forgery', 'server-side-request-forgery'),
+]
+
+_CWE_PATTERN = re.compile(r'CWE-(\d+)')
+
+
+def owasp_text_category(text: str) -> str:
+    for keyword, category in OWASP_TEXT_CATEGORIES:
+        if keyword in text:
+            return category
+    return 'security-misconfiguration'
+
+
+def rule_id_owasp_category(rule_id: str) -> Optional[str]:
+    """Category slug guessed from a rule id, for findings without OWASP tags."""
+    if not rule_id:
+        return None
+    rule_lower = rule_id.lower()
+    if 'injection' in rule_lower or 'sqli' in rule_lower:
+        return 'injection'
+    if 'xss' in rule_lower or 'cross-site' in rule_lower:
+        return 'injection'
+    if 'auth' in rule_lower or 'access' in rule_lower:
+        return 'broken-access-control'
+    if 'crypto' in rule_lower or 'hash' in rule_lower:
+        return 'cryptographic-failures'
+    if 'config' in rule_lower or 'hardcode' in rule_lower:
+        return 'security-misconfiguration'
+    if 'component' in rule_lower or 'dependency' in rule_lower:
+        return 'vulnerable-components'
+    if 'log' in rule_lower or 'audit' in rule_lower:
+        return 'security-logging-monitoring-failures'
+    if 'ssrf' in rule_lower or 'redirect' in rule_lower:
+        return 'server-side-request-forgery'
+    return 'security-misconfiguration'
+
+
+def rule_id_cwe(rule_id: Optional[str]) -> Optional[str]:
+    """CWE guessed from a rule id, for findings without CWE tags."""
+    if not rule_id:
+        return None
+    rule_lower = rule_id.lower()
+    if 'injection' in rule_lower:
+        return 'CWE-89'
+    if 'xss' in rule_lower:
+        return 'CWE-79'
+    if 'auth' in rule_lower:
+        return 'CWE-287'
+    if 'crypto' in rule_lower:
+        return 'CWE-327'
+    if 'path' in rule_lower or 'traversal' in rule_lower:
+        return 'CWE-22'
+    if 'hardcode' in rule_lower:
+        return 'CWE-798'
+    return None
+
+
+def top10_category(category: str, rule_id: str) -> Optional[str]:
+    """OWASP_TOP10_CATEGORIES entry for a finding's category and rule id, or None."""
+    category_lower = category.lower()
+    rule_lower = rule_id.lower()
+
+    if 'access' in category_lower or 'authorization' in category_lower or 'authz' in rule_lower:
+        return OWASP_TOP10_CATEGORIES[0]
+    if 'crypto' in category_lower or 'hash' in rule_lower or 'secret' in category_lower or \
+            'weak' in rule_lower or 'encryption' in category_lower:
+        return OWASP_TOP10_CATEGORIES[1]
+    if 'injection' in category_lower or 'sql' in rule_lower or 'command' in rule_lower or \
+            'xss' in category_lower or 'cross-site' in rule_lower:
+        return OWASP_TOP10_CATEGORIES[2]
+    if 'design' in category_lower or 'architecture' in category_lower:
+        return OWASP_TOP10_CATEGORIES[3]
+    if 'config' in category_lower or 'default' in rule_lower or 'misconfiguration' in category_lower:
+        return OWASP_TOP10_CATEGORIES[4]
+    if 'component' in category_lower or 'dependency' in category_lower or 'vulnerable' in category_lower:
+        return OWASP_TOP10_CATEGORIES[5]
+    if 'auth' in category_lower or 'session' in rule_lower or 'authentication' in category_lower:
+        return OWASP_TOP10_CATEGORIES[6]
+    if 'integrity' in category_lower or 'deserialization' in category_lower or 'pipeline' in category_lower:
+        return OWASP_TOP10_CATEGORIES[7]
+    if 'logging' in category_lower or 'monitoring' in category_lower or 'audit' in category_lower:
+        return OWASP_TOP10_CATEGORIES[8]
+    if 'ssrf' in category_lower or 'request-forgery' in rule_lower or 'server-side' in category_lower:
+        return OWASP_TOP10_CATEGORIES[9]
+    return None
+
+
+class OwaspNormalizer:
+    """
+    Maps the OWASP and CWE metadata of findings to the report's categories. Every finding of
+    a rule carries the same tags, so each mapping is memoized in a bounded LRU cache keyed by
+    the raw tag (or the rule id when a finding has no tags). Hit rates are listed with the
+    stage timings.
+    """
+
+    DEFAULT_MAX_ENTRIES = 8192
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self._owasp = lru_cache(maxsize=max_entries)(self._map_owasp)
+        self._cwe = lru_cache(maxsize=max_entries)(self._map_cwe)
+        self._top10 = lru_cache(maxsize=max_entries)(self._map_top10)
+
+    @property
+    def caches(self) -> Dict[str, Callable]:
+        return {'owasp': self._owasp, 'cwe': self._cwe, 'owasp.top10': self._top10}
+
+    def owasp_category(self, owasp_names: Sequence[str], rule_id: str) -> Optional[str]:
+        """Category slug from a finding's first OWASP tag, else guessed from its rule id."""
+        if owasp_names:
+            return self._owasp(owasp_names[0], '')
+        return self._owasp(None, rule_id)
+
+    def cwe_id(self, cwe_names: Sequence[str], rule_id: str) -> Optional[str]:
+        """'CWE-<n>' from a finding's first CWE tag, else guessed from its rule id."""
+        return self._cwe(cwe_names[0] if cwe_names else None, rule_id)
+
+    def top10_code(self, category: str, rule_id: str) -> int:
+        """Index into OWASP_TOP10_CATEGORIES for a finding's category and rule, or UNMAPPED_OWASP."""
+        return self._top10(category, rule_id)
+
+    @staticmethod
+    def _map_owasp(owasp_name: Optional[str], rule_id: str) -> Optional[str]:
+        if owasp_name is not None:
+            return owasp_text_category(owasp_name)
+        return rule_id_owasp_category(rule_id)
+
+    @staticmethod
+    def _map_cwe(cwe_name: Optional[str], rule_id: str) -> Optional[str]:
+        if cwe_name is not None:
+            m = _CWE_PATTERN.search(cwe_name)
+            if m:
+                return f'CWE-{m.group(1)}'
+        return rule_id_cwe(rule_id)
+
+    @staticmethod
+    def _map_top10(category: str, rule_id: str) -> int:
+        mapped = top10_category(category, rule_id)
+        return OWASP_TOP10_CATEGORIES.index(mapped) if mapped else UNMAPPED_OWASP
+
+
+# Process-wide instance shared by the API client and the scoring engine
+normalizer = OwaspNormalizer()
+for _name, _cache in normalizer.caches.items():
+    instrumentation.register_cache(_name, _cache.cache_info)
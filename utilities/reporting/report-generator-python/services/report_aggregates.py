@@ -0,0 +1,197 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from models import SemgrepProject, SemgrepFinding, SemgrepLevel
+from .scoring_engine import ScoringEngine
+
+SEVERITIES = ('Critical', 'High', 'Medium', 'Low')
+SEVERITY_ORDER = {'Critical': 4, 'High': 3, 'Medium': 2, 'Low': 1}
+UNMAPPED = 'unmapped'
+
+OWASP_DISPLAY_NAMES = {
+    'broken-access-control': 'OWASP Top Ten 2021 Category A01 - Broken Access Control',
+    'cryptographic-failures': 'OWASP Top Ten 2021 Category A02 - Cryptographic Failures',
+    'injection': 'OWASP Top Ten 2021 Category A03 - Injection',
+    'insecure-design': 'OWASP Top Ten 2021 Category A04 - Insecure Design',
+    'security-misconfiguration': 'OWASP Top Ten 2021 Category A05 - Security Misconfiguration',
+    'vulnerable-components': 'OWASP Top Ten 2021 Category A06 - Vulnerable and Outdated Components',
+    'identification-authentication-failures': 'OWASP Top Ten 2021 Category A07 - Identification and Authentication Failures',
+    'software-data-integrity-failures': 'OWASP Top Ten 2021 Category A08 - Software and Data Integrity Failures',
+    'security-logging-monitoring-failures': 'OWASP Top Ten 2021 Category A09 - Security Logging and Monitoring Failures',
+    'server-side-request-forgery': 'OWASP Top Ten 2021 Category A10 - Server-Side Request Forgery',
+}
+
+# Canonical OWASP 2021 ordering used for sorting and display
+OWASP_CATEGORY_ORDER = [
+    'broken-access-control',
+    'cryptographic-failures',
+    'injection',
+    'insecure-design',
+    'security-misconfiguration',
+    'vulnerable-components',
+    'identification-authentication-failures',
+    'software-data-integrity-failures',
+    'security-logging-monitoring-failures',
+    'server-side-request-forgery',
+]
+
+
+def group_findings_by_rule(findings: List[SemgrepFinding]) -> List[dict]:
+    """
+    Groups findings by rule in first-seen order, keeping one instance per (path, line).
+    Each group tracks the locations it has seen in a set, so grouping is linear in the
+    number of findings rather than quadratic per rule.
+    """
+    groups: Dict[str, dict] = {}
+    seen_locations: Dict[str, set] = {}
+    for finding in findings:
+        key = finding.rule_id
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = {
+                'rule_id': finding.rule_id,
+                'rule_name': finding.rule_name,
+                'severity': finding.severity,
+                'message': finding.message,
+                'description': finding.description,
+                'owasp_category': finding.owasp_category,
+                'cwe_id': finding.cwe_id,
+                'assistant_recommendation': finding.assistant_recommendation,
+                'instances': [],
+            }
+            seen_locations[key] = set()
+        location = (finding.path, finding.start_line)
+        seen = seen_locations[key]
+        if location not in seen:
+            seen.add(location)
+            group['instances'].append({
+                'id': finding.id,
+                'path': finding.path,
+                'start_line': finding.start_line,
+                'project_id': finding.project_id,
+                'project_name': finding.project_name,
+            })
+    return list(groups.values())
+
+
+@dataclass
+class FindingAggregate:
+    """Open-finding statistics for one project, or for the whole report."""
+    open_count: int = 0
+    severity_counts: Dict[str, int] = field(default_factory=dict)
+    # OWASP category (or UNMAPPED) -> open findings, in first-seen order
+    by_owasp: Dict[str, List[SemgrepFinding]] = field(default_factory=dict)
+    # OWASP category (or UNMAPPED) -> severity -> count
+    owasp_severity_counts: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    score: int = 100
+    level: SemgrepLevel = SemgrepLevel.SL5
+
+    def count(self, severity: str) -> int:
+        return self.severity_counts.get(severity, 0)
+
+    def owasp_categories(self) -> List[str]:
+        """Categories with open findings: canonical A01-A10 order, then UNMAPPED."""
+        categories = [c for c in OWASP_CATEGORY_ORDER if c in self.by_owasp]
+        if UNMAPPED in self.by_owasp:
+            categories.append(UNMAPPED)
+        return categories
+
+    def owasp_breakdown(self) -> List[dict]:
+        """OWASP categories with open finding and Critical/High counts, most Critical+High first."""
+        result = [
+            {'category': category, 'count': len(findings),
+             'critical': self.owasp_severity_counts[category].get('Critical', 0),
+             'high': self.owasp_severity_counts[category].get('High', 0)}
+            for category, findings in self.by_owasp.items() if category != UNMAPPED
+        ]
+        result.sort(key=lambda x: (x['critical'] + x['high']), reverse=True)
+        return result
+
+    def _add(self, finding: SemgrepFinding) -> None:
+        self.open_count += 1
+        self.severity_counts[finding.severity] = self.severity_counts.get(finding.severity, 0) + 1
+        category = finding.owasp_category or UNMAPPED
+        findings = self.by_owasp.get(category)
+        if findings is None:
+            findings = self.by_owasp[category] = []
+            self.owasp_severity_counts[category] = {}
+        findings.append(finding)
+        counts = self.owasp_severity_counts[category]
+        counts[finding.severity] = counts.get(finding.severity, 0) + 1
+
+    def _merge(self, other: 'FindingAggregate') -> None:
+        self.open_count += other.open_count
+        for severity, n in other.severity_counts.items():
+            self.severity_counts[severity] = self.severity_counts.get(severity, 0) + n
+        for category, findings in other.by_owasp.items():
+            if category not in self.by_owasp:
+                self.by_owasp[category] = []
+                self.owasp_severity_counts[category] = {}
+            self.by_owasp[category].extend(findings)
+            counts = self.owasp_severity_counts[category]
+            for severity, n in other.owasp_severity_counts[category].items():
+                counts[severity] = counts.get(severity, 0) + n
+
+    def _score(self, scoring: ScoringEngine) -> None:
+        self.score = scoring.score_from_severity_counts(self.severity_counts)
+        self.level = scoring.level_from_counts(self.count('Critical'), self.count('High'), self.score)
+
+
+@dataclass
+class ProjectAggregate(FindingAggregate):
+    project: Optional[SemgrepProject] = None
+    open_findings: List[SemgrepFinding] = field(default_factory=list)
+    _filtered: Dict[str, List[SemgrepFinding]] = field(default_factory=dict, repr=False)
+    _rule_groups: Dict[str, List[dict]] = field(default_factory=dict, repr=False)
+
+    def open_with_severity(self, severity: str) -> List[SemgrepFinding]:
+        return [f for f in self.open_findings if f.severity == severity]
+
+    def filtered_findings(self, min_severity: str) -> List[SemgrepFinding]:
+        """Open findings at or above `min_severity`; computed on first use."""
+        if min_severity not in self._filtered:
+            min_level = SEVERITY_ORDER.get(min_severity, 2)
+            self._filtered[min_severity] = [
+                f for f in self.open_findings if SEVERITY_ORDER.get(f.severity, 1) >= min_level
+            ]
+        return self._filtered[min_severity]
+
+    def rule_groups(self, min_severity: str) -> List[dict]:
+        """Open findings at or above `min_severity` grouped by rule; computed on first use."""
+        if min_severity not in self._rule_groups:
+            self._rule_groups[min_severity] = group_findings_by_rule(self.filtered_findings(min_severity))
+        return self._rule_groups[min_severity]
+
+
+class ReportAggregates:
+    """
+    Per-project and report-wide open-finding statistics, computed in one pass over every
+    finding before rendering so the report sections don't each re-filter and re-count.
+    Rule groups are the exception: they are built on demand, for the projects that get
+    detail pages.
+    """
+
+    def __init__(self, projects: List[SemgrepProject], scoring: Optional[ScoringEngine] = None):
+        scoring = scoring or ScoringEngine()
+        self.projects: List[ProjectAggregate] = []
+        self.totals = FindingAggregate()
+        self._by_project: Dict[int, ProjectAggregate] = {}
+
+        for project in projects:
+            aggregate = ProjectAggregate(project=project)
+            for finding in project.findings:
+                if finding.status == 'Open':
+                    aggregate.open_findings.append(finding)
+                    aggregate._add(finding)
+            aggregate._score(scoring)
+            self.totals._merge(aggregate)
+            self.projects.append(aggregate)
+            self._by_project[id(project)] = aggregate
+        self.totals._score(scoring)
+
+    def for_project(self, project: SemgrepProject) -> ProjectAggregate:
+        return self._by_project[id(project)]
+
+    @property
+    def projects_with_open_findings(self) -> List[ProjectAggregate]:
+        return [a for a in self.projects if a.open_count]
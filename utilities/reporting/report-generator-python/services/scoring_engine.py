@@ -1,15 +1,98 @@
-from typing import Dict, List, Optional
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
 
 from models import SemgrepProject, SemgrepFinding, SemgrepLevel, BusinessCriticality
+from .owasp_normalizer import OWASP_TOP10_CATEGORIES, UNMAPPED_OWASP, normalizer
+
+SEVERITY_CODES = {'Critical': 0, 'High': 1, 'Medium': 2, 'Low': 3}
+UNKNOWN_SEVERITY = 4
+STATUS_CODES = {'Open': 0, 'Fixed': 1, 'Ignored': 2}
+OTHER_STATUS = 3
+
+
+@lru_cache(maxsize=None)
+def numpy_module():
+    """
+    NumPy, imported on first use of the columnar scoring, or None when it is not installed
+    (batch scoring then falls back to plain Python loops).
+    """
+    try:
+        import numpy
+        return numpy
+    except ImportError:
+        return None
+
+
+@dataclass
+class FindingColumns:
+    """
+    Columnar view of the findings of many projects: one integer per finding in each column.
+    Columns are NumPy arrays when NumPy is installed and `array.array`s otherwise.
+    """
+    severity: Sequence[int]  # SEVERITY_CODES, or UNKNOWN_SEVERITY
+    status: Sequence[int]    # STATUS_CODES, or OTHER_STATUS
+    project: Sequence[int]   # index of the finding's project
+    owasp: Sequence[int]     # index into OWASP_TOP10_CATEGORIES, or UNMAPPED_OWASP
+    project_count: int
+
+    @classmethod
+    def from_projects(cls, projects: List[SemgrepProject],
+                      scoring: Optional['ScoringEngine'] = None) -> 'FindingColumns':
+        scoring = scoring or ScoringEngine()
+        severity, status, project, owasp = array('b'), array('b'), array('i'), array('b')
+        for index, p in enumerate(projects):
+            for finding in p.findings:
+                severity.append(SEVERITY_CODES.get(finding.severity, UNKNOWN_SEVERITY))
+                status.append(STATUS_CODES.get(finding.status, OTHER_STATUS))
+                project.append(index)
+                owasp.append(scoring.owasp_category_code(finding.category, finding.rule_id))
+        np = numpy_module()
+        if np is not None:
+            severity, status, project, owasp = (
+                np.frombuffer(column, dtype=column.typecode) for column in (severity, status, project, owasp)
+            )
+        return cls(severity, status, project, owasp, len(projects))
+
+
+@dataclass
+class BatchScores:
+    """Per-project results of ScoringEngine.score_batch, indexed like the input projects."""
+    scores: List[int]
+    levels: List[SemgrepLevel]
+    critical_counts: List[int]
+    high_counts: List[int]
+    owasp_distributions: List[Dict[str, int]]
 
 
 class ScoringEngine:
+    SEVERITY_WEIGHTS = {'Critical': 50, 'High': 20, 'Medium': 5, 'Low': 1}
+    MAX_IMPACT = 1000
+
     def calculate_semgrep_level(self, project: SemgrepProject) -> SemgrepLevel:
-        findings = project.findings
-        critical_count = sum(1 for f in findings if f.severity == 'Critical' and f.status == 'Open')
-        high_count = sum(1 for f in findings if f.severity == 'High' and f.status == 'Open')
-        score = self.calculate_security_score(findings)
+        counts = self.count_open_by_severity(project.findings)
+        score = self.score_from_severity_counts(counts)
+        return self.level_from_counts(counts.get('Critical', 0), counts.get('High', 0), score)
+
+    def calculate_security_score(self, findings: List[SemgrepFinding]) -> int:
+        return self.score_from_severity_counts(self.count_open_by_severity(findings))
 
+    def count_open_by_severity(self, findings: List[SemgrepFinding]) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for finding in findings:
+            if finding.status == 'Open':
+                counts[finding.severity] = counts.get(finding.severity, 0) + 1
+        return counts
+
+    def score_from_severity_counts(self, counts: Dict[str, int]) -> int:
+        """Security score from open-finding counts per severity (unknown severities weigh as Low)."""
+        low_weight = self.SEVERITY_WEIGHTS['Low']
+        total_impact = sum(self.SEVERITY_WEIGHTS.get(severity, low_weight) * n for severity, n in counts.items())
+        raw_score = max(0, 100 - (total_impact * 100.0 / self.MAX_IMPACT))
+        return round(raw_score)
+
+    def level_from_counts(self, critical_count: int, high_count: int, score: int) -> SemgrepLevel:
         if critical_count == 0 and high_count == 0 and score >= 90:
             return SemgrepLevel.SL5
         if critical_count == 0 and high_count <= 3 and score >= 80:
@@ -20,80 +103,86 @@ class ScoringEngine:
             return SemgrepLevel.SL2
         return SemgrepLevel.SL1
 
-    def calculate_security_score(self, findings: List[SemgrepFinding]) -> int:
-        if not findings:
-            return 100
-
-        open_findings = [f for f in findings if f.status == 'Open']
-        if not open_findings:
-            return 100
-
-        critical_weight = 50
-        high_weight = 20
-        medium_weight = 5
-        low_weight = 1
-
-        total_impact = 0
-        for finding in open_findings:
-            weight = self._get_severity_weight(
-                finding.severity, critical_weight, high_weight, medium_weight, low_weight
-            )
-            total_impact += weight
+    def score_batch(self, columns: FindingColumns) -> BatchScores:
+        """
+        Scores every project in `columns` at once: security score, Semgrep Level, open
+        Critical/High counts and OWASP Top 10 distribution. With NumPy this is a handful of
+        grouped reductions (bincount) over the columns; without it, one loop over them.
 
-        max_impact = 1000
-        raw_score = max(0, 100 - (total_impact * 100.0 / max_impact))
-        return round(raw_score)
+        This is a library API for callers scoring many projects at once; the report pipeline
+        does not use it, as ReportAggregates already counts open findings per severity in its
+        single pass and scores each project from those counts.
+        """
+        n = columns.project_count
+        severity_slots = UNKNOWN_SEVERITY + 1
+        owasp_slots = UNMAPPED_OWASP + 1
+        weights = [self.SEVERITY_WEIGHTS[s] for s in SEVERITY_CODES] + [self.SEVERITY_WEIGHTS['Low']]
 
-    def _get_severity_weight(
-        self, severity: str,
-        critical_weight: int, high_weight: int,
-        medium_weight: int, low_weight: int
-    ) -> int:
-        weights = {
-            'Critical': critical_weight,
-            'High': high_weight,
-            'Medium': medium_weight,
-            'Low': low_weight,
-        }
-        return weights.get(severity, low_weight)
+        np = numpy_module()
+        if np is not None:
+            open_mask = columns.status == STATUS_CODES['Open']
+            project = columns.project[open_mask].astype(np.int64)
+            counts = np.bincount(project * severity_slots + columns.severity[open_mask],
+                                 minlength=n * severity_slots).reshape(n, severity_slots)
+            owasp = np.bincount(project * owasp_slots + columns.owasp[open_mask],
+                                minlength=n * owasp_slots).reshape(n, owasp_slots)
+            impact = counts @ np.array(weights)
+            scores = np.round(np.maximum(0, 100 - impact * 100.0 / self.MAX_IMPACT)).astype(np.int64)
+            critical = counts[:, SEVERITY_CODES['Critical']]
+            high = counts[:, SEVERITY_CODES['High']]
+            levels = np.select(
+                [(critical == 0) & (high == 0) & (scores >= 90),
+                 (critical == 0) & (high <= 3) & (scores >= 80),
+                 (critical == 0) & (high <= 10) & (scores >= 70),
+                 (critical <= 5) & (scores >= 60)],
+                [5, 4, 3, 2], default=1,
+            )
+            critical, high, scores, levels = critical.tolist(), high.tolist(), scores.tolist(), levels.tolist()
+            owasp_rows = owasp.tolist()
+        else:
+            count_rows = [[0] * severity_slots for _ in range(n)]
+            owasp_rows = [[0] * owasp_slots for _ in range(n)]
+            open_code = STATUS_CODES['Open']
+            for sev, status, project, owasp in zip(columns.severity, columns.status,
+                                                  columns.project, columns.owasp):
+                if status == open_code:
+                    count_rows[project][sev] += 1
+                    owasp_rows[project][owasp] += 1
+            scores = [round(max(0, 100 - sum(w * c for w, c in zip(weights, row)) * 100.0 / self.MAX_IMPACT))
+                      for row in count_rows]
+            critical = [row[SEVERITY_CODES['Critical']] for row in count_rows]
+            high = [row[SEVERITY_CODES['High']] for row in count_rows]
+            levels = [int(self.level_from_counts(c, h, s)) for c, h, s in zip(critical, high, scores)]
+
+        return BatchScores(
+            scores=scores,
+            levels=[SemgrepLevel(level) for level in levels],
+            critical_counts=critical,
+            high_counts=high,
+            owasp_distributions=[
+                {OWASP_TOP10_CATEGORIES[code]: count for code, count in enumerate(row[:UNMAPPED_OWASP]) if count}
+                for row in owasp_rows
+            ],
+        )
 
     def get_owasp_top10_distribution(self, findings: List[SemgrepFinding]) -> Dict[str, int]:
         distribution: Dict[str, int] = {}
         for finding in findings:
             if finding.status != 'Open':
                 continue
-            category = self._map_finding_to_owasp_category(finding)
-            if category:
+            code = self.owasp_category_code(finding.category, finding.rule_id)
+            if code != UNMAPPED_OWASP:
+                category = OWASP_TOP10_CATEGORIES[code]
                 distribution[category] = distribution.get(category, 0) + 1
         return distribution
 
+    def owasp_category_code(self, category: str, rule_id: str) -> int:
+        """Index into OWASP_TOP10_CATEGORIES for a finding's category and rule, or UNMAPPED_OWASP."""
+        return normalizer.top10_code(category, rule_id)
+
     def _map_finding_to_owasp_category(self, finding: SemgrepFinding) -> Optional[str]:
-        category_lower = finding.category.lower()
-        rule_lower = finding.rule_id.lower()
-
-        if 'access' in category_lower or 'authorization' in category_lower or 'authz' in rule_lower:
-            return 'OWASP Top Ten 2021 Category A01 - Broken Access Control'
-        if 'crypto' in category_lower or 'hash' in rule_lower or 'secret' in category_lower or \
-                'weak' in rule_lower or 'encryption' in category_lower:
-            return 'OWASP Top Ten 2021 Category A02 - Cryptographic Failures'
-        if 'injection' in category_lower or 'sql' in rule_lower or 'command' in rule_lower or \
-                'xss' in category_lower or 'cross-site' in rule_lower:
-            return 'OWASP Top Ten 2021 Category A03 - Injection'
-        if 'design' in category_lower or 'architecture' in category_lower:
-            return 'OWASP Top Ten 2021 Category A04 - Insecure Design'
-        if 'config' in category_lower or 'default' in rule_lower or 'misconfiguration' in category_lower:
-            return 'OWASP Top Ten 2021 Category A05 - Security Misconfiguration'
-        if 'component' in category_lower or 'dependency' in category_lower or 'vulnerable' in category_lower:
-            return 'OWASP Top Ten 2021 Category A06 - Vulnerable and Outdated Components'
-        if 'auth' in category_lower or 'session' in rule_lower or 'authentication' in category_lower:
-            return 'OWASP Top Ten 2021 Category A07 - Identification and Authentication Failures'
-        if 'integrity' in category_lower or 'deserialization' in category_lower or 'pipeline' in category_lower:
-            return 'OWASP Top Ten 2021 Category A08 - Software and Data Integrity Failures'
-        if 'logging' in category_lower or 'monitoring' in category_lower or 'audit' in category_lower:
-            return 'OWASP Top Ten 2021 Category A09 - Security Logging and Monitoring Failures'
-        if 'ssrf' in category_lower or 'request-forgery' in rule_lower or 'server-side' in category_lower:
-            return 'OWASP Top Ten 2021 Category A10 - Server-Side Request Forgery (SSRF)'
-        return None
+        code = self.owasp_category_code(finding.category, finding.rule_id)
+        return OWASP_TOP10_CATEGORIES[code] if code != UNMAPPED_OWASP else None
 
     def get_business_criticality_description(self, criticality: BusinessCriticality) -> str:
         descriptions = {
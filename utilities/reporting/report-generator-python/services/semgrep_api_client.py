@@ -1,54 +1,134 @@
+import copy
 import os
 import random
-import re
 import string
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from models import (
-    SemgrepProject, SemgrepFinding, ScanMetadata, BusinessCriticality
+    SemgrepProject, SemgrepFinding, ScanMetadata, BusinessCriticality, RuleText
 )
+from .disk_cache import DiskCache
+from .findings_snapshot import FindingsSnapshot
+from .instrumentation import instrumentation
+from .json_stream import iter_array_items
+from .owasp_normalizer import normalizer
 
 
 class SemgrepApiClient:
-    BASE_URL = 'https://semgrep.dev/api/v1'
+    # SEMGREP_BASE_URL points the client at another host, e.g. the offline API stand-in
+    BASE_URL = os.environ.get('SEMGREP_BASE_URL', 'https://semgrep.dev').rstrip('/') + '/api/v1'
+    FINDINGS_PAGE_SIZE = 3000
+    STREAM_CHUNK_SIZE = 64 * 1024
+    DEFAULT_PAGE_CONCURRENCY = 4
+    DEFAULT_LOOKUP_CONCURRENCY = 8
+    SCAN_COVERAGE_DAYS = 30
+    DEFAULT_REQUEST_TIMEOUT = 300  # seconds
+    DEFAULT_MAX_RETRIES = 5
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
 
     # Class-level caches
     _cached_findings: Dict[str, dict] = {}
     _cached_projects: Dict[str, dict] = {}
-    _cached_project_details: Dict[str, dict] = {}
+    # Per-project caches are keyed (organization name, project id)
+    _cached_project_details: Dict[Tuple[str, str], dict] = {}
     _cached_deployment_id: Dict[str, Optional[str]] = {}
-    _cached_scans: Dict[str, List[dict]] = {}
-
-    def __init__(self, organization_name: Optional[str] = None, api_token: Optional[str] = None):
+    _cached_scans: Dict[Tuple[str, str], List[dict]] = {}
+    _cached_coverage: Dict[Tuple[str, str], Dict[str, bool]] = {}
+    _cached_repo_index: Dict[str, dict] = {}
+
+    def __init__(self, organization_name: Optional[str] = None, api_token: Optional[str] = None,
+                 page_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+                 lookup_concurrency: int = DEFAULT_LOOKUP_CONCURRENCY,
+                 scan_coverage_mode: str = 'per-repo',
+                 disk_cache: Optional[DiskCache] = None,
+                 findings_snapshot: Optional[FindingsSnapshot] = None,
+                 request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+                 max_retries: int = DEFAULT_MAX_RETRIES):
         self.organization_name = organization_name or 'sample-org'
         self.api_token = api_token or os.environ.get('SEMGREP_APP_TOKEN')
+        self.page_concurrency = max(1, page_concurrency)
+        self.lookup_concurrency = max(1, lookup_concurrency)
+        self.scan_coverage_mode = scan_coverage_mode
+        self._disk_cache = disk_cache
+        self._findings_snapshot = findings_snapshot
+        # (connect, read) timeout applied to every request
+        self._timeout = (min(30, request_timeout), request_timeout)
 
         self._session = requests.Session()
-        self._session.timeout = 30 * 60  # 30 minutes
+        # Size the connection pool to the largest worker pool so concurrent requests reuse
+        # connections, and retry rate-limited / transient server errors with backoff
+        # (honouring Retry-After on 429s).
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=1,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=None,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        pool_size = max(self.page_concurrency, self.lookup_concurrency)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        instrumentation.attach(self._session)
         if self.api_token:
             self._session.headers.update({
                 'Authorization': f'Bearer {self.api_token}',
                 'Content-Type': 'application/json',
             })
 
+    @classmethod
+    def release_organization(cls, organization_name: str) -> None:
+        """Drops an org's entries from the class-level caches once its reports are done."""
+        for cache in (cls._cached_findings, cls._cached_projects, cls._cached_deployment_id,
+                      cls._cached_repo_index):
+            cache.pop(organization_name, None)
+        for cache in (cls._cached_project_details, cls._cached_scans, cls._cached_coverage):
+            for key in [k for k in cache if k[0] == organization_name]:
+                del cache[key]
+        # The rule text table only deduplicates text between findings; emptying it lets the
+        # released org's strings be freed instead of accumulating across a batch run
+        RuleText.clear()
+
     def _get_org_slug(self, org_name: str) -> str:
         return org_name.replace('-', '_')
 
+    def _load_from_disk_cache(self, endpoint: str, query: Optional[dict] = None):
+        if not self._disk_cache:
+            return None
+        return self._disk_cache.get(self.organization_name, endpoint, query)
+
+    def _save_to_disk_cache(self, endpoint: str, query: Optional[dict], value) -> None:
+        if self._disk_cache:
+            self._disk_cache.set(self.organization_name, endpoint, query, value)
+
     def fetch_project_details(self, project_id: str) -> Optional[dict]:
         if not self.api_token:
             return None
 
-        cache_key = f'{self.organization_name}-{project_id}'
+        cache_key = (self.organization_name, str(project_id))
         if cache_key not in SemgrepApiClient._cached_project_details:
+            cached = self._load_from_disk_cache('repos', {'id': project_id})
+            if cached is not None:
+                SemgrepApiClient._cached_project_details[cache_key] = cached
+                return cached
+
             agent_base = self.BASE_URL.replace('/api/v1', '/api/agent')
             url = f'{agent_base}/deployments/{self._get_org_slug(self.organization_name)}/repos/{project_id}'
             try:
-                resp = self._session.get(url)
+                resp = self._session.get(url, timeout=self._timeout)
                 if resp.status_code == 200:
-                    SemgrepApiClient._cached_project_details[cache_key] = resp.json()
+                    details = resp.json()
+                    SemgrepApiClient._cached_project_details[cache_key] = details
+                    self._save_to_disk_cache('repos', {'id': project_id}, details)
                 else:
                     print(f'Warning: Failed to fetch project details {project_id}: {resp.status_code}')
                     return None
@@ -58,11 +138,26 @@ class SemgrepApiClient:
 
         return SemgrepApiClient._cached_project_details.get(cache_key)
 
+    def fetch_project_details_many(self, project_ids: List[str]) -> Dict[str, Optional[dict]]:
+        """
+        Fetches details for many projects concurrently (up to `lookup_concurrency` requests
+        in flight), filling the project details cache in one pass.
+        """
+        if not self.api_token:
+            return {}
+
+        project_ids = [pid for pid in dict.fromkeys(str(p) for p in project_ids) if pid.isdigit()]
+        with instrumentation.stage('fetch.project_details'), \
+                ThreadPoolExecutor(max_workers=self.lookup_concurrency) as pool:
+            details = dict(zip(project_ids, pool.map(self.fetch_project_details, project_ids)))
+        print(f'Fetched details for {sum(1 for d in details.values() if d)} of {len(project_ids)} projects')
+        return details
+
     def _get_deployment_id(self) -> Optional[str]:
         cache_key = self.organization_name
         if cache_key not in SemgrepApiClient._cached_deployment_id:
             try:
-                resp = self._session.get(f'{self.BASE_URL}/deployments')
+                resp = self._session.get(f'{self.BASE_URL}/deployments', timeout=self._timeout)
                 if resp.status_code == 200:
                     deployments = resp.json().get('deployments', [])
                     dep_id = str(deployments[0]['id']) if deployments else None
@@ -75,52 +170,134 @@ class SemgrepApiClient:
                 SemgrepApiClient._cached_deployment_id[cache_key] = None
         return SemgrepApiClient._cached_deployment_id.get(cache_key)
 
-    def _ensure_scans_cache_populated(self) -> None:
-        pass  # replaced by per-project fetch in get_scan_coverage
+    def _ensure_scans_cache_populated(self, project_ids: List[str]) -> None:
+        """
+        Populates the scans cache for `project_ids` with a single deployment-wide sweep of
+        scans/search instead of one paginated search per repository. Scans are returned
+        newest first, so the sweep stops at the first page that lies entirely outside the
+        coverage window.
+        """
+        missing = [pid for pid in project_ids
+                   if (self.organization_name, str(pid)) not in SemgrepApiClient._cached_scans]
+        if not missing:
+            return
+
+        sweep_query = {'window_days': self.SCAN_COVERAGE_DAYS}
+        scans = self._load_from_disk_cache('scans/search', sweep_query)
+        if scans is None:
+            deployment_id = self._get_deployment_id()
+            if not deployment_id:
+                return
+            cutoff = datetime.now(timezone.utc) - timedelta(days=self.SCAN_COVERAGE_DAYS)
+            scans, complete = self._search_scans(
+                deployment_id, {},
+                stop=lambda page: all(self._scan_completed_before(scan, cutoff) for scan in page),
+            )
+            if complete:
+                self._save_to_disk_cache('scans/search', sweep_query, scans)
+            print(f'Fetched {len(scans)} scans across the deployment')
+
+        scans_by_repo: Dict[str, List[dict]] = {}
+        for scan in scans:
+            scans_by_repo.setdefault(str(scan.get('repository_id')), []).append(scan)
+        for pid in missing:
+            SemgrepApiClient._cached_scans[(self.organization_name, str(pid))] = scans_by_repo.get(str(pid), [])
+
+    def prefetch_scan_coverage(self, project_ids: List[str]) -> None:
+        """
+        Resolves scan coverage for many projects up front so that parsing projects does not
+        issue one scans/search loop per repository. In 'per-repo' mode the searches run
+        concurrently on a thread pool; in 'sweep' mode one deployment-wide search is used.
+        """
+        if not self.api_token:
+            return
+
+        project_ids = [pid for pid in dict.fromkeys(str(p) for p in project_ids) if pid.isdigit()]
+        with instrumentation.stage('fetch.scan_coverage'):
+            if self.scan_coverage_mode == 'sweep':
+                self._ensure_scans_cache_populated(project_ids)
+            else:
+                missing = [pid for pid in project_ids
+                           if (self.organization_name, str(pid)) not in SemgrepApiClient._cached_scans]
+                if missing:
+                    self._get_deployment_id()
+                    with ThreadPoolExecutor(max_workers=self.lookup_concurrency) as pool:
+                        list(pool.map(self._fetch_project_scans, missing))
+
+            for pid in project_ids:
+                self.get_scan_coverage('', pid)
+        print(f'Resolved scan coverage for {len(project_ids)} projects')
 
     def get_scan_coverage(self, repo_name: str, project_id: str) -> Dict[str, bool]:
         """
         Returns which scan types completed in the last 30 days for a repo.
-        Uses the scans/search endpoint with repository_id filter.
+        Uses the scans/search endpoint with repository_id filter, unless the coverage was
+        already resolved by prefetch_scan_coverage.
         """
         if not self.api_token:
             return {'sast': False, 'supply_chain': False, 'secrets': False}
 
-        cache_key = f'{self.organization_name}-{project_id}'
-        if cache_key not in SemgrepApiClient._cached_scans:
+        cache_key = (self.organization_name, str(project_id))
+        if cache_key not in SemgrepApiClient._cached_coverage:
+            scans = self._fetch_project_scans(project_id)
+            SemgrepApiClient._cached_coverage[cache_key] = self._coverage_from_scans(scans)
+        return dict(SemgrepApiClient._cached_coverage[cache_key])
+
+    def _fetch_project_scans(self, project_id: str) -> List[dict]:
+        cache_key = (self.organization_name, str(project_id))
+        if cache_key in SemgrepApiClient._cached_scans:
+            return SemgrepApiClient._cached_scans[cache_key]
+
+        query = {'repository_id': project_id}
+        scans = self._load_from_disk_cache('scans/search', query)
+        if scans is None:
             deployment_id = self._get_deployment_id()
-            if not deployment_id:
-                SemgrepApiClient._cached_scans[cache_key] = []
+            if not deployment_id or not str(project_id).isdigit():
+                scans = []
             else:
-                url = f'{self.BASE_URL}/deployments/{deployment_id}/scans/search'
-                all_scans: List[dict] = []
-                cursor = ''
-
-                while True:
-                    try:
-                        payload: dict = {'pageSize': 100, 'repository_id': int(project_id)}
-                        if cursor:
-                            payload['cursor'] = cursor
-                        resp = self._session.post(url, json=payload)
-                        if resp.status_code != 200:
-                            print(f'Warning: Failed to fetch scans for {project_id}: {resp.status_code} - {resp.text[:200]}')
-                            break
-                        data = resp.json()
-                        all_scans.extend(data.get('scans', []))
-                        if not data.get('hasMore'):
-                            break
-                        cursor = data.get('cursor', '')
-                        if not cursor:
-                            break
-                    except Exception as e:
-                        print(f'Warning: Error fetching scans for {project_id}: {e}')
-                        break
-
-                SemgrepApiClient._cached_scans[cache_key] = all_scans
-                print(f'Fetched {len(all_scans)} scans for project {project_id}')
-
-        scans = SemgrepApiClient._cached_scans.get(cache_key, [])
-        cutoff = datetime.now(timezone.utc) - timedelta(days=30)
+                scans, complete = self._search_scans(deployment_id, {'repository_id': int(project_id)})
+                if complete:
+                    self._save_to_disk_cache('scans/search', query, scans)
+                print(f'Fetched {len(scans)} scans for project {project_id}')
+
+        SemgrepApiClient._cached_scans[cache_key] = scans
+        return scans
+
+    def _search_scans(self, deployment_id: str, filters: dict,
+                      stop: Optional[Callable[[List[dict]], bool]] = None) -> Tuple[List[dict], bool]:
+        """Pages through scans/search. Returns the scans and whether paging finished cleanly."""
+        url = f'{self.BASE_URL}/deployments/{deployment_id}/scans/search'
+        label = f'project {filters["repository_id"]}' if 'repository_id' in filters else 'deployment'
+        all_scans: List[dict] = []
+        cursor = ''
+
+        while True:
+            try:
+                payload: dict = {'pageSize': 100, **filters}
+                if cursor:
+                    payload['cursor'] = cursor
+                resp = self._session.post(url, json=payload, timeout=self._timeout)
+                if resp.status_code != 200:
+                    print(f'Warning: Failed to fetch scans for {label}: {resp.status_code} - {resp.text[:200]}')
+                    return all_scans, False
+                data = resp.json()
+                page_scans = data.get('scans', [])
+                all_scans.extend(page_scans)
+                if not data.get('hasMore') or (stop and page_scans and stop(page_scans)):
+                    return all_scans, True
+                cursor = data.get('cursor', '')
+                if not cursor:
+                    return all_scans, True
+            except Exception as e:
+                print(f'Warning: Error fetching scans for {label}: {e}')
+                return all_scans, False
+
+    def _scan_completed_before(self, scan: dict, cutoff: datetime) -> bool:
+        completed_at = self._parse_datetime(scan.get('completed_at') or scan.get('started_at'))
+        return completed_at is not None and completed_at < cutoff
+
+    def _coverage_from_scans(self, scans: List[dict]) -> Dict[str, bool]:
+        cutoff = datetime.now(timezone.utc) - timedelta(days=self.SCAN_COVERAGE_DAYS)
         sast = False
         supply_chain = False
         secrets = False
@@ -130,11 +307,8 @@ class SemgrepApiClient:
             if 'complete' not in status and status not in ('done', 'success'):
                 continue
 
-            completed_str = scan.get('completed_at') or scan.get('started_at')
-            if completed_str:
-                completed_at = self._parse_datetime(completed_str)
-                if completed_at and completed_at < cutoff:
-                    continue
+            if self._scan_completed_before(scan, cutoff):
+                continue
 
             for product in (scan.get('enabled_products') or []):
                 p = product.lower()
@@ -153,10 +327,27 @@ class SemgrepApiClient:
             return self._create_dummy_project(config_project_id)
 
         try:
-            self._ensure_cache_populated()
-            cached_findings = SemgrepApiClient._cached_findings.get(self.organization_name)
-            cached_projects = SemgrepApiClient._cached_projects.get(self.organization_name)
-            return self._parse_project_from_findings(cached_findings, cached_projects, config_project_id)
+            with instrumentation.stage('fetch.findings'):
+                self._ensure_cache_populated()
+            if config_project_id == 'consolidated-org-report':
+                cached_findings = SemgrepApiClient._cached_findings.get(self.organization_name) or {}
+                all_findings = cached_findings.get('findings', [])
+                print(f'Consolidated Report: Found {len(all_findings)} findings across all repositories')
+                with instrumentation.stage('parse'):
+                    return self._parse_project_from_findings(all_findings, config_project_id, 'All Repositories')
+
+            index = self._get_repo_index()
+            repo_key = index['ids'].get(config_project_id)
+            if repo_key is None:
+                print(f'Warning: Project ID {config_project_id} not found in org projects list. '
+                      f'Check that organizationName in your config matches the org that owns this project.')
+                with instrumentation.stage('parse'):
+                    return self._parse_project_from_findings([], config_project_id, None)
+
+            entry = index['repos'][repo_key]
+            print(f'Project {config_project_id} ({entry["name"]}): Found {len(entry["findings"])} findings')
+            with instrumentation.stage('parse'):
+                return self._parse_project_from_findings(entry['findings'], config_project_id, entry['name'])
         except Exception as e:
             print(f'Error fetching project {config_project_id}: {e}')
             return self._create_dummy_project(config_project_id)
@@ -167,7 +358,8 @@ class SemgrepApiClient:
             return []
 
         try:
-            self._ensure_cache_populated()
+            with instrumentation.stage('fetch.findings'):
+                self._ensure_cache_populated()
             cached_findings = SemgrepApiClient._cached_findings.get(self.organization_name)
             cached_projects = SemgrepApiClient._cached_projects.get(self.organization_name)
 
@@ -175,46 +367,27 @@ class SemgrepApiClient:
                 print('No projects or findings data available')
                 return []
 
-            # Build repo name -> project mapping
-            repo_name_to_project: Dict[str, dict] = {}
-            for project in cached_projects.get('projects', []):
-                if project.get('name') and project.get('id'):
-                    repo_name_to_project[project['name']] = project
-
-            # Group findings by repo name
-            findings_by_repo: Dict[str, list] = {}
-            for finding in cached_findings.get('findings', []):
-                repo_name = finding.get('repository', {}).get('name')
-                if repo_name:
-                    if repo_name not in findings_by_repo:
-                        findings_by_repo[repo_name] = []
-                    findings_by_repo[repo_name].append(finding)
-
-            print(f'Found findings in {len(findings_by_repo)} repositories')
+            index = self._get_repo_index()
+            print(f'Found findings in {sum(1 for e in index["repos"].values() if e["findings"])} repositories')
 
-            projects: List[SemgrepProject] = []
-
-            if repository_mapping:
-                active_repo_ids = set(repository_mapping.values())
+            active_repo_ids = set(repository_mapping.values()) if repository_mapping else None
+            if active_repo_ids is not None:
                 print(f'Processing {len(active_repo_ids)} active repositories from mapping file')
-                for repo_name, repo_findings in findings_by_repo.items():
-                    api_project = repo_name_to_project.get(repo_name)
-                    if api_project and repo_findings:
-                        repo_id = str(api_project.get('id', ''))
-                        if repo_id and repo_id in active_repo_ids:
-                            project = self._parse_project_from_findings(
-                                {'findings': repo_findings}, cached_projects, repo_id
-                            )
-                            projects.append(project)
-            else:
-                for repo_name, repo_findings in findings_by_repo.items():
-                    api_project = repo_name_to_project.get(repo_name)
-                    if api_project and repo_findings:
-                        repo_id = str(api_project.get('id', ''))
-                        project = self._parse_project_from_findings(
-                            {'findings': repo_findings}, cached_projects, repo_id
-                        )
-                        projects.append(project)
+
+            selected = [
+                entry for entry in index['repos'].values()
+                if entry['project_id'] and entry['findings'] and
+                (active_repo_ids is None or entry['project_id'] in active_repo_ids)
+            ]
+
+            selected_ids = [entry['project_id'] for entry in selected]
+            self.fetch_project_details_many(selected_ids)
+            self.prefetch_scan_coverage(selected_ids)
+            with instrumentation.stage('parse'):
+                projects: List[SemgrepProject] = [
+                    self._parse_project_from_findings(entry['findings'], entry['project_id'], entry['name'])
+                    for entry in selected
+                ]
 
             projects.sort(key=lambda p: len(p.findings), reverse=True)
             print(f'Created {len(projects)} individual projects from {len(cached_findings.get("findings", []))} total findings')
@@ -224,61 +397,241 @@ class SemgrepApiClient:
             print(f'Error fetching all projects: {e}')
             return []
 
+    def _get_repo_index(self) -> dict:
+        """
+        Returns the org's repository index, built once per org from the cached projects and
+        converted findings so that per-project lookups don't rescan the whole findings list:
+
+          repos: {lowercase repo name: {'name', 'project_id', 'findings'}}, in first-seen order
+          ids:   {project id: lowercase repo name}
+        """
+        cache_key = self.organization_name
+        if cache_key not in SemgrepApiClient._cached_repo_index:
+            cached_findings = SemgrepApiClient._cached_findings.get(cache_key) or {}
+            cached_projects = SemgrepApiClient._cached_projects.get(cache_key) or {}
+
+            repos: Dict[str, dict] = {}
+            for finding in cached_findings.get('findings', []):
+                if not finding.project_name:
+                    continue
+                repo_key = finding.project_name.lower()
+                entry = repos.get(repo_key)
+                if entry is None:
+                    entry = repos[repo_key] = {'name': finding.project_name, 'project_id': None, 'findings': []}
+                entry['findings'].append(finding)
+
+            ids: Dict[str, str] = {}
+            for project in cached_projects.get('projects') or []:
+                if not project.get('name') or not project.get('id'):
+                    continue
+                repo_key = project['name'].lower()
+                entry = repos.setdefault(repo_key, {'name': project['name'], 'project_id': None, 'findings': []})
+                entry['name'] = project['name']
+                entry['project_id'] = str(project['id'])
+                ids[str(project['id'])] = repo_key
+
+            SemgrepApiClient._cached_repo_index[cache_key] = {'repos': repos, 'ids': ids}
+        return SemgrepApiClient._cached_repo_index[cache_key]
+
     def _ensure_cache_populated(self) -> None:
         cache_key = self.organization_name
-        if cache_key not in SemgrepApiClient._cached_findings:
-            all_findings = []
-            page = 0
-            while True:
-                url = (
-                    f'{self.BASE_URL}/deployments/{self._get_org_slug(self.organization_name)}'
-                    f'/findings?page_size=3000&status=open&page={page}'
-                )
-                try:
-                    resp = self._session.get(url)
-                    if resp.status_code == 200:
-                        data = resp.json()
-                        page_findings = data.get('findings', [])
-                        all_findings.extend(page_findings)
-                        print(f'Fetched page {page}: {len(page_findings)} open findings')
-                        if len(page_findings) < 3000:
-                            break
-                        page += 1
-                    else:
-                        print(f'Warning: Failed to fetch open findings page {page}: {resp.status_code}')
-                        break
-                except Exception as e:
-                    print(f'Warning: Error fetching open findings page {page}: {e}')
-                    break
+        if cache_key not in SemgrepApiClient._cached_projects:
+            SemgrepApiClient._cached_repo_index.pop(cache_key, None)
+            # Findings are attributed to projects as they are converted, so they are
+            # reloaded whenever the projects list is.
+            SemgrepApiClient._cached_findings.pop(cache_key, None)
+            self._populate_projects_cache()
 
+        if cache_key not in SemgrepApiClient._cached_findings:
+            SemgrepApiClient._cached_repo_index.pop(cache_key, None)
+            convert = self._finding_converter()
+            query = {'status': 'open'}
+            if self._findings_snapshot:
+                all_findings = self._sync_findings_snapshot(convert)
+            else:
+                all_findings = self._load_findings_from_disk_cache(query, convert)
+                if all_findings is not None:
+                    print(f'Loaded {len(all_findings)} open findings for '
+                          f'{self.organization_name} from disk cache')
+                else:
+                    on_page = self._save_findings_page if self._disk_cache else None
+                    all_findings, pages, complete = self._fetch_findings(query, convert, on_page)
+                    if complete:
+                        self._save_to_disk_cache('findings', query, {'pages': pages})
+                    print(f'Fetched {len(all_findings)} open findings for {self.organization_name}')
             SemgrepApiClient._cached_findings[cache_key] = {'findings': all_findings}
-            print(f'Fetched {len(all_findings)} open findings for {self.organization_name}')
 
-        if cache_key not in SemgrepApiClient._cached_projects:
-            url = f'{self.BASE_URL}/deployments/{self._get_org_slug(self.organization_name)}/projects'
-            try:
-                resp = self._session.get(url)
-                if resp.status_code == 200:
-                    SemgrepApiClient._cached_projects[cache_key] = resp.json()
-            except Exception as e:
-                print(f'Warning: Could not fetch projects data: {e}')
+    def _populate_projects_cache(self) -> None:
+        cache_key = self.organization_name
+        cached = self._load_from_disk_cache('projects')
+        if cached is not None:
+            SemgrepApiClient._cached_projects[cache_key] = cached
+            return
+
+        url = f'{self.BASE_URL}/deployments/{self._get_org_slug(self.organization_name)}/projects'
+        try:
+            resp = self._session.get(url, timeout=self._timeout)
+            if resp.status_code == 200:
+                SemgrepApiClient._cached_projects[cache_key] = resp.json()
+                self._save_to_disk_cache('projects', None, SemgrepApiClient._cached_projects[cache_key])
+            else:
+                # Cached as missing like the exception path, so later calls don't drop the
+                # findings and re-crawl the org each time
+                print(f'Warning: Could not fetch projects data: {resp.status_code}')
                 SemgrepApiClient._cached_projects[cache_key] = None
+        except Exception as e:
+            print(f'Warning: Could not fetch projects data: {e}')
+            SemgrepApiClient._cached_projects[cache_key] = None
+
+    def _finding_converter(self) -> Callable[[dict], SemgrepFinding]:
+        """
+        Returns a function converting a raw finding to a SemgrepFinding attributed to its
+        repository's project, so findings can be converted as soon as they are decoded.
+        """
+        cached_projects = SemgrepApiClient._cached_projects.get(self.organization_name) or {}
+        projects = {
+            project['name'].lower(): (project['name'], str(project['id']))
+            for project in cached_projects.get('projects') or []
+            if project.get('name') and project.get('id')
+        }
+
+        def convert(raw: dict) -> SemgrepFinding:
+            repo_name = (raw.get('repository') or {}).get('name') or ''
+            project_name, project_id = projects.get(repo_name.lower(), (repo_name, None))
+            return self._convert_finding(raw, project_name, project_id)
+
+        return convert
+
+    def _load_findings_from_disk_cache(self, query: dict,
+                                       convert: Callable[[dict], SemgrepFinding]) -> Optional[List[SemgrepFinding]]:
+        """Loads findings cached page by page, converting one page at a time."""
+        manifest = self._load_from_disk_cache('findings', query)
+        if not isinstance(manifest, dict) or 'pages' not in manifest:
+            return None
+        findings: List[SemgrepFinding] = []
+        for page in range(manifest['pages']):
+            page_findings = self._load_from_disk_cache('findings', {**query, 'page': page})
+            if page_findings is None:
+                return None
+            findings.extend(convert(raw) for raw in page_findings)
+        return findings
+
+    def _save_findings_page(self, page: int, query: dict, raw_findings: List[dict]) -> None:
+        self._save_to_disk_cache('findings', {**query, 'page': page}, raw_findings)
+
+    def _sync_findings_snapshot(self, convert: Callable[[dict], SemgrepFinding]) -> List[SemgrepFinding]:
+        """
+        Brings the local findings snapshot up to date and returns its open findings.
+        Only findings updated since the last sync are fetched; a full crawl is done when
+        there is no usable snapshot yet, or a delta crawl fails part-way. A full crawl is
+        written to the snapshot page by page, in page order, as pages arrive.
+        """
+        snapshot = self._findings_snapshot
+        started_at = time.time()
+        since = snapshot.since()
+
+        if since is not None:
+            changed, _, complete = self._fetch_findings({'since': int(since)})
+            if complete:
+                count = snapshot.merge(changed, started_at)
+                print(f'Incremental sync: {len(changed)} findings changed since last sync, '
+                      f'{count} open findings in snapshot')
+                del changed
+                return [convert(raw) for raw in snapshot.iter_findings()]
+            print('Warning: Incremental sync failed, falling back to a full sync')
+
+        replacement = snapshot.begin_replace()
+        all_findings, _, complete = self._fetch_findings(
+            {'status': 'open'}, convert,
+            on_page=lambda page, query, raw_findings: replacement.write_page(page, raw_findings),
+        )
+        if complete:
+            count = replacement.commit(started_at)
+            print(f'Full sync: stored {count} open findings in snapshot')
+        else:
+            replacement.discard()
+        return all_findings
+
+    def _fetch_findings(self, query: dict, convert: Optional[Callable[[dict], object]] = None,
+                        on_page: Optional[Callable[[int, dict, List[dict]], None]] = None
+                        ) -> Tuple[list, int, bool]:
+        """
+        Fetches every page of findings matching `query` using up to `page_concurrency` requests in flight.
+        Pages are requested ahead in order; once a short (or failed) page is seen no further
+        pages are requested, and any pages beyond it are discarded so the result matches the
+        serial crawl exactly.
+
+        Each page is decoded incrementally and, if `convert` is given, every finding is
+        converted as it is decoded, so raw findings are never held for more than one page.
+        `on_page` receives each page's raw findings (e.g. to persist them) before they are
+        released.
+
+        Returns the (converted) findings, the number of pages, and whether the crawl
+        completed without a failed page.
+        """
+        pages: Dict[int, Optional[list]] = {}
+        last_page: Optional[int] = None
+        next_page = 0
+
+        with ThreadPoolExecutor(max_workers=self.page_concurrency) as pool:
+            in_flight = {}
+            while True:
+                while last_page is None and len(in_flight) < self.page_concurrency:
+                    future = pool.submit(self._fetch_findings_page, next_page, query, convert, on_page)
+                    in_flight[future] = next_page
+                    next_page += 1
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    page = in_flight.pop(future)
+                    page_findings = future.result()
+                    pages[page] = page_findings
+                    if page_findings is None or len(page_findings) < self.FINDINGS_PAGE_SIZE:
+                        if last_page is None or page < last_page:
+                            last_page = page
+
+        page_count = (last_page or 0) + 1
+        all_findings: list = []
+        for page in range(0, page_count):
+            page_findings = pages.pop(page, None)
+            if page_findings is None:
+                return all_findings, page, False
+            all_findings.extend(page_findings)
+        return all_findings, page_count, True
+
+    def _fetch_findings_page(self, page: int, query: dict,
+                             convert: Optional[Callable[[dict], object]] = None,
+                             on_page: Optional[Callable[[int, dict, List[dict]], None]] = None
+                             ) -> Optional[list]:
+        params = urlencode({'page_size': self.FINDINGS_PAGE_SIZE, **query, 'page': page})
+        url = f'{self.BASE_URL}/deployments/{self._get_org_slug(self.organization_name)}/findings?{params}'
+        label = 'open' if query.get('status') == 'open' else 'changed'
+        try:
+            with self._session.get(url, timeout=self._timeout, stream=True) as resp:
+                if resp.status_code != 200:
+                    print(f'Warning: Failed to fetch {label} findings page {page}: {resp.status_code}')
+                    return None
+                raw_findings = iter_array_items(resp.iter_content(self.STREAM_CHUNK_SIZE), 'findings')
+                if on_page:
+                    raw_findings = list(raw_findings)
+                page_findings = [convert(raw) for raw in raw_findings] if convert else list(raw_findings)
+            if on_page:
+                on_page(page, query, raw_findings)
+            print(f'Fetched page {page}: {len(page_findings)} {label} findings')
+            return page_findings
+        except Exception as e:
+            print(f'Warning: Error fetching {label} findings page {page}: {e}')
+            return None
 
     def _parse_project_from_findings(
-        self, findings_data: Optional[dict], projects_data: Optional[dict], config_project_id: str
+        self, findings: List[SemgrepFinding], config_project_id: str, repo_name: Optional[str]
     ) -> SemgrepProject:
-        project_name = f'Project {config_project_id}'
+        project_name = repo_name or f'Project {config_project_id}'
         actual_project_id = config_project_id
-        project_findings: List[SemgrepFinding] = []
         repo_ref_id: Optional[str] = None
 
-        # Build repo name -> project ID map
-        repo_to_id: Dict[str, str] = {}
-        if projects_data and projects_data.get('projects'):
-            for p in projects_data['projects']:
-                if p.get('name') and p.get('id'):
-                    repo_to_id[p['name'].lower()] = str(p['id'])
-
         # Fetch project details for repo_ref
         if config_project_id != 'consolidated-org-report':
             details = self.fetch_project_details(config_project_id)
@@ -288,79 +641,9 @@ class SemgrepApiClient:
                     primary = next((r for r in refs if r.get('isPrimary')), refs[0])
                     repo_ref_id = primary.get('repoRefId')
 
-        if not findings_data or not findings_data.get('findings'):
-            coverage = self.get_scan_coverage(project_name, actual_project_id)
-            return SemgrepProject(
-                name=project_name,
-                repository=project_name,
-                project_id=actual_project_id,
-                repo_ref_id=repo_ref_id,
-                business_criticality=BusinessCriticality.HIGH,
-                last_scanned=datetime.now() - timedelta(hours=random.random() * 48),
-                findings=[],
-                scan_data=ScanMetadata(
-                    sast_completed=coverage['sast'],
-                    supply_chain_completed=coverage['supply_chain'],
-                    secrets_completed=coverage['secrets'],
-                    files_scanned=random.randint(50, 500),
-                    scan_duration=random.randint(2 * 60000, 15 * 60000),
-                    engine_version='1.45.0',
-                )
-            )
-
-        findings_to_process = []
-        target_repo_name = None
-
-        if config_project_id == 'consolidated-org-report':
-            findings_to_process = findings_data['findings']
-            project_name = 'Organization Report'
-            target_repo_name = 'All Repositories'
-            print(f'Consolidated Report: Found {len(findings_to_process)} findings across all repositories')
-        else:
-            if projects_data and projects_data.get('projects'):
-                for p in projects_data['projects']:
-                    if str(p.get('id')) == config_project_id:
-                        target_repo_name = p.get('name')
-                        break
-
-            if target_repo_name:
-                findings_to_process = [
-                    f for f in findings_data['findings']
-                    if f.get('repository', {}).get('name', '').lower() == target_repo_name.lower()
-                ]
-            else:
-                print(f'Warning: Project ID {config_project_id} not found in org projects list. '
-                      f'Check that organizationName in your config matches the org that owns this project.')
-                findings_to_process = []
-            print(f'Project {config_project_id} ({target_repo_name}): Found {len(findings_to_process)} findings')
-
-        if target_repo_name:
-            project_name = target_repo_name
-
-        for raw in findings_to_process:
-            finding = SemgrepFinding(
-                id=str(raw.get('id') or self._generate_id()),
-                rule_id=raw.get('rule', {}).get('name') or raw.get('check_id') or 'unknown-rule',
-                rule_name=raw.get('rule', {}).get('name') or raw.get('check_id') or 'Unknown Rule',
-                path=raw.get('location', {}).get('file_path') or raw.get('path') or 'unknown-path',
-                start_line=raw.get('location', {}).get('line') or raw.get('line') or 1,
-                severity=self._map_severity(raw.get('severity')),
-                message=raw.get('rule_message') or raw.get('message') or 'No message available',
-                description=raw.get('rule', {}).get('message') or raw.get('rule_message') or 'No description available',
-                category=raw.get('rule', {}).get('category') or raw.get('category') or 'security',
-                found_at=self._parse_datetime(raw.get('created_at')) or datetime.now(),
-                status=self._map_status(raw.get('triage_state')),
-                owasp_category=self._extract_owasp(raw),
-                cwe_id=self._extract_cwe(raw),
-                cve_id=self._extract_cve_id(raw.get('rule', {}).get('name') or raw.get('check_id')),
-                exploitability_score=random.randint(1, 5),
-                remediation_effort=random.randint(1, 5),
-                project_name=project_name,
-                project_id=actual_project_id,
-                assistant_recommendation=self._get_recommendation(raw),
-                triage_state=raw.get('triage_state') or 'needs_review',
-            )
-            project_findings.append(finding)
+        project_findings = [
+            self._attribute_finding(finding, project_name, actual_project_id) for finding in findings
+        ]
 
         coverage = self.get_scan_coverage(project_name, actual_project_id)
         return SemgrepProject(
@@ -381,6 +664,40 @@ class SemgrepApiClient:
             )
         )
 
+    @staticmethod
+    def _attribute_finding(finding: SemgrepFinding, project_name: str, project_id: str) -> SemgrepFinding:
+        """Returns the finding attributed to the given project, copying it only if needed."""
+        if finding.project_name == project_name and finding.project_id == project_id:
+            return finding
+        finding = copy.copy(finding)
+        finding.project_name = project_name
+        finding.project_id = project_id
+        return finding
+
+    def _convert_finding(self, raw: dict, project_name: str, project_id: str) -> SemgrepFinding:
+        return SemgrepFinding(
+            id=str(raw.get('id') or self._generate_id()),
+            rule_id=raw.get('rule', {}).get('name') or raw.get('check_id') or 'unknown-rule',
+            rule_name=raw.get('rule', {}).get('name') or raw.get('check_id') or 'Unknown Rule',
+            path=raw.get('location', {}).get('file_path') or raw.get('path') or 'unknown-path',
+            start_line=raw.get('location', {}).get('line') or raw.get('line') or 1,
+            severity=self._map_severity(raw.get('severity')),
+            message=raw.get('rule_message') or raw.get('message') or 'No message available',
+            description=raw.get('rule', {}).get('message') or raw.get('rule_message') or 'No description available',
+            category=raw.get('rule', {}).get('category') or raw.get('category') or 'security',
+            found_at=self._parse_datetime(raw.get('created_at')) or datetime.now(),
+            status=self._map_status(raw.get('triage_state')),
+            owasp_category=self._extract_owasp(raw),
+            cwe_id=self._extract_cwe(raw),
+            cve_id=self._extract_cve_id(raw.get('rule', {}).get('name') or raw.get('check_id')),
+            exploitability_score=random.randint(1, 5),
+            remediation_effort=random.randint(1, 5),
+            project_name=project_name,
+            project_id=project_id,
+            assistant_recommendation=self._get_recommendation(raw),
+            triage_state=raw.get('triage_state') or 'needs_review',
+        )
+
     def _map_severity(self, api_severity: Optional[str]) -> str:
         if not api_severity:
             return 'Medium'
@@ -401,78 +718,12 @@ class SemgrepApiClient:
         }.get(triage_state.lower(), 'Open')
 
     def _extract_owasp(self, finding: dict) -> Optional[str]:
-        owasp_names = finding.get('rule', {}).get('owasp_names', [])
-        if owasp_names:
-            return self._map_owasp_text_to_category(owasp_names[0])
-        rule_id = finding.get('rule', {}).get('name') or finding.get('check_id') or ''
-        return self._map_to_owasp(rule_id)
+        rule = finding.get('rule', {})
+        return normalizer.owasp_category(rule.get('owasp_names'), rule.get('name') or finding.get('check_id') or '')
 
     def _extract_cwe(self, finding: dict) -> Optional[str]:
-        cwe_names = finding.get('rule', {}).get('cwe_names', [])
-        if cwe_names:
-            m = re.search(r'CWE-(\d+)', cwe_names[0])
-            if m:
-                return f'CWE-{m.group(1)}'
-        rule_id = finding.get('rule', {}).get('name') or finding.get('check_id') or ''
-        return self._extract_cwe_id(rule_id)
-
-    def _map_owasp_text_to_category(self, text: str) -> str:
-        mappings = [
-            ('Broken Access Control', 'broken-access-control'),
-            ('Cryptographic Failures', 'cryptographic-failures'),
-            ('Injection', 'injection'),
-            ('Insecure Design', 'insecure-design'),
-            ('Security Misconfiguration', 'security-misconfiguration'),
-            ('Vulnerable and Outdated Components', 'vulnerable-components'),
-            ('Identification and Authentication Failures', 'identification-authentication-failures'),
-            ('Software and Data Integrity Failures', 'software-data-integrity-failures'),
-            ('Security Logging and Monitoring Failures', 'security-logging-monitoring-failures'),
-            ('Server-Side Request Forgery', 'server-side-request-forgery'),
-        ]
-        for keyword, category in mappings:
-            if keyword in text:
-                return category
-        return 'security-misconfiguration'
-
-    def _map_to_owasp(self, rule_id: str) -> Optional[str]:
-        if not rule_id:
-            return None
-        rule_lower = rule_id.lower()
-        if 'injection' in rule_lower or 'sqli' in rule_lower:
-            return 'injection'
-        if 'xss' in rule_lower or 'cross-site' in rule_lower:
-            return 'injection'
-        if 'auth' in rule_lower or 'access' in rule_lower:
-            return 'broken-access-control'
-        if 'crypto' in rule_lower or 'hash' in rule_lower:
-            return 'cryptographic-failures'
-        if 'config' in rule_lower or 'hardcode' in rule_lower:
-            return 'security-misconfiguration'
-        if 'component' in rule_lower or 'dependency' in rule_lower:
-            return 'vulnerable-components'
-        if 'log' in rule_lower or 'audit' in rule_lower:
-            return 'security-logging-monitoring-failures'
-        if 'ssrf' in rule_lower or 'redirect' in rule_lower:
-            return 'server-side-request-forgery'
-        return 'security-misconfiguration'
-
-    def _extract_cwe_id(self, rule_id: Optional[str]) -> Optional[str]:
-        if not rule_id:
-            return None
-        rule_lower = rule_id.lower()
-        if 'injection' in rule_lower:
-            return 'CWE-89'
-        if 'xss' in rule_lower:
-            return 'CWE-79'
-        if 'auth' in rule_lower:
-            return 'CWE-287'
-        if 'crypto' in rule_lower:
-            return 'CWE-327'
-        if 'path' in rule_lower or 'traversal' in rule_lower:
-            return 'CWE-22'
-        if 'hardcode' in rule_lower:
-            return 'CWE-798'
-        return None
+        rule = finding.get('rule', {})
+        return normalizer.cwe_id(rule.get('cwe_names'), rule.get('name') or finding.get('check_id') or '')
 
     def _extract_cve_id(self, rule_id: Optional[str]) -> Optional[str]:
         if not rule_id:
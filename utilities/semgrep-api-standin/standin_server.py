@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Offline stand-in for the Semgrep API endpoints used by the scripts in this repository
+(deployments, projects, findings, scans/search, teams, secrets, supply chain findings and
+dependencies), serving a synthetic organization from synthetic_org.py. It can add latency
+and rate limiting (HTTP 429 with Retry-After) so clients and throughput benchmarks can be
+exercised without network access or an API token.
+
+Usage:
+    python3 standin_server.py --repos 50 --findings-per-repo 200 --port 8765
+    python3 standin_server.py --org org.json --latency-ms 40 --rate-limit-prob 0.05
+
+Point a script at it with SEMGREP_BASE_URL=http://127.0.0.1:8765 (any token is accepted).
+GET /_standin/stats returns request counts; POST /_standin/reset clears them.
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from synthetic_org import add_org_arguments, org_from_args
+
+MAX_PAGE_SIZE = 3000
+
+
+def _epoch(timestamp):
+    return datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S.%fZ").timestamp()
+
+
+class TokenBucket:
+    """Allows `rate` requests per second with bursts of up to `rate` requests."""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+class StandinState:
+    """The served org plus pre-encoded findings, filter results and request counters."""
+
+    def __init__(self, org, latency_ms=0.0, jitter_ms=0.0, rate_limit_prob=0.0, max_rps=None,
+                 retry_after=1, seed=1):
+        self.org = org
+        self.deployment = org["deployment"]
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.rate_limit_prob = rate_limit_prob
+        self.bucket = TokenBucket(max_rps) if max_rps else None
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+
+        self.projects_by_id = {str(p["id"]): p for p in org["projects"]}
+        self.teams_by_id = {t["id"]: t for t in org["teams"]}
+        # Encoding each finding once keeps large pages cheap to serve
+        self.encoded = {kind: [json.dumps(f).encode() for f in org[kind]] for kind in ("findings", "secrets", "sca")}
+        self.updated_epoch = [_epoch(f["updated_at"]) for f in org["findings"]]
+        self.filtered = {}
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.stats = {"requests": 0, "rate_limited": 0, "findings_served": 0, "by_endpoint": {}}
+
+    def count(self, endpoint, findings=0):
+        with self.lock:
+            self.stats["requests"] += 1
+            self.stats["findings_served"] += findings
+            self.stats["by_endpoint"][endpoint] = self.stats["by_endpoint"].get(endpoint, 0) + 1
+
+    def should_throttle(self):
+        with self.lock:
+            limited = self.rate_limit_prob and self.random.random() < self.rate_limit_prob
+            if self.bucket is not None and not self.bucket.take():
+                limited = True
+            if limited:
+                self.stats["rate_limited"] += 1
+            return limited
+
+    def delay(self):
+        with self.lock:
+            jitter = self.random.uniform(0, self.jitter) if self.jitter else 0
+        if self.latency or jitter:
+            time.sleep(self.latency + jitter)
+
+    def matches_deployment(self, ref):
+        return ref in (self.deployment["slug"], self.deployment["name"], str(self.deployment["id"]))
+
+    def finding_indexes(self, query):
+        """Indexes of the findings matching the v1 findings filters, cached per filter set."""
+        key = tuple(sorted((k, v) for k, v in query.items() if k not in ("page", "page_size")))
+        with self.lock:
+            cached = self.filtered.get(key)
+        if cached is not None:
+            return cached
+
+        findings = self.org["findings"]
+        statuses = set(query["status"].split(",")) if query.get("status") else None
+        repos = set(query["repos"].split(",")) if query.get("repos") else None
+        severities = set(query["severities"].split(",")) if query.get("severities") else None
+        confidence = query.get("confidence")
+        since = float(query["since"]) if query.get("since") else None
+        indexes = [
+            i for i, f in enumerate(findings)
+            if (statuses is None or f["status"] in statuses)
+            and (repos is None or f["repository"]["name"] in repos)
+            and (severities is None or f["severity"] in severities)
+            and (confidence is None or f["confidence"] == confidence)
+            and (since is None or self.updated_epoch[i] >= since)
+        ]
+        with self.lock:
+            self.filtered[key] = indexes
+        return indexes
+
+
+def _page(items, query, default_size):
+    page = int(query.get("page", 0))
+    size = min(int(query.get("page_size", default_size)), MAX_PAGE_SIZE)
+    return items[page * size:(page + 1) * size]
+
+
+def _cursor_page(items, cursor, size):
+    start = int(cursor) if cursor else 0
+    end = start + int(size)
+    return items[start:end], (str(end) if end < len(items) else "")
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    state = None  # set by make_server()
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, keep-alive clients wait on
+    # delayed ACKs and every request gains ~40 ms
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body=b"", headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _json(self, obj, status=200):
+        self._send(status, json.dumps(obj).encode())
+
+    def _not_found(self):
+        self._json({"error": f"Not found: {self.command} {self.path}"}, 404)
+
+    def _handle(self, routes):
+        url = urlparse(self.path)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        body = {}
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            try:
+                body = json.loads(self.rfile.read(length) or b"{}")
+            except ValueError:
+                return self._json({"error": "Invalid JSON body"}, 400)
+
+        if url.path.startswith("/_standin/"):
+            return self._standin(url.path)
+        if not self.headers.get("Authorization", "").startswith("Bearer "):
+            return self._json({"error": "Missing bearer token"}, 401)
+
+        for pattern, handler in routes:
+            match = re.fullmatch(pattern, url.path)
+            if match:
+                if self.state.should_throttle():
+                    self.state.count("429")
+                    return self._send(429, b'{"error": "Too many requests"}',
+                                      {"Retry-After": str(self.state.retry_after)})
+                self.state.delay()
+                if "deployment" in match.groupdict() and not self.state.matches_deployment(match["deployment"]):
+                    return self._json({"error": "Deployment not found"}, 404)
+                return handler(self, query=query, body=body, **{k: v for k, v in match.groupdict().items()
+                                                                 if k != "deployment"})
+        self._not_found()
+
+    def do_GET(self):
+        self._handle(GET_ROUTES)
+
+    def do_POST(self):
+        self._handle(POST_ROUTES)
+
+    def _standin(self, path):
+        if path == "/_standin/stats" and self.command == "GET":
+            with self.state.lock:
+                return self._json(self.state.stats)
+        if path == "/_standin/reset" and self.command == "POST":
+            self.state.reset()
+            return self._json({"ok": True})
+        self._not_found()
+
+    # --- GET endpoints ---
+
+    def deployments(self, query, body):
+        self.state.count("deployments")
+        self._json({"deployments": [self.state.deployment]})
+
+    def projects(self, query, body):
+        self.state.count("projects")
+        projects = self.state.org["projects"]
+        if "page" in query or "page_size" in query:
+            projects = _page(projects, query, 100)
+        self._json({"projects": projects})
+
+    def findings(self, query, body):
+        indexes = _page(self.state.finding_indexes(query), query, 100)
+        self.state.count("findings", len(indexes))
+        encoded = self.state.encoded["findings"]
+        self._send(200, b'{"findings": [' + b", ".join(encoded[i] for i in indexes) + b"]}")
+
+    def ssc_vulns(self, query, body):
+        page = _page(self.state.encoded["sca"], query, 100)
+        self.state.count("ssc-vulns", len(page))
+        self._send(200, b'{"findings": [' + b", ".join(page) + b"]}")
+
+    def secrets(self, query, body):
+        page, cursor = _cursor_page(self.state.encoded["secrets"], query.get("cursor"), query.get("limit", 100))
+        self.state.count("secrets", len(page))
+        self._send(200, b'{"findings": [' + b", ".join(page) + b'], "cursor": ' + json.dumps(cursor).encode() + b"}")
+
+    def repo_details(self, query, body, repo_id):
+        self.state.count("repos")
+        project = self.state.projects_by_id.get(repo_id)
+        if project is None:
+            return self._not_found()
+        self._json({"repo": {"id": project["id"], "name": project["name"],
+                             "refs": [{"repoRefId": f"{project['id']}1", "ref": project["primary_branch"],
+                                       "isPrimary": True}]}})
+
+    def team_repos(self, query, body, team_id):
+        self.state.count("teams/repos")
+        team = self.state.teams_by_id.get(team_id)
+        if team is None:
+            return self._not_found()
+        self._json({"repositoryIds": team["repositoryIds"]})
+
+    # --- POST endpoints ---
+
+    def scans_search(self, query, body):
+        self.state.count("scans/search")
+        scans = self.state.org["scans"]
+        if body.get("repository_id") is not None:
+            scans = [s for s in scans if str(s["repository_id"]) == str(body["repository_id"])]
+        page, cursor = _cursor_page(scans, body.get("cursor"), body.get("pageSize", 100))
+        self._json({"scans": page, "cursor": cursor or None, "hasMore": bool(cursor)})
+
+    def teams_list(self, query, body):
+        self.state.count("teams/list")
+        teams = [{k: v for k, v in t.items() if k != "repositoryIds"} for t in self.state.org["teams"]]
+        page, cursor = _cursor_page(teams, body.get("cursor"), body.get("limit", 100))
+        self._json({"teams": page, "cursor": cursor})
+
+    def dependencies(self, query, body):
+        self.state.count("dependencies")
+        page, cursor = _cursor_page(self.state.org["dependencies"], body.get("cursor"), body.get("pageSize", 1000))
+        self._json({"dependencies": page, "cursor": cursor, "hasMore": bool(cursor)})
+
+    def cli_scans(self, query, body):
+        self.state.count("cli/scans")
+        rules = []
+        for rule in self.state.org["rules"]:
+            rules.append({"id": rule["id"], "severity": rule["severity"], "message": rule["message"],
+                          "languages": [rule["language"]], "metadata": rule["metadata"]})
+        self._json({"info": {"id": 1, "enabled_products": ["sast", "sca", "secrets"],
+                             "deployment_id": self.state.deployment["id"],
+                             "deployment_name": self.state.deployment["name"]},
+                    "config": {"rules": {"rules": rules}}})
+
+    def bulk_action(self, query, body):
+        self.state.count("tickets/triage")
+        issue_ids = body.get("issue_ids") or []
+        self._json({"succeeded": [{"issue_ids": issue_ids}], "failed": [], "skipped": []})
+
+
+DEPLOYMENT = r"(?P<deployment>[^/]+)"
+GET_ROUTES = [
+    (r"/api/v1/deployments", StandinHandler.deployments),
+    (rf"/api/v1/deployments/{DEPLOYMENT}/projects", StandinHandler.projects),
+    (rf"/api/v1/deployments/{DEPLOYMENT}/findings", StandinHandler.findings),
+    (rf"/api/v1/deployments/{DEPLOYMENT}/secrets", StandinHandler.secrets),
+    (rf"/api/v1/deployments/{DEPLOYMENT}/ssc-vulns", StandinHandler.ssc_vulns),
+    (rf"/api/agent/deployments/{DEPLOYMENT}/repos/(?P<repo_id>[^/]+)", StandinHandler.repo_details),
+    (rf"/api/permissions/v2/deployments/{DEPLOYMENT}/teams/(?P<team_id>[^/]+)/repos", StandinHandler.team_repos),
+]
+POST_ROUTES = [
+    (rf"/api/v1/deployments/{DEPLOYMENT}/scans/search", StandinHandler.scans_search),
+    (rf"/api/v1/deployments/{DEPLOYMENT}/dependencies", StandinHandler.dependencies),
+    (rf"/api/v1/deployments/{DEPLOYMENT}/(?:tickets|triage)", StandinHandler.bulk_action),
+    (rf"/api/permissions/v2/deployments/{DEPLOYMENT}/teams/list", StandinHandler.teams_list),
+    (r"/api/cli/scans", StandinHandler.cli_scans),
+]
+
+
+def make_server(org, host="127.0.0.1", port=0, **options):
+    """
+    Builds (without starting) a threaded stand-in server for `org`. Port 0 picks a free port;
+    the bound address is in `server.server_address`. `options` are the StandinState settings.
+    """
+    handler = type("BoundStandinHandler", (StandinHandler,), {"state": StandinState(org, **options)})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def start_server(org, host="127.0.0.1", port=0, **options):
+    """
+    Starts the stand-in on a background thread for in-process use (benchmarks, scripts) and
+    returns (server, base_url). Call server.shutdown() when done.
+    """
+    server = make_server(org, host, port, **options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{server.server_address[0]}:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a synthetic Semgrep organization over the Semgrep API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--org", help="Org JSON written by synthetic_org.py (otherwise one is generated)")
+    add_org_arguments(parser)
+    parser.add_argument("--latency-ms", type=float, default=0, help="Added latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Random extra latency, up to this much")
+    parser.add_argument("--rate-limit-prob", type=float, default=0,
+                        help="Probability of answering a request with HTTP 429")
+    parser.add_argument("--max-rps", type=float, default=None,
+                        help="Answer HTTP 429 above this many requests per second")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with a 429")
+    args = parser.parse_args()
+
+    if args.org:
+        with open(args.org) as f:
+            org = json.load(f)
+    else:
+        org = org_from_args(args)
+
+    server = make_server(org, args.host, args.port, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                         rate_limit_prob=args.rate_limit_prob, max_rps=args.max_rps,
+                         retry_after=args.retry_after, seed=args.seed)
+    host, port = server.server_address[:2]
+    print(f"Serving {org['deployment']['name']}: {len(org['projects'])} repositories, "
+          f"{len(org['findings'])} findings", file=sys.stderr)
+    print(f"Export SEMGREP_BASE_URL=http://{host}:{port} to use it", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Builds a synthetic Semgrep organization (deployment, projects, SAST / secrets / supply chain
+findings, dependencies, scans and teams) shaped like the Semgrep v1 API responses, for the
+offline API stand-in in standin_server.py.
+
+Usage:
+    python3 synthetic_org.py --repos 50 --findings-per-repo 200 --rule-skew 1.1 --output org.json
+"""
+
+import argparse
+import json
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+
+ORG_NAME = "synthetic-org"
+
+OWASP_NAMES = [
+    "A01:2021 - Broken Access Control",
+    "A02:2021 - Cryptographic Failures",
+    "A03:2021 - Injection",
+    "A04:2021 - Insecure Design",
+    "A05:2021 - Security Misconfiguration",
+    "A06:2021 - Vulnerable and Outdated Components",
+    "A07:2021 - Identification and Authentication Failures",
+    "A08:2021 - Software and Data Integrity Failures",
+    "A09:2021 - Security Logging and Monitoring Failures",
+    "A10:2021 - Server-Side Request Forgery (SSRF)",
+]
+
+# (rule name fragment, CWE, index into OWASP_NAMES)
+VULN_CLASSES = [
+    ("sqli", "CWE-89: Improper Neutralization of Special Elements used in an SQL Command", 2),
+    ("xss", "CWE-79: Improper Neutralization of Input During Web Page Generation", 2),
+    ("command-injection", "CWE-78: Improper Neutralization of Special Elements used in an OS Command", 2),
+    ("path-traversal", "CWE-22: Improper Limitation of a Pathname to a Restricted Directory", 0),
+    ("missing-authorization", "CWE-862: Missing Authorization", 0),
+    ("weak-hash", "CWE-327: Use of a Broken or Risky Cryptographic Algorithm", 1),
+    ("hardcoded-secret", "CWE-798: Use of Hard-coded Credentials", 6),
+    ("insecure-deserialization", "CWE-502: Deserialization of Untrusted Data", 7),
+    ("debug-enabled", "CWE-489: Active Debug Code", 4),
+    ("ssrf", "CWE-918: Server-Side Request Forgery (SSRF)", 9),
+    ("log-injection", "CWE-117: Improper Output Neutralization for Logs", 8),
+    ("open-redirect", "CWE-601: URL Redirection to Untrusted Site", 0),
+]
+LANGUAGES = [("python", ".py"), ("javascript", ".js"), ("java", ".java"), ("go", ".go")]
+SEVERITIES = ["critical", "high", "medium", "low"]
+SEVERITY_WEIGHTS = [1, 4, 6, 3]
+RULE_SEVERITY = {"critical": "ERROR", "high": "ERROR", "medium": "WARNING", "low": "INFO"}
+# (status, triage_state, weight)
+STATES = [("open", "untriaged", 80), ("open", "reviewing", 5), ("fixed", "untriaged", 10), ("ignored", "ignored", 5)]
+SECRET_TYPES = ["AWS", "GitHub", "Slack", "Stripe", "Generic"]
+ECOSYSTEMS = [("npm", "package-lock.json"), ("pypi", "requirements.txt"), ("maven", "pom.xml"), ("gomod", "go.sum")]
+
+EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def iso(dt):
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def zipf_weights(n, exponent):
+    """Weights 1/k^exponent for k = 1..n; exponent 0 spreads evenly."""
+    return [1.0 / (k ** exponent) for k in range(1, n + 1)]
+
+
+def build_rules(count, rng):
+    rules = []
+    for i in range(count):
+        vuln, cwe, owasp = VULN_CLASSES[i % len(VULN_CLASSES)]
+        language, _ = LANGUAGES[(i // len(VULN_CLASSES)) % len(LANGUAGES)]
+        severity = rng.choices(SEVERITIES, SEVERITY_WEIGHTS)[0]
+        rules.append({
+            "id": f"{language}.lang.security.audit.{vuln}-{i}",
+            "severity": RULE_SEVERITY[severity],
+            "finding_severity": severity,
+            "message": f"Possible {vuln.replace('-', ' ')} in {language} code (rule {i}).",
+            "metadata": {
+                "category": "security",
+                "confidence": rng.choice(["HIGH", "HIGH", "MEDIUM", "LOW"]),
+                "impact": rng.choice(["HIGH", "MEDIUM", "LOW"]),
+                "likelihood": rng.choice(["HIGH", "MEDIUM", "LOW"]),
+                "cwe": [cwe],
+                "owasp": [OWASP_NAMES[owasp]],
+                "subcategory": ["vuln"],
+            },
+            "language": language,
+        })
+    return rules
+
+
+def build_org(repos=20, findings_per_repo=100, rules=200, rule_skew=1.0, repo_skew=0.0,
+              secrets_per_repo=2, dependencies_per_repo=20, scans_per_repo=3, teams=5, seed=1):
+    """
+    Returns the synthetic org as a dict of API-shaped records. `rule_skew` and `repo_skew`
+    are Zipf exponents: 0 spreads findings evenly over rules / repositories, larger values
+    concentrate them on the first few (real orgs are usually around 1).
+    """
+    rng = random.Random(seed)
+    deployment = {"id": 1000, "slug": ORG_NAME.replace("-", "_"), "name": ORG_NAME}
+
+    projects = []
+    for i in range(repos):
+        name = f"{ORG_NAME}/service-{i:04d}"
+        projects.append({
+            "id": 500000 + i,
+            "name": name,
+            "url": f"https://github.com/{name}",
+            "tags": [rng.choice(["backend", "frontend", "platform", "data"])],
+            "created_at": iso(EPOCH - timedelta(days=rng.randint(30, 900))),
+            "latest_scan_at": iso(EPOCH + timedelta(days=120) - timedelta(hours=rng.randint(1, 72))),
+            "primary_branch": "refs/heads/main",
+        })
+
+    rule_defs = build_rules(rules, rng)
+    rule_weights = zipf_weights(len(rule_defs), rule_skew)
+    repo_weights = zipf_weights(repos, repo_skew)
+    total = repos * findings_per_repo
+    repo_of = rng.choices(range(repos), repo_weights, k=total) if repos else []
+    rule_of = rng.choices(range(len(rule_defs)), rule_weights, k=total) if rule_defs else []
+    status_of = rng.choices(STATES, [s[2] for s in STATES], k=total)
+
+    findings = []
+    for i in range(total):
+        project = projects[repo_of[i]]
+        rule = rule_defs[rule_of[i]]
+        status, triage_state, _ = status_of[i]
+        created = EPOCH + timedelta(minutes=rng.randint(0, 120 * 24 * 60))
+        updated = created + timedelta(minutes=rng.randint(0, 7 * 24 * 60))
+        ext = dict(LANGUAGES)[rule["language"]]
+        path = f"src/module_{rng.randint(0, 60)}/file_{rng.randint(0, 40)}{ext}"
+        line = rng.randint(1, 800)
+        findings.append({
+            "id": 10_000_000 + i,
+            "ref": "refs/heads/main",
+            "syntactic_id": f"{rng.getrandbits(128):032x}",
+            "match_based_id": f"{rng.getrandbits(128):032x}",
+            "state": "unresolved" if status == "open" else status,
+            "status": status,
+            "triage_state": triage_state,
+            "severity": rule["finding_severity"],
+            "confidence": rule["metadata"]["confidence"].lower(),
+            "categories": ["security"],
+            "created_at": iso(created),
+            "updated_at": iso(updated),
+            "relevant_since": iso(created),
+            "rule_name": rule["id"],
+            "rule_message": rule["message"],
+            "location": {"file_path": path, "line": line, "column": 5, "end_line": line + 2, "end_column": 20},
+            "repository": {"name": project["name"], "url": project["url"]},
+            "line_of_code_url": f"{project['url']}/blob/main/{path}#L{line}",
+            "rule": {
+                "name": rule["id"],
+                "message": rule["message"],
+                "confidence": rule["metadata"]["confidence"].lower(),
+                "category": "security",
+                "subcategories": ["vuln"],
+                "vulnerability_classes": [rule["id"].rsplit(".", 1)[-1]],
+                "cwe_names": rule["metadata"]["cwe"],
+                "owasp_names": rule["metadata"]["owasp"],
+            },
+            "assistant": {"autofix": None, "guidance": None, "autotriage": None, "component": None},
+        })
+
+    secrets = []
+    for project in projects:
+        for _ in range(secrets_per_repo):
+            kind = rng.choice(SECRET_TYPES)
+            secrets.append({
+                "id": str(20_000_000 + len(secrets)),
+                "type": kind,
+                "rule_name": f"secrets.detected.{kind.lower()}-token",
+                "validationState": rng.choice(["CONFIRMED_VALID", "CONFIRMED_INVALID", "VALIDATION_ERROR"]),
+                "severity": rng.choice(["high", "medium"]),
+                "confidence": "high",
+                "status": "open",
+                "createdAt": iso(EPOCH + timedelta(days=rng.randint(0, 120))),
+                "created_at": iso(EPOCH + timedelta(days=rng.randint(0, 120))),
+                "repository": {"name": project["name"], "url": project["url"]},
+                "findingPathUrl": f"{project['url']}/blob/main/config/settings.env#L{rng.randint(1, 50)}",
+                "line_of_code_url": f"{project['url']}/blob/main/config/settings.env",
+                "assistant": {"autotriage": None, "component": None},
+            })
+
+    dependencies = []
+    sca = []
+    for project in projects:
+        ecosystem, manifest = rng.choice(ECOSYSTEMS)
+        for d in range(dependencies_per_repo):
+            package = f"{ecosystem}-package-{rng.randint(0, 400)}"
+            version = f"{rng.randint(0, 5)}.{rng.randint(0, 20)}.{rng.randint(0, 9)}"
+            dependencies.append({
+                "repositoryId": str(project["id"]),
+                "definedAt": {"path": manifest, "startLine": d + 1, "endLine": d + 1},
+                "transitivity": rng.choice(["DIRECT", "TRANSITIVE"]),
+                "package": {"name": package, "versionSpecifier": version},
+                "ecosystem": ecosystem,
+                "licenses": [rng.choice(["MIT", "Apache-2.0", "BSD-3-Clause", "GPL-3.0"])],
+            })
+            if rng.random() < 0.1:
+                sca.append({
+                    "id": 30_000_000 + len(sca),
+                    "rule_name": f"ssc-{rng.getrandbits(32):08x}",
+                    "severity": rng.choice(SEVERITIES),
+                    "status": "open",
+                    "reachability": rng.choice(["reachable", "unreachable", "conditionally_reachable"]),
+                    "repository": {"name": project["name"], "url": project["url"]},
+                    "location": {"file_path": manifest, "line": d + 1},
+                    "found_dependency": {"package": package, "version": version, "ecosystem": ecosystem},
+                    "vulnerability_identifier": f"CVE-2025-{rng.randint(1000, 99999)}",
+                    "created_at": iso(EPOCH + timedelta(days=rng.randint(0, 120))),
+                })
+
+    scans = []
+    now = datetime.now(timezone.utc)
+    for project in projects:
+        for s in range(scans_per_repo):
+            started = now - timedelta(days=s * 12, minutes=rng.randint(5, 600))
+            scans.append({
+                "id": 40_000_000 + len(scans),
+                "repository_id": project["id"],
+                "branch": "refs/heads/main",
+                "status": "completed",
+                "is_full_scan": s == 0,
+                "enabled_products": rng.sample(["sast", "sca", "secrets"], rng.randint(1, 3)),
+                "started_at": iso(started),
+                "completed_at": iso(started + timedelta(minutes=rng.randint(1, 30))),
+                "total_time": rng.randint(30, 1800),
+            })
+    # scans/search returns the newest first
+    scans.sort(key=lambda scan: scan["started_at"], reverse=True)
+
+    team_records = []
+    for t in range(teams):
+        team_records.append({
+            "id": f"team-{t:03d}",
+            "name": f"Team {t}",
+            "slug": f"team-{t}",
+            "repositoryIds": [str(p["id"]) for i, p in enumerate(projects) if i % teams == t],
+        })
+
+    return {
+        "deployment": deployment,
+        "projects": projects,
+        "rules": [{k: v for k, v in r.items() if k != "finding_severity"} for r in rule_defs],
+        "findings": findings,
+        "secrets": secrets,
+        "sca": sca,
+        "dependencies": dependencies,
+        "scans": scans,
+        "teams": team_records,
+    }
+
+
+def add_org_arguments(parser):
+    """Generator options, shared with standin_server.py."""
+    parser.add_argument("--repos", type=int, default=20, help="Number of repositories (default: 20)")
+    parser.add_argument("--findings-per-repo", type=int, default=100,
+                        help="Average SAST findings per repository (default: 100)")
+    parser.add_argument("--rules", type=int, default=200, help="Number of distinct rules (default: 200)")
+    parser.add_argument("--rule-skew", type=float, default=1.0,
+                        help="Zipf exponent for findings per rule; 0 = uniform (default: 1.0)")
+    parser.add_argument("--repo-skew", type=float, default=0.0,
+                        help="Zipf exponent for findings per repository; 0 = even (default: 0)")
+    parser.add_argument("--teams", type=int, default=5, help="Number of teams (default: 5)")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed (default: 1)")
+
+
+def org_from_args(args):
+    return build_org(repos=args.repos, findings_per_repo=args.findings_per_repo, rules=args.rules,
+                     rule_skew=args.rule_skew, repo_skew=args.repo_skew, teams=args.teams, seed=args.seed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic Semgrep organization as JSON.")
+    add_org_arguments(parser)
+    parser.add_argument("--output", "-o", default="-", help="Output file (default: stdout)")
+    args = parser.parse_args()
+
+    org = org_from_args(args)
+    out = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        json.dump(org, out)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(f"Generated {len(org['projects'])} repositories, {len(org['findings'])} findings, "
+          f"{len(org['secrets'])} secrets, {len(org['dependencies'])} dependencies", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()